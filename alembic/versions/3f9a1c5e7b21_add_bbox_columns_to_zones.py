@@ -0,0 +1,56 @@
+"""add bbox columns to zones
+
+Revision ID: 3f9a1c5e7b21
+Revises: 86a51d36f81d
+Create Date: 2026-10-17 10:14:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c5e7b21'
+down_revision: Union[str, Sequence[str], None] = '86a51d36f81d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('zones', sa.Column('min_lat', sa.Float(), nullable=True))
+    op.add_column('zones', sa.Column('max_lat', sa.Float(), nullable=True))
+    op.add_column('zones', sa.Column('min_lng', sa.Float(), nullable=True))
+    op.add_column('zones', sa.Column('max_lng', sa.Float(), nullable=True))
+
+    # Backfill bbox from the JSON polygon of existing zones
+    op.execute("""
+        UPDATE zones z
+        SET min_lat = b.min_lat,
+            max_lat = b.max_lat,
+            min_lng = b.min_lng,
+            max_lng = b.max_lng
+        FROM (
+            SELECT id,
+                   MIN((p->>'lat')::float) AS min_lat,
+                   MAX((p->>'lat')::float) AS max_lat,
+                   MIN((p->>'lng')::float) AS min_lng,
+                   MAX((p->>'lng')::float) AS max_lng
+            FROM zones, json_array_elements(polygon) AS p
+            GROUP BY id
+        ) b
+        WHERE z.id = b.id;
+    """)
+
+    op.create_index('ix_zones_bbox', 'zones', ['min_lat', 'max_lat', 'min_lng', 'max_lng'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_zones_bbox', table_name='zones')
+    op.drop_column('zones', 'max_lng')
+    op.drop_column('zones', 'min_lng')
+    op.drop_column('zones', 'max_lat')
+    op.drop_column('zones', 'min_lat')
@@ -0,0 +1,74 @@
+"""add postgis geometry to zones
+
+Revision ID: 5c2e8d4a9f13
+Revises: 3f9a1c5e7b21
+Create Date: 2026-10-17 11:02:17.604129
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8d4a9f13'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c5e7b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Optional PostGIS storage for zones
+    - Skipped when the postgis extension is not installed on
+      the server, app keeps using the python geo backend
+    """
+    bind = op.get_bind()
+
+    postgis_available = bind.execute(sa.text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_available_extensions WHERE name = 'postgis'
+        )
+    """)).scalar()
+
+    if not postgis_available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
+
+    op.execute("""
+        ALTER TABLE zones
+        ADD COLUMN IF NOT EXISTS geom geometry(Polygon, 4326);
+    """)
+
+    # Backfill from the JSON polygon (ring closed explicitly)
+    op.execute("""
+        UPDATE zones z
+        SET geom = ST_SetSRID(ST_MakePolygon(ST_AddPoint(l.line, ST_StartPoint(l.line))), 4326)
+        FROM (
+            SELECT id,
+                   ST_MakeLine(
+                       ARRAY(
+                           SELECT ST_MakePoint((p->>'lng')::float, (p->>'lat')::float)
+                           FROM json_array_elements(polygon) WITH ORDINALITY AS t(p, n)
+                           ORDER BY n
+                       )
+                   ) AS line
+            FROM zones
+        ) l
+        WHERE z.id = l.id;
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_zones_geom
+        ON zones USING GIST (geom);
+    """)
+
+
+def downgrade() -> None:
+    """
+    Drop geometry column (extension is left installed)
+    """
+    op.execute("DROP INDEX IF EXISTS ix_zones_geom;")
+    op.execute("ALTER TABLE zones DROP COLUMN IF EXISTS geom;")
@@ -0,0 +1,44 @@
+"""create serviceability tiles table
+
+Revision ID: 7b3e9d1f4c62
+Revises: 5c2e8d4a9f13
+Create Date: 2026-10-17 13:41:08.215736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9d1f4c62'
+down_revision: Union[str, Sequence[str], None] = '5c2e8d4a9f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('serviceability_tiles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('cell_size', sa.Float(), nullable=False),
+    sa.Column('min_lat', sa.Float(), nullable=False),
+    sa.Column('min_lng', sa.Float(), nullable=False),
+    sa.Column('rows', sa.Integer(), nullable=False),
+    sa.Column('cols', sa.Integer(), nullable=False),
+    sa.Column('data', sa.Text(), nullable=False),
+    sa.Column('version', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_serviceability_tiles_id'), 'serviceability_tiles', ['id'], unique=False)
+    op.create_index(op.f('ix_serviceability_tiles_level'), 'serviceability_tiles', ['level'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_serviceability_tiles_level'), table_name='serviceability_tiles')
+    op.drop_index(op.f('ix_serviceability_tiles_id'), table_name='serviceability_tiles')
+    op.drop_table('serviceability_tiles')
@@ -0,0 +1,38 @@
+"""add created_at id index to product variants
+
+Revision ID: a4d8c2e6f195
+Revises: 7b3e9d1f4c62
+Create Date: 2026-10-17 14:26:39.580214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8c2e6f195'
+down_revision: Union[str, Sequence[str], None] = '7b3e9d1f4c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_product_variants_live_created_at_id',
+        'product_variants',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_delete = false AND is_active = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_product_variants_live_created_at_id',
+        table_name='product_variants',
+        postgresql_where=sa.text('is_delete = false AND is_active = true')
+    )
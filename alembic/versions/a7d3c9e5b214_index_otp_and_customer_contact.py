@@ -0,0 +1,36 @@
+"""index otp and customer contact
+
+Revision ID: a7d3c9e5b214
+Revises: f1c9d7e3a562
+Create Date: 2026-10-17 21:05:33.618240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3c9e5b214'
+down_revision: Union[str, Sequence[str], None] = 'f1c9d7e3a562'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    OTP / customer lookups by mobile number
+    - mobile_otp (mobile, expires_at) replaces the mobile-only index
+    - customers.contact (sign-in / register customer lookup)
+    """
+    op.create_index('ix_mobile_otp_mobile_expires_at', 'mobile_otp', ['mobile', 'expires_at'], unique=False)
+    op.drop_index(op.f('ix_mobile_otp_mobile'), table_name='mobile_otp')
+    op.create_index(op.f('ix_customers_contact'), 'customers', ['contact'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_customers_contact'), table_name='customers')
+    op.create_index(op.f('ix_mobile_otp_mobile'), 'mobile_otp', ['mobile'], unique=False)
+    op.drop_index('ix_mobile_otp_mobile_expires_at', table_name='mobile_otp')
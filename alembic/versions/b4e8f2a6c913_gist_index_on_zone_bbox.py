@@ -0,0 +1,37 @@
+"""gist index on zone bbox
+
+Revision ID: b4e8f2a6c913
+Revises: a7d3c9e5b214
+Create Date: 2026-10-17 22:14:07.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8f2a6c913'
+down_revision: Union[str, Sequence[str], None] = 'a7d3c9e5b214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.zone.lat_lng_box
+ZONE_BBOX_BOX = "box(point(min_lat, min_lng), point(max_lat, max_lng))"
+
+
+def upgrade() -> None:
+    """
+    Zone bbox prefilter as a GiST index on box(...)
+    - The composite B-tree only narrowed on min_lat
+    """
+    op.drop_index('ix_zones_bbox', table_name='zones')
+    op.create_index('ix_zones_bbox', 'zones', [sa.text(ZONE_BBOX_BOX)], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_zones_bbox', table_name='zones', postgresql_using='gist')
+    op.create_index('ix_zones_bbox', 'zones', ['min_lat', 'max_lat', 'min_lng', 'max_lng'], unique=False)
@@ -0,0 +1,77 @@
+"""add trigram search indexes
+
+Revision ID: c3f7a9e2d184
+Revises: a4d8c2e6f195
+Create Date: 2026-10-17 16:12:48.307215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7a9e2d184'
+down_revision: Union[str, Sequence[str], None] = 'a4d8c2e6f195'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs searched by app.core.search.apply_trigram_search
+TRIGRAM_COLUMNS = [
+    ('products', 'product_name'),
+    ('products', 'product_short_name'),
+    ('categories', 'category_name'),
+    ('sub_categories', 'sub_category_name'),
+    ('main_categories', 'main_category_name'),
+    ('zones', 'zone_name'),
+    ('zones', 'city'),
+    ('zones', 'state'),
+    ('uoms', 'uom_name'),
+    ('uoms', 'uom_code'),
+    ('uoms', 'uom_short_name'),
+    ('uoms', 'description'),
+    ('users', 'name'),
+    ('users', 'email'),
+    ('users', 'contact'),
+    ('coupon_codes', 'coupon_code'),
+    ('coupon_codes', 'coupon_type'),
+]
+
+
+def upgrade() -> None:
+    """
+    GIN trigram indexes for the `%` search operator
+    - Skipped when the pg_trgm extension is not available on
+      the server (search itself needs it)
+    """
+    bind = op.get_bind()
+
+    trgm_available = bind.execute(sa.text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+        )
+    """)).scalar()
+
+    if not trgm_available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # Left behind by an earlier manual index, replaced below
+    op.execute("DROP INDEX IF EXISTS product_name_trgm_idx;")
+
+    for table, column in TRIGRAM_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+            f"ON {table} USING gin ({column} gin_trgm_ops);"
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop trigram indexes (extension is left installed)
+    """
+    for table, column in TRIGRAM_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm;")
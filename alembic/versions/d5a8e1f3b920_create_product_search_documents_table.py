@@ -0,0 +1,82 @@
+"""create product search documents table
+
+Revision ID: d5a8e1f3b920
+Revises: c3f7a9e2d184
+Create Date: 2026-10-17 17:05:31.842690
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8e1f3b920'
+down_revision: Union[str, Sequence[str], None] = 'c3f7a9e2d184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Denormalised product search documents
+    - Backfilled from products / categories / sub_categories
+    - Trigram index skipped when pg_trgm is not available
+    """
+    op.create_table('product_search_documents',
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('product_name', sa.String(length=255), nullable=False),
+    sa.Column('product_short_name', sa.String(length=255), nullable=False),
+    sa.Column('category_name', sa.String(length=255), nullable=True),
+    sa.Column('sub_category_name', sa.String(length=255), nullable=True),
+    sa.Column('search_text', sa.Text(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_delete', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('product_id')
+    )
+
+    op.execute("""
+        INSERT INTO product_search_documents (
+            product_id, product_name, product_short_name, category_name,
+            sub_category_name, search_text, is_active, is_delete
+        )
+        SELECT p.id,
+               p.product_name,
+               p.product_short_name,
+               c.category_name,
+               s.sub_category_name,
+               concat_ws(' ', p.product_name, p.product_short_name, c.category_name, s.sub_category_name),
+               coalesce(p.is_active, true),
+               coalesce(p.is_delete, false)
+        FROM products p
+        LEFT JOIN categories c ON c.id = p.category_id
+        LEFT JOIN sub_categories s ON s.id = p.sub_category_id;
+    """)
+
+    bind = op.get_bind()
+
+    trgm_available = bind.execute(sa.text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+        )
+    """)).scalar()
+
+    if trgm_available:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        op.create_index(
+            'ix_product_search_documents_search_text_trgm',
+            'product_search_documents',
+            ['search_text'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_product_search_documents_search_text_trgm;")
+    op.drop_table('product_search_documents')
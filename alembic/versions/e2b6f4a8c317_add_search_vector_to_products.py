@@ -0,0 +1,55 @@
+"""add search vector to products
+
+Revision ID: e2b6f4a8c317
+Revises: d5a8e1f3b920
+Create Date: 2026-10-17 18:42:10.517305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6f4a8c317'
+down_revision: Union[str, Sequence[str], None] = 'd5a8e1f3b920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.product.PRODUCT_SEARCH_VECTOR
+PRODUCT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(product_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(product_short_name, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(short_description, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(long_description, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    """
+    Stored generated tsvector for full-text product search
+    - Postgres computes it for existing rows (table rewrite) and
+      keeps it current on every insert / update
+    """
+    op.add_column('products', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(PRODUCT_SEARCH_VECTOR, persisted=True),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_products_search_vector',
+        'products',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_search_vector', table_name='products', postgresql_using='gin')
+    op.drop_column('products', 'search_vector')
@@ -0,0 +1,86 @@
+"""key token blacklist by jti
+
+Revision ID: f1c9d7e3a562
+Revises: e2b6f4a8c317
+Create Date: 2026-10-17 19:36:48.204117
+
+"""
+from datetime import datetime, timedelta, timezone
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from jose import jwt, JWTError
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c9d7e3a562'
+down_revision: Union[str, Sequence[str], None] = 'e2b6f4a8c317'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Longest token lifetime (app.core.security.REFRESH_TOKEN_EXPIRE_DAYS),
+# used for stored tokens whose exp can not be read
+LEGACY_TOKEN_LIFETIME = timedelta(days=7)
+
+
+def upgrade() -> None:
+    """
+    Revoked tokens keyed by jti + expiry instead of the raw token
+    - Existing rows: jti claim, or sha256 of the token (tokens
+      issued before jti), expires_at from the exp claim
+    - Already expired rows are dropped
+    """
+    op.add_column('token_blacklist', sa.Column('jti', sa.String(length=64), nullable=True))
+    op.add_column('token_blacklist', sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, token, created_at FROM token_blacklist")).fetchall()
+
+    for row in rows:
+        try:
+            claims = jwt.get_unverified_claims(row.token)
+        except JWTError:
+            claims = {}
+
+        jti = claims.get("jti") or hashlib.sha256(row.token.encode("utf-8")).hexdigest()
+
+        if claims.get("exp"):
+            expires_at = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+        else:
+            expires_at = (row.created_at or datetime.now(timezone.utc)) + LEGACY_TOKEN_LIFETIME
+
+        bind.execute(
+            sa.text("UPDATE token_blacklist SET jti = :jti, expires_at = :expires_at WHERE id = :id"),
+            {"jti": jti, "expires_at": expires_at, "id": row.id}
+        )
+
+    op.execute("DELETE FROM token_blacklist WHERE expires_at < now()")
+
+    op.alter_column('token_blacklist', 'jti', nullable=False)
+    op.alter_column('token_blacklist', 'expires_at', nullable=False)
+    op.create_unique_constraint('token_blacklist_jti_key', 'token_blacklist', ['jti'])
+    op.create_index(op.f('ix_token_blacklist_expires_at'), 'token_blacklist', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_token_blacklist_created_at'), 'token_blacklist', ['created_at'], unique=False)
+
+    op.drop_constraint('token_blacklist_token_key', 'token_blacklist', type_='unique')
+    op.drop_column('token_blacklist', 'token')
+
+
+def downgrade() -> None:
+    """
+    Downgrade schema
+    Raw tokens are not recoverable: revocations stop matching
+    """
+    op.add_column('token_blacklist', sa.Column('token', sa.String(length=500), nullable=True))
+    op.execute("UPDATE token_blacklist SET token = jti")
+    op.alter_column('token_blacklist', 'token', nullable=False)
+    op.create_unique_constraint('token_blacklist_token_key', 'token_blacklist', ['token'])
+
+    op.drop_index(op.f('ix_token_blacklist_created_at'), table_name='token_blacklist')
+    op.drop_index(op.f('ix_token_blacklist_expires_at'), table_name='token_blacklist')
+    op.drop_constraint('token_blacklist_jti_key', 'token_blacklist', type_='unique')
+    op.drop_column('token_blacklist', 'expires_at')
+    op.drop_column('token_blacklist', 'jti')
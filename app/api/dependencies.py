@@ -11,14 +11,14 @@ def get_db():
 
 
 from fastapi import Depends, Header
-from jose import jwt, JWTError
+from jose import JWTError
 from sqlalchemy.orm import Session
 
-from app.core.security import SECRET_KEY, ALGORITHM
+from app.core.security import decode_token, token_id
 from app.core.exceptions import AppException
-from app.models.user import User
 from app.api.dependencies import get_db
-from app.models.token_blacklist import TokenBlacklist
+from app.services.token_revocation_service import is_token_revoked
+from app.services.principal_service import get_principal
 
 
 def get_current_user(
@@ -31,25 +31,19 @@ def get_current_user(
 
     token = authorization.split(" ")[1]
 
-    # ❌ BLOCK LOGGED-OUT TOKENS
-    blacklisted = db.query(TokenBlacklist).filter(
-            TokenBlacklist.token == token
-        ).first()
-    if blacklisted:
-        raise AppException(status=401, message="Token expired. Please login again")
-
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         user_id = payload.get("user_id")
 
     except JWTError:
         raise AppException(status=401, message="Token expired or invalid")
 
-    user = db.query(User).filter(
-        User.id == user_id,
-        User.is_active == True,
-        User.is_delete == False
-    ).first()
+    # ❌ BLOCK LOGGED-OUT TOKENS (in-memory revocation store, no query)
+    if is_token_revoked(db, token_id(token, payload)):
+        raise AppException(status=401, message="Token expired. Please login again")
+
+    # Active user (short-TTL principal cache, see principal_service)
+    user = get_principal(db, user_id)
 
     if not user:
         raise AppException(status=401, message="User not authorized")
@@ -19,7 +19,9 @@ from app.api.v1.admin.routes import (
     slider,
     coupon_code,
     site_cms,
-    system_settings
+    system_settings,
+    cache,
+    metrics
 )
 
 # -------------------------
@@ -76,4 +78,10 @@ router.include_router(site_cms.router, prefix="/site_cms", tags=["Site CMS"])
 # SYSTEM SETTINGS ROUTES
 router.include_router(system_settings.router, prefix="/system_settings")
 
+# CACHE STATS ROUTES
+router.include_router(cache.router, prefix="/cache")
+
+# METRICS ROUTES
+router.include_router(metrics.router, prefix="/metrics")
+
 
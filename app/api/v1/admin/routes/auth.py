@@ -5,7 +5,7 @@ from app.api.dependencies import get_current_user,get_db
 from app.schemas.auth import LoginRequest, LoginResponse, RefreshTokenRequest
 from app.schemas.response import APIResponse
 from app.services.auth_service import login_user, refresh_access_token
-from app.models.token_blacklist import TokenBlacklist
+from app.services.token_revocation_service import revoke_tokens
 
 router = APIRouter()
 
@@ -14,8 +14,8 @@ router = APIRouter()
 # login for admin user
 # -------------------------------
 @router.post("/login", response_model=APIResponse[LoginResponse])
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    data = login_user(db, payload.email, payload.password)
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    data = await login_user(db, payload.email, payload.password)
     return {
         "status": 200,
         "message": "Login successful",
@@ -51,17 +51,7 @@ def logout(
 ):
     access_token = authorization.split(" ")[1]
 
-    tokens = [access_token, refresh_token]
-
-    for token in tokens:
-        exists = db.query(TokenBlacklist).filter(
-            TokenBlacklist.token == token
-        ).first()
-
-        if not exists:
-            db.add(TokenBlacklist(token=token))
-
-    db.commit()
+    revoke_tokens(db, [access_token, refresh_token])
 
     return {
         "status": 200,
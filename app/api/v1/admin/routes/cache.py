@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from typing import List
+
+from app.api.dependencies import get_current_user
+from app.core.cache import cache_stats
+from app.models.user import User
+from app.schemas.cache import CacheStatsResponse
+from app.schemas.response import APIResponse
+
+
+router = APIRouter(tags=["Cache"])
+
+
+# -------------------------------------------------
+# CACHE STATS
+# -------------------------------------------------
+# - Size / hit / miss / eviction counters of every
+#   process-local cache (search results, list totals, ...)
+# - Counters are per worker process
+# -------------------------------------------------
+@router.get("/stats", response_model=APIResponse[List[CacheStatsResponse]])
+def get_cache_stats(
+    user: User = Depends(get_current_user)
+):
+    return {
+        "status": 200,
+        "message": "Cache stats fetched successfully",
+        "data": cache_stats()
+    }
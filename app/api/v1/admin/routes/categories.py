@@ -2,13 +2,13 @@ from fastapi import APIRouter, Depends, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
 from fastapi import Request,Query
-import math
 from app.api.dependencies import get_db,get_current_user
 from app.schemas.category import CategoryCreate, CategoryResponse,CategoryUpdate,MainCategoryDropdownResponse
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.category_service import create_category,soft_delete_category,update_category,list_categories,get_main_category_dropdown,search_categories
 from app.models.user import User
 from app.models.category import Category
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -61,14 +61,7 @@ def list_categories_api(
 
             total_records, categories = list_categories(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response
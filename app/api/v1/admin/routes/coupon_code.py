@@ -5,8 +5,8 @@ from app.schemas.coupon_code import CouponCodeCreate, CouponCodeResponse,CouponC
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.coupon_code_service import create_coupon_code,get_coupon_codes_paginated,update_coupon_code,soft_delete_coupon_code,search_coupon_codes
 from app.models.user import User
+from app.core.pagination import build_pagination
 from fastapi import Query
-import math
 from typing import List
 
 
@@ -61,14 +61,7 @@ def list_coupon_codes(
                 limit=limit
             )
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if coupons:
             return {
@@ -2,7 +2,6 @@
 from app.models import main_category
 from fastapi import APIRouter, Depends, UploadFile, File, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db,get_current_user
 from app.schemas.main_category import (
@@ -18,6 +17,7 @@ from app.services.main_category_service import (
     search_main_categories
 )
 from app.models.user import User
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -64,14 +64,7 @@ def list_api(
 
             total_records, main_categories = list_main_categories(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-                "total": total_records,
-                "per_page": limit,
-                "current_page": page,
-                "total_pages": total_pages,
-            }
+        pagination = build_pagination(total_records, page, limit)
 
         if main_categories:
                 return {
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_current_user
+from app.core.security import password_pool
+from app.models.user import User
+from app.schemas.response import APIResponse
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+# -------------------------------------------------
+# PASSWORD HASHING POOL
+# -------------------------------------------------
+# - Concurrency cap, queue depth and wait / run times
+#   of the bcrypt worker pool (this worker process)
+# -------------------------------------------------
+@router.get("/password-hashing", response_model=APIResponse[dict])
+def get_password_hashing_metrics(
+    user: User = Depends(get_current_user)
+):
+    return {
+        "status": 200,
+        "message": "Password hashing metrics fetched successfully",
+        "data": password_pool.stats()
+    }
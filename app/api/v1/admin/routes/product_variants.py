@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, status,Query
 from sqlalchemy.orm import Session
 from typing import List
-import math
 
 from app.api.dependencies import get_db, get_current_user
 from app.models.user import User
 from app.schemas.product_variant import ProductVariantBulkCreate,ProductVariantResponse,ZoneDropdownResponse,UOMDropdownResponse,ProductDropdownResponse
 from app.services.product_variant_service import bulk_create_product_variants,list_all_product_variants,update_product_variant,soft_delete_product_variant,list_uom_dropdown,list_zone_dropdown,list_product_dropdown,search_product_variants
 from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.core.pagination import build_pagination
 
 
 
@@ -62,14 +62,7 @@ def list_all_product_variants_api(
         else:
             total_records, variants = list_all_product_variants(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if variants:
             return {
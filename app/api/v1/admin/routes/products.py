@@ -18,8 +18,9 @@ from app.models.user import User
 from app.models.product import Product
 from app.models.product_image import ProductImage
 from app.core.exceptions import AppException
+from app.core.pagination import build_pagination
+from app.core.search import SEARCH_MODE_TRIGRAM, SEARCH_MODE_PATTERN
 from fastapi import Query
-import math
 
 router = APIRouter()
 
@@ -46,6 +47,12 @@ def list_products_api(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1),
     q: str | None = Query(None, description="Search keyword"),
+    search_mode: str = Query(
+        SEARCH_MODE_TRIGRAM,
+        pattern=SEARCH_MODE_PATTERN,
+        description="trigram: fuzzy product, category and sub-category names, "
+                    "fulltext: ranked words in names and descriptions"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -60,7 +67,8 @@ def list_products_api(
                 db=db,
                 search=q,
                 offset=offset,
-                limit=limit
+                limit=limit,
+                search_mode=search_mode
             )
         else:
             total_records, products = list_products(db, offset, limit)
@@ -70,14 +78,7 @@ def list_products_api(
         # -------------------------------
         # total_records, products = list_products(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if products:
             return {
@@ -6,8 +6,8 @@ from app.schemas.slider import SliderCreate, SliderResponse,SliderUpdate
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.slider_service import create_slider,list_sliders,update_slider,soft_delete_slider,search_sliders
 from app.models.user import User
+from app.core.pagination import build_pagination
 from fastapi import Query
-import math
 
 
 router = APIRouter()
@@ -66,14 +66,7 @@ def list_slider_api(
         else:
             total_records, sliders = list_sliders(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if sliders:
             return {
@@ -1,7 +1,6 @@
 from app.models import sub_category
 from fastapi import APIRouter, Depends, UploadFile, File, Query
 from sqlalchemy.orm import Session
-import math
 from typing import List
 
 from app.api.dependencies import get_db, get_current_user
@@ -21,6 +20,7 @@ from app.services.sub_category_service import (
     get_category_dropdown,
     search_sub_categories
 )
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -67,14 +67,7 @@ def list_api(
         else:
             total_records, sub_categories = list_sub_categories(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if sub_categories:
             return {
@@ -15,12 +15,12 @@ from app.services.uom_service import (
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.uom import UOM
+from app.core.pagination import build_pagination
 router = APIRouter()
 
 
 # Pagination
 from fastapi import Query
-import math
 
 # -------------------------------
 # create uoms
@@ -67,15 +67,7 @@ def list_uoms_api(
         else:
             total_records, uoms = list_uoms(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-  
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response
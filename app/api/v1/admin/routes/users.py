@@ -7,7 +7,7 @@ from app.schemas.user import UserCreate, UserResponse,UserUpdate
 from app.schemas.response import APIResponse,PaginatedAPIResponse
 from app.services.user_service import create_user, get_users,update_user,soft_delete_user,search_users
 from app.models.user import User
-import math
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -62,14 +62,7 @@ def list_users(
         # -------------------------------
         # Pagination info
         # -------------------------------
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends,Query
+from fastapi import APIRouter, Depends,Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from app.api.dependencies import get_db
 from app.schemas.zone import ZoneCreate, ZoneUpdate, ZoneResponse
@@ -14,19 +14,26 @@ from app.models.user import User
 router = APIRouter()
 from app.schemas.response import APIResponse
 from app.schemas.zone import ZoneResponse,ZonePolygonResponse
-from app.services.zone_service import get_zones_by_lat_lng,search_zones
+from app.schemas.zone import ServiceabilityRequest, ServiceabilityResult, ZoneOverlapResponse, ServiceabilityTileInfo
+from app.services.serviceability_tile_service import (
+    rebuild_serviceability_tiles,
+    rebuild_serviceability_tiles_job
+)
+from app.services.zone_service import get_zones_by_lat_lng,search_zones,check_serviceability,list_zone_overlaps
 from app.schemas.response import PaginatedAPIResponse
-import math
+from app.core.pagination import build_pagination
 from typing import List
 
 
 @router.post("/create", response_model=APIResponse[ZoneResponse])
 def create(
+    background_tasks: BackgroundTasks,
     data: ZoneCreate = Depends(ZoneCreate.as_form),
     db: Session = Depends(get_db),    
     current_user: User = Depends(get_current_user)
 ):
     zone = create_zone(db, data)
+    background_tasks.add_task(rebuild_serviceability_tiles_job)
     return {
         "status": 201,
         "message": "Zone created successfully",
@@ -61,14 +68,7 @@ def list_zones_api(
 
             total_records, zones = list_zones(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if zones:
             return {
@@ -97,12 +97,14 @@ def list_zones_api(
 
 @router.put("/update", response_model=APIResponse[ZoneResponse])
 def update(
+    background_tasks: BackgroundTasks,
     zone_id: int = Query(..., description="Zone ID"),
     zone_data: ZoneUpdate = Depends(ZoneUpdate.as_form),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     zone = update_zone(db, zone_id, zone_data)
+    background_tasks.add_task(rebuild_serviceability_tiles_job)
 
     return {
         "status": 200,
@@ -113,11 +115,13 @@ def update(
 
 @router.delete("/delete", response_model=APIResponse[ZoneResponse])
 def delete_zone_api(
+    background_tasks: BackgroundTasks,
     zone_id: int = Query(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     zone = delete_zone(db, zone_id)
+    background_tasks.add_task(rebuild_serviceability_tiles_job)
 
     return {
         "status": 200,
@@ -143,6 +147,30 @@ def list_zones_by_lat_lng(
 
 
 
+# -------------------------------
+# batch serviceability check
+# -------------------------------
+@router.post(
+    "/serviceability",
+    response_model=APIResponse[List[ServiceabilityResult]]
+)
+def check_serviceability_api(
+    payload: ServiceabilityRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    results = check_serviceability(
+        db,
+        [{"lat": p.lat, "lng": p.lng} for p in payload.points]
+    )
+
+    return {
+        "status": 200,
+        "message": "Serviceability checked successfully",
+        "data": results
+    }
+
+
 
 @router.get(
     "/polygons",
@@ -166,3 +194,59 @@ def list_zone_polygons_api(
             for z in zones
         ]
     }
+
+
+# -------------------------------
+# overlapping zone pairs report
+# -------------------------------
+@router.get(
+    "/overlaps",
+    response_model=APIResponse[List[ZoneOverlapResponse]]
+)
+def list_zone_overlaps_api(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    overlaps = list_zone_overlaps(db)
+
+    if not overlaps:
+        return {
+            "status": 300,
+            "message": "No overlapping zones found",
+            "data": []
+        }
+
+    return {
+        "status": 200,
+        "message": "Overlapping zones fetched successfully",
+        "data": overlaps
+    }
+
+
+
+# -------------------------------
+# rebuild serviceability tiles (mobile coverage rasters)
+# -------------------------------
+@router.post(
+    "/serviceability-tiles/rebuild",
+    response_model=APIResponse[List[ServiceabilityTileInfo]]
+)
+def rebuild_serviceability_tiles_api(
+    force: bool = Query(False, description="Rebuild even if zones did not change"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    tiles = rebuild_serviceability_tiles(db, force=force)
+
+    if not tiles:
+        return {
+            "status": 300,
+            "message": "No deliverable zones to rasterise",
+            "data": []
+        }
+
+    return {
+        "status": 200,
+        "message": "Serviceability tiles rebuilt successfully",
+        "data": tiles
+    }
@@ -2,7 +2,6 @@
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db
 
@@ -19,6 +18,7 @@ from app.services.restaurant_entity_category_service import (
     update_entity_category,
     delete_entity_category   
 )
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -60,14 +60,7 @@ def list_entity_category_api(
             main_category_id=main_category_id
         )
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if entities:
             return {
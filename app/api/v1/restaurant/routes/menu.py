@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db
 from app.schemas.response import APIResponse, PaginatedAPIResponse
@@ -15,6 +14,7 @@ from app.services.restaurant_menu_service import (
     update_menu,
     delete_menu
 )
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -50,15 +50,7 @@ def list_menu_api(
         offset = (page - 1) * limit
         total_records, menus = list_menus(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-
-        pagination = {
-                "total": total_records,
-                "per_page": limit,
-                "current_page": page,
-                "total_pages": total_pages,
-            }
+        pagination = build_pagination(total_records, page, limit)
         
         if menus:
                 return {
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 from typing import List
 
 from app.api.dependencies import get_db
@@ -19,6 +18,7 @@ from app.services.restaurant_menu_category_service import (
     delete_menu_category,
     list_menu_dropdown
 )
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -61,14 +61,7 @@ def list_menu_category_api(
                 menu_id=menu_id
             )
         
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": math.ceil(total_pages / limit) if limit else 1
-        }
+        pagination = build_pagination(total_records, page, limit)
 
 
         if menu_categories:
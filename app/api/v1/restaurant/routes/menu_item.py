@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 from fastapi import UploadFile, File
 
 
@@ -21,6 +20,7 @@ from app.services.restaurant_menu_item_service import (
     get_menu_dropdown,
     get_menu_category_dropdown
 )
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -57,14 +57,7 @@ def list_menu_item_api(
         offset = (page - 1) * limit
         total, items = list_menu_items(db, offset, limit, menu_id)
 
-        total_pages = math.ceil(total / limit) if limit else 1
-
-        pagination = {
-                "total": total,
-                "per_page": limit,
-                "current_page": page,
-                "total_pages": total_pages,
-            }
+        pagination = build_pagination(total, page, limit)
         
 
         if items:
@@ -3,7 +3,7 @@ from fastapi import APIRouter
 # -------------------------
 # ROUTE IMPORTS
 # -------------------------
-from app.api.v1.web.routes import auth,web_categories,web_products,web_slider,web_main_category,web_product_variants
+from app.api.v1.web.routes import auth,web_categories,web_products,web_slider,web_main_category,web_product_variants,web_serviceability
 
 
 
@@ -31,3 +31,5 @@ router.include_router(web_main_category.router,prefix="/main_categories")
 # PRODUCT VARIANTS ROUTES
 router.include_router(web_product_variants.router,prefix="/web_product_variants")
 
+# SERVICEABILITY TILE ROUTES
+router.include_router(web_serviceability.router,prefix="/serviceability")
@@ -30,7 +30,7 @@ def register(payload: WebRegisterRequest, db: Session = Depends(get_db)):
 # CUSTOMER REGISTRATION (VERIFY OTP + LOGIN)
 # ============================================================
 @router.post("/register/verify-otp")
-def verify_otp(payload: MobileOTPVerifyRequest, db: Session = Depends(get_db)):
+def verify_register_otp(payload: MobileOTPVerifyRequest, db: Session = Depends(get_db)):
     data = verify_otp_and_login(db, payload.mobile, payload.otp)
     return {
         "status": 200,
@@ -43,7 +43,8 @@ def verify_otp(payload: MobileOTPVerifyRequest, db: Session = Depends(get_db)):
 
 # ============================================================
 # SIGN-IN (SEND OTP)
-# ============================================================@router.post("/send-otp", response_model=APIResponse[dict])
+# ============================================================
+@router.post("/send-otp", response_model=APIResponse[dict])
 def request_otp(payload: MobileSignInRequest, db: Session = Depends(get_db)):
     otp_entry = send_otp(db, payload.mobile)
 
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db
 from app.schemas.response import PaginatedAPIResponse
 from app.schemas.web_category import CategoryResponse
 from app.services.web_category_service import list_web_categories
+from app.core.pagination import build_pagination
+from app.core.responses import json_bytes_response
 
 router = APIRouter()
 
@@ -30,25 +31,19 @@ def list_categories_web(
             db, offset, limit,main_category_id=main_category_id
         )
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response (LIKE MAIN CATEGORY)
         # -------------------------------
         if categories:
-            return {
+            # Plain dict rows, serialised directly (same JSON as response_model)
+            return json_bytes_response({
                 "status": 200,
                 "message": "Categories fetched successfully",
                 "data": categories,
                 "pagination": pagination
-            }
+            })
 
         return {
             "status": 300,
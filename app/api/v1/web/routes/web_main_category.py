@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db
 from app.schemas.response import PaginatedAPIResponse
 from app.schemas.web_main_category import WebMainCategoryResponse
 from app.services.web_main_category_service import list_web_main_categories
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -32,14 +32,7 @@ def list_main_categories_web(
             db, offset, limit
         )
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response (LIKE USER LIST)
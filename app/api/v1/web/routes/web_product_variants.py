@@ -1,15 +1,19 @@
 from fastapi import APIRouter, Depends, status,Query
 from sqlalchemy.orm import Session
 from typing import List
-import math
 
 from app.api.dependencies import get_db, get_current_user
 from app.models.user import User
 from app.schemas.response import APIResponse
 from app.schemas.web_product_variants import ProductVariantResponse
+from app.schemas.zone import NearestZoneResponse
 
-from app.services.web_product_variants_service import list_all_product_variants
+from app.services.web_product_variants_service import list_all_product_variants, list_product_variants_by_cursor
+from app.core.exceptions import AppException
+from app.services.zone_service import find_nearest_deliverable_zone
 from app.schemas.response import APIResponse, PaginatedAPIResponse
+from app.core.pagination import build_pagination
+from app.core.responses import json_bytes_response
 from fastapi import HTTPException
 from fastapi import Path
 
@@ -18,6 +22,34 @@ from fastapi import Path
 router = APIRouter()
 
 
+# -------------------------
+# NEAREST DELIVERABLE ZONE
+# -------------------------
+@router.get(
+    "/nearest-zone",
+    response_model=APIResponse[NearestZoneResponse]
+)
+def nearest_deliverable_zone_api(
+    lat: float = Query(...),
+    lng: float = Query(...),
+    db: Session = Depends(get_db),
+):
+    nearest = find_nearest_deliverable_zone(db, lat, lng)
+
+    if not nearest:
+        return {
+            "status": 300,
+            "message": "No deliverable zone found nearby",
+            "data": None
+        }
+
+    return {
+        "status": 200,
+        "message": "Nearest deliverable zone fetched successfully",
+        "data": nearest
+    }
+
+
 # -------------------------
 # LIST for Product Variant
 # -------------------------
@@ -31,14 +63,38 @@ def list_all_product_variants_api(
     lng: float = Query(...),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1),
+    nearest: bool = Query(False, description="Mention the nearest deliverable zone when not serviceable"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor mode: pagination.next_cursor of the previous page, empty for the first page"
+    ),
     db: Session = Depends(get_db),
     # current_user: User = Depends(get_current_user),
 ):
     offset = (page - 1) * limit
 
     try:
+        # ----------------------------------
+        # CURSOR MODE (infinite scroll)
+        # ----------------------------------
+        if cursor is not None:
+            variants, next_cursor, error_message = list_product_variants_by_cursor(
+                db, lat, lng, limit, cursor, main_category_slug, include_nearest=nearest
+            )
+
+            return json_bytes_response({
+                "status": 400 if error_message else 200,
+                "message": error_message or "Product variants fetched successfully",
+                "data": variants or [],
+                "pagination": {
+                    "per_page": limit,
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None,
+                }
+            })
+
         total_records, variants, error_message = list_all_product_variants(
-            db, lat, lng, offset, limit,main_category_slug
+            db, lat, lng, offset, limit,main_category_slug, include_nearest=nearest
         )
 
         if error_message:
@@ -46,30 +102,22 @@ def list_all_product_variants_api(
                 "status": 400,
                 "message": error_message,
                 "data": [],
-                "pagination": {
-                    "total": 0,
-                    "per_page": limit,
-                    "current_page": page,
-                    "total_pages": 0,
-                }
+                "pagination": build_pagination(0, page, limit)
             }
 
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
-        return {
+        # Plain dict rows, serialised directly (same JSON as response_model)
+        return json_bytes_response({
             "status": 200,
             "message": "Product variants fetched successfully",
             "data": variants,
             "pagination": pagination,
-        }
+        })
+
+    except AppException:
+        raise
     
     except Exception as e:
         # Return error with status 500 inside, but HTTP 200
@@ -77,10 +125,5 @@ def list_all_product_variants_api(
             "status": 500,
             "message": "Failed to fetch product variants",
             "data": [],
-            "pagination": {
-                "total": 0,
-                "per_page": limit,
-                "current_page": page,
-                "total_pages": 0,
-            }
+            "pagination": build_pagination(0, page, limit)
         }
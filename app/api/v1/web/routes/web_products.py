@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-import math
 
 from app.api.dependencies import get_db
 from app.models.product import Product
-from app.schemas.web_product import ProductResponse
-from app.schemas.response import PaginatedAPIResponse
+from app.schemas.web_product import ProductResponse, ProductSuggestionResponse
+from app.schemas.response import APIResponse, PaginatedAPIResponse
 
 router = APIRouter()
 
-from app.services.web_product_service import list_web_products
+from app.services.web_product_service import list_web_product_rows, suggest_products
+from app.core.pagination import build_pagination
+from app.core.responses import json_bytes_response
+from app.core.search import SEARCH_MODE_TRIGRAM, SEARCH_MODE_PATTERN
 
 
 # -------------------------
@@ -26,6 +28,13 @@ def list_products_web(
     category_id: Optional[int] = Query(None),
     sub_category_id: Optional[int] = Query(None),
     slug: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Search keyword"),
+    search_mode: str = Query(
+        SEARCH_MODE_TRIGRAM,
+        pattern=SEARCH_MODE_PATTERN,
+        description="trigram: fuzzy product, category and sub-category names, "
+                    "fulltext: ranked words in names and descriptions"
+    ),
     db: Session = Depends(get_db),
 ):
     try:
@@ -34,34 +43,30 @@ def list_products_web(
         # -------------------------------
         offset = (page - 1) * limit
 
-        total_records, products = list_web_products(
+        total_records, products = list_web_product_rows(
             db=db,
             offset=offset,
             limit=limit,
             category_id=category_id,
             sub_category_id=sub_category_id,
             slug=slug,   
+            search=q,
+            search_mode=search_mode,
         )
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         # -------------------------------
         # Response (LIKE MAIN CATEGORY)
         # -------------------------------
         if products:
-            return {
+            # Plain dict rows, serialised directly (same JSON as response_model)
+            return json_bytes_response({
                 "status": 200,
                 "message": "Products fetched successfully",
                 "data": products,
                 "pagination": pagination
-            }
+            })
 
         return {
             "status": 300,
@@ -76,3 +81,39 @@ def list_products_web(
             "message": "Failed to fetch products",
             "data": []
         }
+
+
+# -------------------------
+# SUGGEST (TYPEAHEAD) for Product
+# -------------------------
+@router.get(
+    "/suggest",
+    response_model=APIResponse[List[ProductSuggestionResponse]]
+)
+def suggest_products_web(
+    q: str = Query(..., min_length=1, description="Typed prefix of a product or category name"),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db),
+):
+    try:
+        suggestions = suggest_products(db=db, q=q, limit=limit)
+
+        if suggestions:
+            return {
+                "status": 200,
+                "message": "Suggestions fetched successfully",
+                "data": suggestions
+            }
+
+        return {
+            "status": 300,
+            "message": "No suggestions found",
+            "data": []
+        }
+
+    except Exception:
+        return {
+            "status": 500,
+            "message": "Failed to fetch suggestions",
+            "data": []
+        }
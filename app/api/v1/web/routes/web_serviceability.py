@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_db
+from app.schemas.response import APIResponse
+from app.schemas.zone import ServiceabilityTileResponse
+from app.services.serviceability_tile_service import get_serviceability_tile
+
+router = APIRouter()
+
+# Tiles change only when zones change, the ETag does the rest
+TILE_CACHE_CONTROL = "public, max-age=300"
+
+
+# -------------------------
+# SERVICEABILITY TILE (coverage raster for offline checks)
+# -------------------------
+@router.get("/tiles", response_model=APIResponse[ServiceabilityTileResponse])
+def get_serviceability_tile_api(
+    request: Request,
+    response: Response,
+    level: int = Query(1, ge=1, description="Zoom level, 1 = coarsest"),
+    db: Session = Depends(get_db),
+):
+    tile = get_serviceability_tile(db, level)
+
+    if not tile:
+        return {
+            "status": 300,
+            "message": "Serviceability tiles not available",
+            "data": None
+        }
+
+    etag = f'"{tile.version}-{tile.level}"'
+    headers = {"ETag": etag, "Cache-Control": TILE_CACHE_CONTROL}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return {
+        "status": 200,
+        "message": "Serviceability tile fetched successfully",
+        "data": {
+            "level": tile.level,
+            "cell_size": tile.cell_size,
+            "min_lat": tile.min_lat,
+            "min_lng": tile.min_lng,
+            "rows": tile.rows,
+            "cols": tile.cols,
+            "version": tile.version,
+            "data": tile.data,
+        }
+    }
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-import math
 
 from app.api.dependencies import get_db
 from app.schemas.web_slider import SliderResponse
 from app.schemas.response import PaginatedAPIResponse
 from app.services.web_slider_service import list_sliders  
+from app.core.pagination import build_pagination
 
 router = APIRouter()
 
@@ -24,14 +24,7 @@ def list_web_sliders(
 
         total_records, sliders = list_sliders(db, offset, limit)
 
-        total_pages = math.ceil(total_records / limit) if limit else 1
-
-        pagination = {
-            "total": total_records,
-            "per_page": limit,
-            "current_page": page,
-            "total_pages": total_pages,
-        }
+        pagination = build_pagination(total_records, page, limit)
 
         if sliders:
             return {
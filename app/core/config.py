@@ -14,3 +14,56 @@ DATABASE_URL = (
 CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
 CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
+
+# Zone geometry backend: "python" (app/utils/geo.py) or "postgis"
+# "postgis" falls back to python when zones.geom is missing
+ZONE_GEO_BACKEND = os.getenv("ZONE_GEO_BACKEND", "python")
+
+# Grid cell -> zone memo cache (storefront zone lookups)
+# 0.0014 degrees ≈ 150 m cells
+ZONE_CELL_CACHE_DEGREES = float(os.getenv("ZONE_CELL_CACHE_DEGREES", "0.0014"))
+ZONE_CELL_CACHE_SIZE = int(os.getenv("ZONE_CELL_CACHE_SIZE", "50000"))
+
+# Nearest deliverable zone fallback (storefront "we deliver X km away")
+NEAREST_ZONE_MAX_KM = float(os.getenv("NEAREST_ZONE_MAX_KM", "25"))
+
+# Admin list totals (app/core/pagination.py)
+# cached per entity + filters, dropped on writes; tables with more
+# rows than LIST_COUNT_EXACT_MAX_ROWS report planner estimates
+LIST_COUNT_CACHE_SIZE = int(os.getenv("LIST_COUNT_CACHE_SIZE", "1024"))
+LIST_COUNT_CACHE_TTL = float(os.getenv("LIST_COUNT_CACHE_TTL", "60"))
+LIST_COUNT_EXACT_MAX_ROWS = int(os.getenv("LIST_COUNT_EXACT_MAX_ROWS", "100000"))
+
+# Admin search result pages (app/core/search_cache.py)
+# id lists per (entity, normalised query, page), dropped on writes
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "2048"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "60"))
+
+# Token revocation (app/services/token_revocation_service.py)
+# revoked jtis are held in memory; other workers' logouts are picked
+# up every TOKEN_REVOCATION_SYNC_SECONDS, expired rows purged hourly
+TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "5"))
+TOKEN_REVOCATION_PURGE_SECONDS = float(os.getenv("TOKEN_REVOCATION_PURGE_SECONDS", "3600"))
+TOKEN_REVOCATION_BLOOM_CAPACITY = int(os.getenv("TOKEN_REVOCATION_BLOOM_CAPACITY", "100000"))
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+
+# Authenticated principal cache (app/services/principal_service.py)
+# a deactivated / deleted user is locked out within the TTL at worst
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024"))
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "30"))
+
+# Password hashing pool (app/core/security.py)
+# bcrypt calls run on their own threads, at most PASSWORD_HASH_WORKERS
+# at once; past PASSWORD_HASH_MAX_QUEUE waiting calls, logins get 503
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+# Decoded JWT cache (app/core/security.py decode_token)
+# sha256(token) -> verified claims until the token's exp; set
+# JWT_DECODE_CACHE_ENABLED=false to verify every request
+JWT_DECODE_CACHE_ENABLED = os.getenv("JWT_DECODE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+JWT_DECODE_CACHE_SIZE = int(os.getenv("JWT_DECODE_CACHE_SIZE", "4096"))
+
+# Mobile OTP sweep (app/services/web_auth_service.py)
+# expired mobile_otp rows are bulk deleted every OTP_PURGE_SECONDS
+OTP_PURGE_SECONDS = float(os.getenv("OTP_PURGE_SECONDS", "300"))
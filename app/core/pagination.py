@@ -0,0 +1,207 @@
+import base64
+import json
+import math
+import threading
+from datetime import datetime
+
+from sqlalchemy import func, literal, text
+from sqlalchemy.orm import Query
+
+from app.core.cache import LRUCache
+from app.core.config import (
+    LIST_COUNT_CACHE_SIZE,
+    LIST_COUNT_CACHE_TTL,
+    LIST_COUNT_EXACT_MAX_ROWS
+)
+from app.core.exceptions import AppException
+
+
+# ============================================================
+# KEYSET (CURSOR) PAGINATION
+# Opaque cursor = base64url JSON of the last row's sort key
+# (created_at, id). Clients only pass it back, never build it
+# ============================================================
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    payload = json.dumps({"c": created_at.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise AppException(status=400, message="Invalid cursor")
+
+
+# ============================================================
+# OFFSET PAGINATION
+# Total and page rows in ONE statement:
+#   SELECT ..., count(*) OVER () FROM ... LIMIT n OFFSET m
+# The window count is evaluated before LIMIT, so every row
+# carries the full total. An empty page (offset past the end)
+# falls back to a plain count.
+#
+# estimated=True reads the planner's row estimate instead of
+# counting (very large tables, "about N results"); the exact
+# total is still used when the page reaches the end.
+# ============================================================
+def paginate(
+    query: Query,
+    offset: int,
+    limit: int,
+    estimated: bool = False,
+    count_key: tuple | None = None
+):
+    """
+    :param query: ordered SQLAlchemy query
+    :param count_key: from list_count_key(), caches the total
+    :returns: (total, rows)
+
+    Entity queries get their entities back; column queries
+    get their rows with one extra "_total_count" column
+    """
+    if count_key is not None:
+        total = _count_cache.get(count_key)
+        if total is not None:
+            return total, _fetch_page(query, offset, limit, total)
+
+        # Large tables are never counted exactly
+        estimated = estimated or _is_large_table(query)
+
+    total, rows = _paginate(query, offset, limit, estimated)
+
+    if count_key is not None:
+        _count_cache.set(count_key, total)
+
+    return total, rows
+
+
+def _paginate(query: Query, offset: int, limit: int, estimated: bool):
+    if estimated:
+        rows = query.offset(offset).limit(limit).all()
+
+        if len(rows) < limit and (rows or offset == 0):
+            return offset + len(rows), rows
+
+        return max(estimate_count(query), offset + len(rows)), rows
+
+    total_column = func.count().over().label("_total_count")
+    result = query.add_columns(total_column).offset(offset).limit(limit).all()
+
+    if not result:
+        total = query.order_by(None).count() if offset else 0
+        return total, []
+
+    total = result[0][-1]
+
+    if _is_single_entity(query):
+        return total, [row[0] for row in result]
+
+    return total, result
+
+
+def _fetch_page(query: Query, offset: int, limit: int, total: int):
+    """Page rows only, total already known (same row shape as _paginate)"""
+    if _is_single_entity(query):
+        return query.offset(offset).limit(limit).all()
+
+    return query.add_columns(
+        literal(total).label("_total_count")
+    ).offset(offset).limit(limit).all()
+
+
+def _is_single_entity(query: Query) -> bool:
+    columns = query.column_descriptions
+    return len(columns) == 1 and columns[0]["expr"] is columns[0]["entity"]
+
+
+def estimate_count(query: Query) -> int:
+    """
+    Planner row estimate for the query (no LIMIT / ORDER BY)
+    EXPLAIN only plans the statement, it does not run it
+    """
+    statement = query.enable_eagerloads(False).order_by(None).statement
+    compiled = statement.compile(dialect=query.session.bind.dialect)
+
+    plan = query.session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        compiled.params
+    ).scalar()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# ============================================================
+# LIST TOTAL CACHE
+# Admin list screens re-count the same table on every page
+# flip. Totals are cached per (entity, filter signature):
+# - Every write through the entity's service calls
+#   invalidate_list_counts(entity), which bumps the entity
+#   version so all of its cached totals stop matching
+# - The TTL bounds staleness from other workers / processes
+# - Tables above LIST_COUNT_EXACT_MAX_ROWS (pg_class.reltuples)
+#   use the planner estimate instead of an exact count
+# ============================================================
+_count_cache = LRUCache("list_counts", maxsize=LIST_COUNT_CACHE_SIZE, ttl=LIST_COUNT_CACHE_TTL)
+
+# reltuples only moves on VACUUM / ANALYZE, no need to re-read it often
+_table_rows_cache = LRUCache("table_row_estimates", maxsize=256, ttl=300)
+
+_count_versions: dict[str, int] = {}
+_count_versions_lock = threading.Lock()
+
+
+def list_count_key(entity: str, *filters) -> tuple:
+    """
+    :param entity: name shared with invalidate_list_counts()
+    :param filters: everything that changes the total (search text, ...)
+    """
+    return entity, _count_versions.get(entity, 0), filters
+
+
+def invalidate_list_counts(*entities: str):
+    with _count_versions_lock:
+        for entity in entities:
+            _count_versions[entity] = _count_versions.get(entity, 0) + 1
+
+
+def table_row_estimate(query: Query) -> int | None:
+    """pg_class.reltuples of the query's main table (-1 / None = never analysed)"""
+    columns = query.column_descriptions
+    entity = columns[0]["entity"] if columns else None
+    table = getattr(entity, "__table__", None)
+    if table is None:
+        return None
+
+    estimate = _table_rows_cache.get(table.name)
+    if estimate is None:
+        estimate = query.session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": table.name}
+        ).scalar()
+        estimate = int(estimate) if estimate is not None else -1
+        _table_rows_cache.set(table.name, estimate)
+
+    return estimate
+
+
+def _is_large_table(query: Query) -> bool:
+    estimate = table_row_estimate(query)
+    return estimate is not None and estimate > LIST_COUNT_EXACT_MAX_ROWS
+
+
+# ============================================================
+# PAGINATION BLOCK FOR LIST RESPONSES
+# ============================================================
+def build_pagination(total: int, page: int, limit: int) -> dict:
+    return {
+        "total": total,
+        "per_page": limit,
+        "current_page": page,
+        "total_pages": math.ceil(total / limit) if limit else 1,
+    }
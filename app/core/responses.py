@@ -0,0 +1,16 @@
+from fastapi import Response
+from pydantic_core import to_json
+
+
+# ============================================================
+# PRE-SERIALISED JSON RESPONSES
+# Fast path for hot web listing routes:
+# - payload is built from column-projected rows (plain dicts
+#   and lists, no ORM entities)
+# - serialised once by pydantic-core, skipping response_model
+#   validation and jsonable_encoder
+# pydantic-core also serialises the response_model path, so
+# datetimes / floats come out exactly the same
+# ============================================================
+def json_bytes_response(payload: dict) -> Response:
+    return Response(content=to_json(payload), media_type="application/json")
@@ -0,0 +1,73 @@
+import threading
+
+from app.db.session import SessionLocal
+
+
+# ============================================================
+# PERIODIC BACKGROUND JOBS
+# In-process maintenance (cache sync, table purges, ...):
+# - One daemon thread per job, started / stopped with the app
+# - Every run gets its own DB session, closed afterwards
+# - A failing run is printed and retried on the next interval
+# Every worker process runs its own copy, so jobs must be safe
+# to run concurrently (idempotent DELETEs, local cache syncs)
+# ============================================================
+class PeriodicJob:
+    def __init__(self, name: str, interval: float, func):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self):
+        db = SessionLocal()
+        try:
+            self.func(db)
+        except Exception as e:
+            db.rollback()
+            print(f"Scheduled job {self.name} failed:", e)
+        finally:
+            db.close()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"job-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+_jobs: dict[str, PeriodicJob] = {}
+
+
+def schedule_job(name: str, interval: float, func) -> PeriodicJob:
+    """
+    Register func(db) to run every `interval` seconds
+    Jobs start with start_scheduler()
+    """
+    job = _jobs.get(name)
+    if job is None:
+        job = _jobs[name] = PeriodicJob(name, interval, func)
+    return job
+
+
+def start_scheduler():
+    for job in _jobs.values():
+        job.start()
+
+
+def stop_scheduler():
+    for job in _jobs.values():
+        job.stop()
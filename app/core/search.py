@@ -1,12 +1,35 @@
-from sqlalchemy import or_, func, case
+import re
+
+from sqlalchemy import and_, or_, func, false, literal, text, String
 from sqlalchemy.orm import Query
 
 
+# Minimum pg_trgm similarity for a match
+TRIGRAM_SIMILARITY_THRESHOLD = 0.1
+
+# Search engines a route can pick per query (search_mode)
+SEARCH_MODE_TRIGRAM = "trigram"
+SEARCH_MODE_FULLTEXT = "fulltext"
+SEARCH_MODE_PATTERN = f"^({SEARCH_MODE_TRIGRAM}|{SEARCH_MODE_FULLTEXT})$"
+
+# Text search configuration the stored tsvector columns use
+FULLTEXT_CONFIG = "english"
+
+
+def _set_trigram_threshold(query: Query, setting: str, threshold: float):
+    """Per-query pg_trgm threshold (is_local = true: reset at transaction end)"""
+    query.session.execute(
+        text("SELECT set_config(:setting, :threshold, true)"),
+        {"setting": setting, "threshold": str(threshold)}
+    )
+
+
 def apply_trigram_search(
     query: Query,
     search: str,
     fields: list,
-    order_fields: list | None = None
+    order_fields: list | None = None,
+    threshold: float = TRIGRAM_SIMILARITY_THRESHOLD
 ):
     """
     Generic pg_trgm search helper
@@ -15,42 +38,32 @@ def apply_trigram_search(
     :param search: search keyword
     :param fields: list of model fields for filtering
     :param order_fields: list of fields for ranking
+    :param threshold: minimum similarity for a match
+
+    Filters with the `%` operator so the gin_trgm_ops indexes
+    on the searched columns are used. `%` matches when
+    similarity >= pg_trgm.similarity_threshold, which is set to
+    `threshold` for the current transaction only; the strict
+    similarity > threshold recheck keeps the original matches.
     """
 
     if not search:
         return query
 
-    # WHERE clause - handle NULL fields
-    filters = []
-    for field in fields:
-        # Use coalesce to convert NULL to empty string
-        # filters.append(
-        #     func.coalesce(field, '').op("%")(search)
-        # )
-        filters.append(
-            func.similarity(func.coalesce(field, ''), search) > 0.1
-        )
+    _set_trigram_threshold(query, "pg_trgm.similarity_threshold", threshold)
 
+    # WHERE clause - NULL fields never match (NULL % search is NULL)
+    filters = [
+        and_(
+            field.op("%")(search),                      # index condition
+            func.similarity(field, search) > threshold  # recheck
+        )
+        for field in fields
+    ]
 
-    
     query = query.filter(or_(*filters))
 
-
-   # ORDER BY similarity - handle NULL fields
-    # if order_fields:
-    #     similarities = []
-    #     for field in order_fields:
-    #         # Coalesce NULL fields to empty string, then calculate similarity
-    #         similarities.append(
-    #             func.coalesce(
-    #                 func.similarity(func.coalesce(field, ''), search), 
-    #                 0
-    #             )
-    #         )
-    #     query = query.order_by(func.greatest(*similarities).desc())
-
-    # return query
-
+    # ORDER BY similarity - handle NULL fields
     if order_fields:
         similarities = [
             func.similarity(func.coalesce(field, ''), search)
@@ -58,4 +71,87 @@ def apply_trigram_search(
         ]
         query = query.order_by(func.greatest(*similarities).desc())
 
-    return query
\ No newline at end of file
+    return query
+
+
+def apply_trigram_document_search(
+    query: Query,
+    search: str,
+    document,
+    threshold: float = TRIGRAM_SIMILARITY_THRESHOLD
+):
+    """
+    pg_trgm search over ONE concatenated document column
+
+    :param query: SQLAlchemy query object
+    :param search: search keyword
+    :param document: text column holding every searched field
+    :param threshold: minimum word similarity for a match
+
+    Uses word similarity (`search <% document`): the search is
+    compared with the best matching extent of the document, not
+    the whole text. That is at least the similarity to the field
+    the extent came from, so a document matches whenever one of
+    its fields would have matched apply_trigram_search.
+    """
+
+    if not search:
+        return query
+
+    _set_trigram_threshold(query, "pg_trgm.word_similarity_threshold", threshold)
+
+    keyword = literal(search, String)
+    rank = func.word_similarity(keyword, document)
+
+    query = query.filter(
+        keyword.op("<%")(document),  # index condition
+        rank > threshold             # recheck
+    )
+
+    return query.order_by(rank.desc())
+
+
+def prefix_tsquery(search: str, config: str = FULLTEXT_CONFIG):
+    """
+    tsquery matching every word of search as a prefix
+    "organic red onion 1kg" -> organic:* & red:* & onion:* & 1kg:*
+
+    Only word characters reach to_tsquery, so operators typed by
+    the user can not produce a syntax error. None when no words.
+    """
+    terms = re.findall(r"\w+", search or "")
+    if not terms:
+        return None
+
+    return func.to_tsquery(config, " & ".join(f"{term}:*" for term in terms))
+
+
+def apply_fulltext_search(
+    query: Query,
+    search: str,
+    vector,
+    config: str = FULLTEXT_CONFIG
+):
+    """
+    Full-text search over a stored, GIN indexed tsvector column
+
+    :param query: SQLAlchemy query object
+    :param search: search keyword(s), every word must match
+    :param vector: tsvector column (weighted with setweight)
+    :param config: text search configuration of the column
+
+    Words are stemmed and matched as prefixes; ranking uses
+    ts_rank_cd, so the column weights (A..D) and how close the
+    matched words are to each other both count.
+    """
+
+    if not search:
+        return query
+
+    tsquery = prefix_tsquery(search, config)
+    if tsquery is None:
+        return query.filter(false())
+
+    query = query.filter(vector.op("@@")(tsquery))
+
+    return query.order_by(func.ts_rank_cd(vector, tsquery).desc())
@@ -0,0 +1,81 @@
+import threading
+
+from sqlalchemy.orm import Query
+
+from app.core.cache import LRUCache
+from app.core.config import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL
+
+
+# ============================================================
+# SEARCH RESULT CACHE
+# Admin users repeat the same q= while they page and edit.
+# A search page is cached as (total, ids) per
+# (entity, normalised query, offset, limit, extra):
+# - A hit re-loads just those ids by primary key (with the
+#   caller's eager loading), the similarity query is skipped
+# - Every write through the entity's service calls
+#   invalidate_search_cache(entity), which bumps the entity
+#   version so all of its cached pages stop matching
+# - The TTL bounds staleness from other workers / processes
+# ============================================================
+_search_cache = LRUCache("search_results", maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+_search_versions: dict[str, int] = {}
+_search_versions_lock = threading.Lock()
+
+
+def normalize_search(search: str | None) -> str:
+    """Case and whitespace never change trigram / full-text matches"""
+    return " ".join((search or "").lower().split())
+
+
+def search_cache_key(entity: str, search: str, offset: int, limit: int, *extra) -> tuple:
+    """
+    :param entity: name shared with invalidate_search_cache()
+    :param extra: anything else that changes the page (search mode, ...)
+    """
+    return (
+        entity,
+        _search_versions.get(entity, 0),
+        normalize_search(search),
+        offset,
+        limit,
+        extra
+    )
+
+
+def invalidate_search_cache(*entities: str):
+    """Call AFTER the write is committed"""
+    with _search_versions_lock:
+        for entity in entities:
+            _search_versions[entity] = _search_versions.get(entity, 0) + 1
+
+
+def cached_search(key: tuple, base_query: Query, id_column, run_search):
+    """
+    :param key: search_cache_key(...)
+    :param base_query: query before search filters / ordering,
+                       with the eager loading the response needs
+    :param id_column: primary key column of the listed entity
+    :param run_search: () -> (total, rows), the uncached search
+
+    Returns (total, rows) like run_search. Rows deleted since the
+    page was cached (other workers, within the TTL) are skipped.
+    """
+    cached = _search_cache.get(key)
+
+    if cached is not None:
+        total, ids = cached
+        if not ids:
+            return total, []
+
+        rows = base_query.filter(id_column.in_(ids)).all()
+        by_id = {getattr(row, id_column.key): row for row in rows}
+
+        return total, [by_id[i] for i in ids if i in by_id]
+
+    total, rows = run_search()
+
+    _search_cache.set(key, (total, [getattr(row, id_column.key) for row in rows]))
+
+    return total, rows
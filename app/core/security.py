@@ -1,7 +1,20 @@
 from datetime import datetime, timedelta
+import hashlib
+import time
+import uuid
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError
 from passlib.context import CryptContext
 
+from app.core.cache import LRUCache
+from app.core.config import (
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_QUEUE,
+    JWT_DECODE_CACHE_ENABLED,
+    JWT_DECODE_CACHE_SIZE
+)
+from app.core.worker_pool import BoundedWorkerPool
+
 # ================= CONFIG =================
 SECRET_KEY = "SUPER_SECRET_KEY_CHANGE_ME"
 ALGORITHM = "HS256"
@@ -12,27 +25,90 @@ REFRESH_TOKEN_EXPIRE_DAYS = 7
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+# bcrypt releases the GIL: a few dedicated threads hash in parallel
+# without occupying the request threads (see app/core/worker_pool.py)
+password_pool = BoundedWorkerPool(
+    "password-hash",
+    workers=PASSWORD_HASH_WORKERS,
+    max_queue=PASSWORD_HASH_MAX_QUEUE
+)
+
+
 # ================= PASSWORD =================
-def hash_password(password: str) -> str:
+def _hash_password(password: str) -> str:
     # bcrypt supports max 72 bytes
     safe_password = password.encode("utf-8")[:72]
     return pwd_context.hash(safe_password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
     safe_password = plain_password.encode("utf-8")[:72]
     return pwd_context.verify(safe_password, hashed_password)
 
+def hash_password(password: str) -> str:
+    return password_pool.run(_hash_password, password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return password_pool.run(_verify_password, plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run_async(_hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run_async(_verify_password, plain_password, hashed_password)
+
 # ================= JWT =================
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
 
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
 
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def create_refresh_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
\ No newline at end of file
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+def token_id(token: str, payload: dict) -> str:
+    """Revocation key: jti claim, sha256 of the token for tokens issued before jti"""
+    return payload.get("jti") or hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# ================= JWT VERIFICATION CACHE =================
+# Clients reuse one access token for its whole lifetime: verify the
+# signature once per token per worker, then serve the claims from
+# an LRU keyed by sha256(token) (the signature is part of the key,
+# a tampered token never hits). Entries expire with the token's exp.
+# Hit rate: GET /admin/cache/stats ("decoded_tokens")
+_decoded_tokens = LRUCache("decoded_tokens", maxsize=JWT_DECODE_CACHE_SIZE)
+
+
+def decode_token(token: str) -> dict:
+    """
+    Verified claims of a token (raises JWTError like jwt.decode)
+    Returns a copy, callers may modify it
+    """
+    if not JWT_DECODE_CACHE_ENABLED:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = _decoded_tokens.get(key)
+
+    if payload is not None:
+        # TTL already follows exp, this covers the last partial second
+        if payload["exp"] <= time.time():
+            _decoded_tokens.pop(key)
+            raise ExpiredSignatureError("Signature has expired.")
+        return dict(payload)
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    # Tokens without exp are accepted but never cached
+    if isinstance(payload.get("exp"), (int, float)):
+        ttl = payload["exp"] - time.time()
+        if ttl > 0:
+            _decoded_tokens.set(key, dict(payload), ttl=ttl)
+
+    return payload
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.core.exceptions import AppException
+
+
+# ============================================================
+# BOUNDED WORKER POOL
+# CPU heavy calls that release the GIL (bcrypt, ...) run on a
+# small dedicated thread pool instead of the request threads:
+# - at most `workers` calls run at once (concurrency cap)
+# - at most `max_queue` calls wait; past that new calls are
+#   rejected with 503 instead of piling up
+# - wait / run times are counted for tuning
+# ============================================================
+class BoundedWorkerPool:
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+
+        self.active = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def _call(self, submitted_at: float, func, args):
+        started = time.perf_counter()
+        waited = started - submitted_at
+
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        ok = False
+        try:
+            result = func(*args)
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.run_seconds += time.perf_counter() - started
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    def submit(self, func, *args) -> Future:
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise AppException(status=503, message="Server is busy, please try again")
+
+            self.queued += 1
+            self.submitted += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        return self._executor.submit(self._call, time.perf_counter(), func, args)
+
+    def run(self, func, *args):
+        """Blocking call for sync code (waits without using CPU)"""
+        return self.submit(func, *args).result()
+
+    async def run_async(self, func, *args):
+        """Awaitable call: the event loop keeps serving meanwhile"""
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def stats(self) -> dict:
+        with self._lock:
+            started = self.completed + self.failed
+            return {
+                "name": self.name,
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.queued,
+                "max_queued": self.max_queued,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.wait_seconds / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+                "avg_run_ms": round(self.run_seconds / started * 1000, 2) if started else 0.0,
+            }
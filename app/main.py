@@ -22,6 +22,12 @@ from app.api.v1.router import api_router
 from app.models import user,category,product,uom,token_blacklist,slider # noqa
 
 import app.core.cloudinary  # noqa
+from app.db.session import SessionLocal
+from app.utils.suggest_index import get_suggest_index, refresh_suggest_index, SUGGEST_INDEX_REFRESH_SECONDS
+from app.core.scheduler import schedule_job, start_scheduler, stop_scheduler
+from app.core.config import TOKEN_REVOCATION_SYNC_SECONDS, TOKEN_REVOCATION_PURGE_SECONDS, OTP_PURGE_SECONDS
+from app.services.token_revocation_service import sync_revocations, purge_expired_revocations
+from app.services.web_auth_service import purge_expired_otps
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -111,6 +117,43 @@ async def pydantic_validation_exception_handler(
     )
 
 
+# -----------------------------
+# STARTUP
+# Build the storefront typeahead index before the first request
+# A failure here is not fatal: the first /suggest call retries
+# -----------------------------
+@app.on_event("startup")
+def warm_suggest_index():
+    db = SessionLocal()
+    try:
+        get_suggest_index(db)
+    except Exception as e:
+        print("Suggest index build failed:", e)
+    finally:
+        db.close()
+
+
+# -----------------------------
+# BACKGROUND JOBS (app/core/scheduler.py)
+# -----------------------------
+revocation_sync_job = schedule_job("token_revocation_sync", TOKEN_REVOCATION_SYNC_SECONDS, sync_revocations)
+schedule_job("token_revocation_purge", TOKEN_REVOCATION_PURGE_SECONDS, purge_expired_revocations)
+schedule_job("otp_purge", OTP_PURGE_SECONDS, purge_expired_otps)
+schedule_job("suggest_index_refresh", SUGGEST_INDEX_REFRESH_SECONDS, refresh_suggest_index)
+
+
+@app.on_event("startup")
+def start_background_jobs():
+    # Load revoked tokens before the first authenticated request
+    revocation_sync_job.run_once()
+    start_scheduler()
+
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    stop_scheduler()
+
+
 # Create tables (DEV only)
 # Base.metadata.create_all(bind=engine)
 
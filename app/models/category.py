@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 from sqlalchemy.orm import relationship
@@ -26,6 +26,16 @@ class Category(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_categories_category_name_trgm",
+            "category_name",
+            postgresql_using="gin",
+            postgresql_ops={"category_name": "gin_trgm_ops"}
+        ),
+    )
+
 
     main_category = relationship("MainCategory") 
     # ✅ NO back_populates here
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Index
 from sqlalchemy.sql import func
 import uuid
 
@@ -33,3 +33,19 @@ class CouponCode(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_coupon_codes_coupon_code_trgm",
+            "coupon_code",
+            postgresql_using="gin",
+            postgresql_ops={"coupon_code": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_coupon_codes_coupon_type_trgm",
+            "coupon_type",
+            postgresql_using="gin",
+            postgresql_ops={"coupon_type": "gin_trgm_ops"}
+        ),
+    )
@@ -14,7 +14,7 @@ class Customer(Base):
 
     name = Column(String(255), nullable=False)
     email = Column(String(255),index=True, nullable=True)
-    contact = Column(String(20), nullable=True)
+    contact = Column(String(20), index=True, nullable=True)
    
     is_active = Column(Boolean, default=True)
     is_delete = Column(Boolean, default=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -17,3 +17,13 @@ class MainCategory(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_main_categories_main_category_name_trgm",
+            "main_category_name",
+            postgresql_using="gin",
+            postgresql_ops={"main_category_name": "gin_trgm_ops"}
+        ),
+    )
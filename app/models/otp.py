@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -8,7 +8,7 @@ class MobileOTP(Base):
 
 
     id = Column(Integer, primary_key=True, index=True)
-    mobile = Column(String(20), index=True, nullable=False)  
+    mobile = Column(String(20), nullable=False)
     otp = Column(String(6), nullable=False)
 
     is_verified = Column(Boolean, default=False)
@@ -16,4 +16,7 @@ class MobileOTP(Base):
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    
\ No newline at end of file
+    __table_args__ = (
+        # Latest valid OTP per mobile (send / verify)
+        Index("ix_mobile_otp_mobile_expires_at", "mobile", "expires_at"),
+    )
@@ -1,7 +1,18 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Text,Index,Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from app.db.base import Base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+
+
+# Full-text search document (app/core/search.py apply_fulltext_search)
+# name A, short name B, short description C, long description D
+PRODUCT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(product_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(product_short_name, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(short_description, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(long_description, '')), 'D')"
+)
 
 
 class Product(Base):
@@ -37,6 +48,34 @@ class Product(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Generated by Postgres on every write, never loaded by default
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(PRODUCT_SEARCH_VECTOR, persisted=True)
+    ))
+
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_products_product_name_trgm",
+            "product_name",
+            postgresql_using="gin",
+            postgresql_ops={"product_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_products_product_short_name_trgm",
+            "product_short_name",
+            postgresql_using="gin",
+            postgresql_ops={"product_short_name": "gin_trgm_ops"}
+        ),
+        # Full-text search
+        Index(
+            "ix_products_search_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
+    )
     
 
     # ✅ ADD THIS
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class ProductSearchDocument(Base):
+    """
+    One denormalised search row per product
+    Kept current by app/services/product_search_service.py
+    """
+    __tablename__ = "product_search_documents"
+
+    product_id = Column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    product_name = Column(String(255), nullable=False)
+    product_short_name = Column(String(255), nullable=False)
+    category_name = Column(String(255), nullable=True)
+    sub_category_name = Column(String(255), nullable=True)
+
+    # All of the above, space separated (the searched column)
+    search_text = Column(Text, nullable=False)
+
+    # Product flags, so searches filter without joining products
+    is_active = Column(Boolean, nullable=False, default=True)
+    is_delete = Column(Boolean, nullable=False, default=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_product_search_documents_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,ForeignKey,Float,Index,text
 from sqlalchemy.sql import func
 from app.db.base import Base
 from sqlalchemy.orm import relationship
@@ -46,6 +46,16 @@ class ProductVariants(Base):
     product = relationship("Product")
     uom = relationship("UOM")
     zone = relationship("Zone")
+
+    __table_args__ = (
+        # Storefront feed: newest first, keyset on (created_at, id)
+        Index(
+            "ix_product_variants_live_created_at_id",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("is_delete = false AND is_active = true")
+        ),
+    )
     
 
     @property
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class ServiceabilityTile(Base):
+    __tablename__ = "serviceability_tiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # One raster per zoom level (1 = coarsest)
+    level = Column(Integer, unique=True, index=True, nullable=False)
+
+    # Grid geometry: south-west corner + cell size in degrees
+    cell_size = Column(Float, nullable=False)
+    min_lat = Column(Float, nullable=False)
+    min_lng = Column(Float, nullable=False)
+    rows = Column(Integer, nullable=False)
+    cols = Column(Integer, nullable=False)
+
+    # 2 bits per cell, row-major, base64 (see app/utils/zone_raster.py)
+    data = Column(Text, nullable=False)
+
+    # Hash of the zone set the raster was built from
+    version = Column(String(64), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ServiceabilityTile level={self.level} version={self.version}>"
@@ -7,5 +7,8 @@ class TokenBlacklist(Base):
     __tablename__ = "token_blacklist"
 
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(500), nullable=False, unique=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # jti claim (sha256 of the token for tokens without one)
+    jti = Column(String(64), nullable=False, unique=True)
+    # token exp: the row is useless afterwards and gets purged
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
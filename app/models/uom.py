@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -22,3 +22,31 @@ class UOM(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_uoms_uom_name_trgm",
+            "uom_name",
+            postgresql_using="gin",
+            postgresql_ops={"uom_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_uoms_uom_code_trgm",
+            "uom_code",
+            postgresql_using="gin",
+            postgresql_ops={"uom_code": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_uoms_uom_short_name_trgm",
+            "uom_short_name",
+            postgresql_using="gin",
+            postgresql_ops={"uom_short_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_uoms_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"}
+        ),
+    )
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime,JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime,JSON,Float,Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 
+def lat_lng_box(min_lat, max_lat, min_lng, max_lng):
+    """Postgres box from bbox columns / values (lat as x, lng as y)"""
+    return func.box(func.point(min_lat, min_lng), func.point(max_lat, max_lng))
+
+
 class Zone(Base):
     __tablename__ = "zones"
 
@@ -12,6 +17,13 @@ class Zone(Base):
     state = Column(String(255), index=True, nullable=False)
     # Polygon coordinates stored here
     polygon = Column(JSON, nullable=False)
+
+    # Polygon bounding box (filled on create/update)
+    # Lets SQL narrow candidates before any polygon math
+    min_lat = Column(Float, nullable=True)
+    max_lat = Column(Float, nullable=True)
+    min_lng = Column(Float, nullable=True)
+    max_lng = Column(Float, nullable=True)
     
     is_deliverable=Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
@@ -21,3 +33,35 @@ class Zone(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Trigram search (app/core/search.py)
+        Index(
+            "ix_zones_zone_name_trgm",
+            "zone_name",
+            postgresql_using="gin",
+            postgresql_ops={"zone_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_zones_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_zones_state_trgm",
+            "state",
+            postgresql_using="gin",
+            postgresql_ops={"state": "gin_trgm_ops"}
+        ),
+    )
+
+
+# Bbox prefilter: GiST over the bbox as a box, serves && / @>
+# in both dimensions (a B-tree on the four columns only narrows
+# on its leading min_lat)
+Index(
+    "ix_zones_bbox",
+    lat_lng_box(Zone.min_lat, Zone.max_lat, Zone.min_lng, Zone.max_lng),
+    postgresql_using="gist"
+)
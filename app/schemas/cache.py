@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+# =====================================================
+# CACHE STATS – RESPONSE SCHEMA
+# One entry per process-local cache (app/core/cache.py)
+# =====================================================
+class CacheStatsResponse(BaseModel):
+    name: str
+    size: int
+    maxsize: int
+    ttl: Optional[float]
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
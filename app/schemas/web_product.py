@@ -37,4 +37,14 @@ class ProductResponse(BaseModel):
     images: List[ProductImageResponse]
 
     class Config:
-        orm_from_attributes = True
\ No newline at end of file
+        orm_from_attributes = True
+
+# =====================================================
+# PRODUCT SUGGESTION RESPONSE (WEB)
+# Typeahead entry: a product or a category
+# =====================================================
+class ProductSuggestionResponse(BaseModel):
+    type: str
+    uu_id: str
+    name: str
+    slug: str
@@ -144,4 +144,88 @@ class ZoneResponse(BaseModel):
 class ZonePolygonResponse(BaseModel):
     zone_id: int
     zone_name: str
-    polygon: List[Dict[str, float]]
\ No newline at end of file
+    polygon: List[Dict[str, float]]
+
+
+# =========================================================
+# BATCH SERVICEABILITY
+# Bulk point check for delivery planning / address imports
+# =========================================================
+MAX_SERVICEABILITY_POINTS = 10000
+
+
+class ServiceabilityPoint(BaseModel):
+    lat: float
+    lng: float
+
+
+class ServiceabilityRequest(BaseModel):
+    points: List[ServiceabilityPoint]
+
+    @field_validator("points")
+    @classmethod
+    def validate_points(cls, v):
+        if not v:
+            raise ValueError("At least one point is required")
+
+        if len(v) > MAX_SERVICEABILITY_POINTS:
+            raise ValueError(
+                f"Maximum {MAX_SERVICEABILITY_POINTS} points are allowed per request"
+            )
+
+        return v
+
+
+class ServiceabilityResult(BaseModel):
+    lat: float
+    lng: float
+    zone_ids: List[int]
+    is_deliverable: bool
+
+
+
+# =========================================================
+# ZONE OVERLAP RESPONSE
+# One overlapping pair with the shared area
+# =========================================================
+class ZoneOverlapResponse(BaseModel):
+    zone_id: int
+    zone_name: str
+    other_zone_id: int
+    other_zone_name: str
+    overlap_area_km2: float
+
+
+
+# =========================================================
+# NEAREST DELIVERABLE ZONE RESPONSE
+# =========================================================
+class NearestZoneResponse(BaseModel):
+    zone_id: int
+    zone_name: str
+    distance_km: float
+
+
+
+# =========================================================
+# SERVICEABILITY TILES
+# Raster metadata (admin rebuild) and full raster (web)
+# data: 2 bits per cell, row-major from the south-west
+# corner, base64 - 0 none, 1 serviceable, 2 boundary
+# =========================================================
+class ServiceabilityTileInfo(BaseModel):
+    level: int
+    cell_size: float
+    min_lat: float
+    min_lng: float
+    rows: int
+    cols: int
+    version: str
+
+    class Config:
+        from_attributes = True
+
+
+class ServiceabilityTileResponse(ServiceabilityTileInfo):
+    encoding: str = "2bit-base64"
+    data: str
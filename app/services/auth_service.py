@@ -1,36 +1,43 @@
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
+from jose import JWTError
+from starlette.concurrency import run_in_threadpool
 
 from app.models.user import User
 from app.core.exceptions import AppException
 from app.core.security import (
-    verify_password,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
-    SECRET_KEY,
-    ALGORITHM
+    decode_token,
+    token_id
 )
-from app.models.token_blacklist import TokenBlacklist
+from app.services.token_revocation_service import is_token_revoked
 
 # =========================================================
 # LOGIN USER
 # - Validates email & password
 # - Generates access & refresh tokens
 # - Returns user profile details
+# - Async: the lookup runs on the request threadpool, bcrypt on
+#   the password pool, the event loop stays free meanwhile
 # =========================================================
-def login_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(
+def _active_user_by_email(db: Session, email: str):
+    return db.query(User).filter(
         User.email == email,
         User.is_active == True,
         User.is_delete == False
     ).first()
 
+
+async def login_user(db: Session, email: str, password: str):
+    user = await run_in_threadpool(_active_user_by_email, db, email)
+
     
     if not user:
         raise AppException(status=404, message="Email not registered")
 
     #  Password incorrect
-    if not verify_password(password, user.password):
+    if not await verify_password_async(password, user.password):
         raise AppException(status=401, message="Incorrect password")
 
     payload = {
@@ -62,32 +69,27 @@ def login_user(db: Session, email: str, password: str):
 # =========================================================
 # REFRESH ACCESS TOKEN
 # - Validates refresh token
-# - Checks blacklist (logout / expiry)
+# - Checks revocation store (logout)
 # - Issues new access token
 # =========================================================
 
-def refresh_access_token(refresh_token: str):
-    blacklisted = db.query(TokenBlacklist).filter(
-        TokenBlacklist.token == refresh_token
-    ).first()
-
-    if blacklisted:
-        raise AppException(status=401, message="Refresh token expired. Please login again")
-
+def refresh_access_token(refresh_token: str, db: Session):
     try:
-        payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
-
-        if payload.get("type") != "refresh":
-            raise AppException(status=401, message="Invalid refresh token")
-
-        return {
-            "access_token": create_access_token({
-                "user_id": payload["user_id"],
-                "email": payload["email"],
-            }),
-            "token_type": "bearer"
-        }
+        payload = decode_token(refresh_token)
 
     except JWTError:
         raise AppException(status=401, message="Refresh token expired or invalid")
 
+    if payload.get("type") != "refresh":
+        raise AppException(status=401, message="Invalid refresh token")
+
+    if is_token_revoked(db, token_id(refresh_token, payload)):
+        raise AppException(status=401, message="Refresh token expired. Please login again")
+
+    return {
+        "access_token": create_access_token({
+            "user_id": payload["user_id"],
+            "email": payload["email"],
+        }),
+        "token_type": "bearer"
+    }
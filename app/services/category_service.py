@@ -13,6 +13,10 @@ from app.models.main_category import MainCategory
 
 
 from app.core.search import apply_trigram_search
+from app.services.product_search_service import refresh_product_search_documents
+from app.utils.suggest_index import index_category
+from app.core.pagination import paginate, invalidate_list_counts
+from app.core.search_cache import invalidate_search_cache
 
 def search_categories(
     db: Session,
@@ -53,14 +57,10 @@ def search_categories(
         ]
     )
 
-    total = query.count()
-
-    categories = (
-        query
-        .order_by(Category.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, categories = paginate(
+        query.order_by(Category.created_at.desc()),
+        offset,
+        limit
     )
 
     return total, categories
@@ -175,6 +175,7 @@ def create_category(
         db.add(db_category)
         db.commit()
         db.refresh(db_category)
+        index_category(db_category)
         return (
         category_with_main_name_query(db)
         .filter(Category.id == db_category.id)
@@ -196,9 +197,7 @@ def list_categories(db: Session, offset: int, limit: int):
         # Category.is_active == True
     ).order_by(Category.created_at.desc())
 
-    total_records = base_query.count()
-
-    categories = base_query.offset(offset).limit(limit).all()
+    total_records, categories = paginate(base_query, offset, limit)
 
     return total_records, categories
 
@@ -254,6 +253,9 @@ def update_category(
         category.category_name = category_data.category_name
         category.slug = new_slug
 
+        # Products of this category carry its name in their search documents
+        refresh_product_search_documents(db, category_ids=[category.id])
+
     # ---------- ACTIVE ----------
     if category_data.is_active is not None:
         category.is_active = category_data.is_active
@@ -267,7 +269,10 @@ def update_category(
 
     try:
         db.commit()
+        invalidate_list_counts("products")
+        invalidate_search_cache("products")
         db.refresh(category)
+        index_category(category)
         
         return (
             category_with_main_name_query(db)
@@ -301,6 +306,7 @@ def soft_delete_category(db: Session, uu_id: str):
     try:
         db.commit()
         db.refresh(category)
+        index_category(category)
 
         return (
             category_with_main_name_query(db)
@@ -9,6 +9,8 @@ from app.core.exceptions import AppException
 from sqlalchemy.sql import func
 
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate, invalidate_list_counts
+from app.core.search_cache import cached_search, search_cache_key, invalidate_search_cache
 
 
 # =========================================================
@@ -20,35 +22,39 @@ def search_coupon_codes(
     offset: int,
     limit: int
 ):
-    query = (
+    base_query = (
         db.query(CouponCode)
         .filter(
             CouponCode.is_delete == False
         )
     )
 
-    # 🔍 Search by coupon_code & coupon_type
-    query = apply_trigram_search(
-        query=query,
-        search=search,
-        fields=[
-            CouponCode.coupon_code,
-            CouponCode.coupon_type
-        ],
-        order_fields=[
-            CouponCode.coupon_code,
-            CouponCode.coupon_type
-        ]
-    )
+    def run_search():
+        # 🔍 Search by coupon_code & coupon_type
+        query = apply_trigram_search(
+            query=base_query,
+            search=search,
+            fields=[
+                CouponCode.coupon_code,
+                CouponCode.coupon_type
+            ],
+            order_fields=[
+                CouponCode.coupon_code,
+                CouponCode.coupon_type
+            ]
+        )
 
-    total = query.count()
+        return paginate(
+            query.order_by(CouponCode.created_at.desc()),
+            offset,
+            limit
+        )
 
-    coupons = (
-        query
-        .order_by(CouponCode.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, coupons = cached_search(
+        search_cache_key("coupon_codes", search, offset, limit),
+        base_query,
+        CouponCode.id,
+        run_search
     )
 
     return coupons, total
@@ -84,6 +90,8 @@ def create_coupon_code(db: Session, data: CouponCodeCreate):
     try:
         db.add(coupon)
         db.commit()
+        invalidate_list_counts("coupon_codes")
+        invalidate_search_cache("coupon_codes")
         db.refresh(coupon)
         return coupon
     except IntegrityError:
@@ -103,9 +111,7 @@ def get_coupon_codes_paginated(
         # CouponCode.is_active == True
     ).order_by(CouponCode.created_at.desc())
 
-    total_records = base_query.count()
-
-    coupons = base_query.offset(offset).limit(limit).all()
+    total_records, coupons = paginate(base_query, offset, limit)
 
     return coupons, total_records
 
@@ -157,6 +163,8 @@ def update_coupon_code(
 
     try:
         db.commit()
+        invalidate_list_counts("coupon_codes")
+        invalidate_search_cache("coupon_codes")
         db.refresh(coupon)
         return coupon
     except IntegrityError:
@@ -183,6 +191,8 @@ def soft_delete_coupon_code(db: Session, uu_id: str):
 
     try:
         db.commit()
+        invalidate_list_counts("coupon_codes")
+        invalidate_search_cache("coupon_codes")
         db.refresh(coupon)
         return coupon
     except IntegrityError:
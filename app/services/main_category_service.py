@@ -13,6 +13,7 @@ from app.schemas.main_category import MainCategoryCreate, MainCategoryUpdate
 from app.core.exceptions import AppException
 
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate
 
 
 def search_main_categories(
@@ -39,14 +40,10 @@ def search_main_categories(
         ]
     )
 
-    total = query.count()
-
-    categories = (
-        query
-        .order_by(MainCategory.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, categories = paginate(
+        query.order_by(MainCategory.created_at.desc()),
+        offset,
+        limit
     )
 
     return total, categories
@@ -127,9 +124,7 @@ def list_main_categories(db: Session, offset: int, limit: int):
         # MainCategory.is_delete == False
     ).order_by(MainCategory.created_at.desc())
 
-    total_records = base_query.count()
-
-    main_categories = base_query.offset(offset).limit(limit).all()
+    total_records, main_categories = paginate(base_query, offset, limit)
 
     return total_records, main_categories
 
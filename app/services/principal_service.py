@@ -0,0 +1,61 @@
+import threading
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache import LRUCache
+from app.core.config import PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL
+from app.models.user import User
+
+
+# ============================================================
+# AUTHENTICATED PRINCIPAL CACHE
+# get_current_user resolves the token's user_id on every admin
+# call. Active users are cached per process as a snapshot of
+# their column values:
+# - A hit rebuilds the User and attaches it to the request's
+#   session without a query (merge, load=False), so routes can
+#   still modify and commit it
+# - user / profile writes call invalidate_principal() after
+#   commit; changes made elsewhere (other workers, SQL) apply
+#   within PRINCIPAL_CACHE_TTL
+# ============================================================
+_principal_cache = LRUCache("principals", maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL)
+
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+_generation = 0
+_lock = threading.Lock()
+
+
+def get_principal(db: Session, user_id: int) -> User | None:
+    """Active, non-deleted user or None"""
+    values = _principal_cache.get(user_id)
+
+    if values is not None:
+        user = User(**values)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    generation = _generation
+
+    user = db.query(User).filter(
+        User.id == user_id,
+        User.is_active == True,
+        User.is_delete == False
+    ).first()
+
+    # Skip caching if a user write landed while we were loading
+    if user is not None and generation == _generation:
+        _principal_cache.set(user_id, {key: getattr(user, key) for key in _USER_COLUMNS})
+
+    return user
+
+
+def invalidate_principal(user_id: int):
+    """Call AFTER the user write is committed"""
+    global _generation
+
+    with _lock:
+        _generation += 1
+
+    _principal_cache.pop(user_id)
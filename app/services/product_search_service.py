@@ -0,0 +1,147 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, Query
+
+from app.core.search import (
+    apply_trigram_document_search,
+    apply_fulltext_search,
+    SEARCH_MODE_FULLTEXT,
+    SEARCH_MODE_TRIGRAM
+)
+from app.models.product import Product
+from app.models.category import Category
+from app.models.sub_category import SubCategory
+from app.models.product_search_document import ProductSearchDocument
+
+
+# =====================================================
+# PRODUCT SEARCH DOCUMENTS
+# One row per product with the product, category and
+# sub-category names flattened into search_text, so product
+# search filters and ranks on ONE indexed table.
+# Catalog services call refresh_product_search_documents()
+# inside their own transaction whenever a searched name or
+# a product flag changes.
+# =====================================================
+DOCUMENT_COLUMNS = (
+    "product_id",
+    "product_name",
+    "product_short_name",
+    "category_name",
+    "sub_category_name",
+    "search_text",
+    "is_active",
+    "is_delete",
+)
+
+
+def _document_source():
+    """SELECT producing search document rows, in DOCUMENT_COLUMNS order"""
+    return (
+        select(
+            Product.id,
+            Product.product_name,
+            Product.product_short_name,
+            Category.category_name,
+            SubCategory.sub_category_name,
+            func.concat_ws(
+                " ",
+                Product.product_name,
+                Product.product_short_name,
+                Category.category_name,
+                SubCategory.sub_category_name
+            ),
+            func.coalesce(Product.is_active, True),
+            func.coalesce(Product.is_delete, False),
+        )
+        .select_from(Product)
+        .outerjoin(Category, Category.id == Product.category_id)
+        .outerjoin(SubCategory, SubCategory.id == Product.sub_category_id)
+    )
+
+
+# =====================================================
+# REFRESH (UPSERT) DOCUMENTS
+# No ids = rebuild every document
+# Does not commit, runs in the caller's transaction
+# =====================================================
+def refresh_product_search_documents(
+    db: Session,
+    product_ids: list[int] | None = None,
+    category_ids: list[int] | None = None,
+    sub_category_ids: list[int] | None = None
+):
+    # Pending ORM changes must be visible to the INSERT ... SELECT
+    db.flush()
+
+    source = _document_source()
+
+    if product_ids is not None:
+        source = source.where(Product.id.in_(product_ids))
+
+    if category_ids is not None:
+        source = source.where(Product.category_id.in_(category_ids))
+
+    if sub_category_ids is not None:
+        source = source.where(Product.sub_category_id.in_(sub_category_ids))
+
+    stmt = insert(ProductSearchDocument).from_select(DOCUMENT_COLUMNS, source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProductSearchDocument.product_id],
+        set_={
+            **{column: stmt.excluded[column] for column in DOCUMENT_COLUMNS[1:]},
+            "updated_at": func.now(),
+        }
+    )
+
+    db.execute(stmt)
+
+
+# =====================================================
+# SEARCH FILTER FOR PRODUCT QUERIES
+# Joins each product's document (primary key join) and
+# filters / ranks on the document alone
+# live_only: storefront (active products only)
+# =====================================================
+def apply_product_document_search(
+    query: Query,
+    search: str | None,
+    live_only: bool = False
+) -> Query:
+    if not search:
+        return query
+
+    query = query.join(
+        ProductSearchDocument,
+        ProductSearchDocument.product_id == Product.id
+    ).filter(
+        ProductSearchDocument.is_delete == False
+    )
+
+    if live_only:
+        query = query.filter(ProductSearchDocument.is_active == True)
+
+    return apply_trigram_document_search(
+        query=query,
+        search=search,
+        document=ProductSearchDocument.search_text
+    )
+
+
+# =====================================================
+# SEARCH FILTER, ENGINE PICKED PER QUERY
+# trigram:  product search documents (typo tolerant,
+#           product / category / sub-category names)
+# fulltext: products.search_vector (stemmed words, ranked
+#           with ts_rank_cd, name > short name > descriptions)
+# =====================================================
+def apply_product_search(
+    query: Query,
+    search: str | None,
+    search_mode: str = SEARCH_MODE_TRIGRAM,
+    live_only: bool = False
+) -> Query:
+    if search_mode == SEARCH_MODE_FULLTEXT:
+        return apply_fulltext_search(query, search, Product.search_vector)
+
+    return apply_product_document_search(query, search, live_only=live_only)
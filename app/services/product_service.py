@@ -13,54 +13,66 @@ from app.models.category import Category
 from app.schemas.product import ProductCreate, ProductUpdate
 from app.core.exceptions import AppException
 import cloudinary.uploader
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, load_only
 
-from app.core.search import apply_trigram_search
+from app.services.product_search_service import (
+    apply_product_search,
+    refresh_product_search_documents
+)
+from app.core.search import SEARCH_MODE_TRIGRAM
+from app.core.pagination import paginate, list_count_key, invalidate_list_counts
+from app.core.search_cache import cached_search, search_cache_key, invalidate_search_cache
+from app.utils.suggest_index import index_product
 
 
 # Search Functioanlity
+# Trigram (product_search_documents) or full-text engine
+# (see app/services/product_search_service.py)
 def search_products(
     db,
     search: str,
     offset: int,
-    limit: int
+    limit: int,
+    search_mode: str = SEARCH_MODE_TRIGRAM
 ):
     query = (
         db.query(Product)
-        .join(Category)
-        .outerjoin(SubCategory)
         .filter(
             Product.is_delete == False
             # Product.is_active == True
         )
         .options(
-            joinedload(Product.images),
-            joinedload(Product.category),
-            joinedload(Product.sub_category)
+            # Images via one extra IN query: LIMIT / OFFSET stay per product
+            selectinload(Product.images).load_only(
+                ProductImage.id,
+                ProductImage.product_image,
+                ProductImage.is_primary
+            ),
+            joinedload(Product.category).load_only(
+                Category.id,
+                Category.category_name
+            ),
+            joinedload(Product.sub_category).load_only(
+                SubCategory.id,
+                SubCategory.sub_category_name
+            )
         )
     )
 
-    query = apply_trigram_search(
-        query=query,
-        search=search,
-        fields=[
-            Product.product_name,
-            Product.product_short_name,
-            Category.category_name,
-            SubCategory.sub_category_name
-        ],
-        order_fields=[
-            Product.product_name,
-            Product.product_short_name,
-            Category.category_name,
-            SubCategory.sub_category_name
-        ]
-    )
-
-    total = query.count()
-    products = query.offset(offset).limit(limit).all()
+    def run_search():
+        return paginate(
+            apply_product_search(query, search, search_mode),
+            offset,
+            limit,
+            count_key=list_count_key("products", search, search_mode)
+        )
 
-    return total, products
+    return cached_search(
+        search_cache_key("products", search, offset, limit, search_mode),
+        query,
+        Product.id,
+        run_search
+    )
 
 
 
@@ -160,8 +172,12 @@ def create_product(
                 is_primary=(index == 0)
             ))
 
+        refresh_product_search_documents(db, product_ids=[db_product.id])
 
         db.commit()
+        invalidate_list_counts("products", "product_variants")
+        invalidate_search_cache("products", "product_variants")
+        index_product(db_product)
     
         return db.query(Product).options(joinedload(Product.images))\
         .filter(Product.id == db_product.id).first()
@@ -180,14 +196,21 @@ def list_products(db: Session, offset: int, limit: int):
     # -------------------------------
     # Base filters (soft delete aware)
     # -------------------------------
-    base_query = db.query(Product).filter(
+    base_query = db.query(Product).options(
+        selectinload(Product.images),
+        joinedload(Product.category),
+        joinedload(Product.sub_category)
+    ).filter(
         Product.is_delete == False
         # Product.is_active == True
     ).order_by(Product.created_at.desc())
 
-    total_records = base_query.count()
-
-    products = base_query.offset(offset).limit(limit).all()
+    total_records, products = paginate(
+        base_query,
+        offset,
+        limit,
+        count_key=list_count_key("products")
+    )
 
     return total_records, products
 
@@ -299,9 +322,13 @@ def update_product(
         if first_img:
             first_img.is_primary = True
 
+    refresh_product_search_documents(db, product_ids=[product.id])
 
     db.commit()
+    invalidate_list_counts("products", "product_variants")
+    invalidate_search_cache("products", "product_variants")
     db.refresh(product)
+    index_product(product)
 
     return db.query(Product).options(
         joinedload(Product.images),
@@ -343,9 +370,13 @@ def soft_delete_product(db: Session, uu_id: str):
         # Delete from DB
         db.delete(img)
 
+    refresh_product_search_documents(db, product_ids=[product.id])
 
     db.commit()
+    invalidate_list_counts("products", "product_variants")
+    invalidate_search_cache("products", "product_variants")
     db.refresh(product)
+    index_product(product)
     return product
 
 
@@ -17,6 +17,8 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import joinedload
 from sqlalchemy import or_
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate, list_count_key, invalidate_list_counts
+from app.core.search_cache import cached_search, search_cache_key, invalidate_search_cache
 
 
 # ============================================================
@@ -28,7 +30,7 @@ def search_product_variants(
     offset: int,
     limit: int
 ):
-    query = (
+    base_query = (
         db.query(ProductVariants)
         .join(Product, Product.id == ProductVariants.product_id)
         .join(Zone, Zone.id == ProductVariants.zone_id)
@@ -43,34 +45,37 @@ def search_product_variants(
         )
     )
 
-    # Trigram-based search across related tables
-    query = apply_trigram_search(
-        query=query,
-        search=search,
-        fields=[
-            Product.product_name,
-            Zone.zone_name,
-            UOM.uom_name
-        ],
-        order_fields=[
-            Product.product_name,
-            Zone.zone_name,
-            UOM.uom_name
-        ]
-    )
+    def run_search():
+        # Trigram-based search across related tables
+        query = apply_trigram_search(
+            query=base_query,
+            search=search,
+            fields=[
+                Product.product_name,
+                Zone.zone_name,
+                UOM.uom_name
+            ],
+            order_fields=[
+                Product.product_name,
+                Zone.zone_name,
+                UOM.uom_name
+            ]
+        )
 
-    total = query.count()
+        return paginate(
+            query.order_by(ProductVariants.created_at.desc()),
+            offset,
+            limit,
+            count_key=list_count_key("product_variants", search)
+        )
 
-    variants = (
-        query
-        .order_by(ProductVariants.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    return cached_search(
+        search_cache_key("product_variants", search, offset, limit),
+        base_query,
+        ProductVariants.id,
+        run_search
     )
 
-    return total, variants
-
 
 # ============================================================
 # BULK CREATE PRODUCT VARIANTS
@@ -160,6 +165,8 @@ def bulk_create_product_variants(
     try:
         db.add_all(variants_to_create)
         db.commit()
+        invalidate_list_counts("product_variants")
+        invalidate_search_cache("product_variants")
 
         # Refresh each object to get ID & created_at
         for variant in variants_to_create:
@@ -191,9 +198,12 @@ def list_all_product_variants(db: Session, offset: int, limit: int):
         # ProductVariants.is_active == True
     ).order_by(ProductVariants.created_at.desc())
 
-    total_records = base_query.count()
-
-    product_variants = base_query.offset(offset).limit(limit).all()
+    total_records, product_variants = paginate(
+        base_query,
+        offset,
+        limit,
+        count_key=list_count_key("product_variants")
+    )
 
     return total_records, product_variants
 
@@ -236,6 +246,8 @@ def update_product_variant(
 
     try:
         db.commit()
+        invalidate_list_counts("product_variants")
+        invalidate_search_cache("product_variants")
         db.refresh(variant)
         return variant
     except IntegrityError:
@@ -264,6 +276,8 @@ def soft_delete_product_variant(
 
     try:
         db.commit()
+        invalidate_list_counts("product_variants")
+        invalidate_search_cache("product_variants")
         db.refresh(variant)
         return variant
     except IntegrityError:
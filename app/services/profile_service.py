@@ -7,6 +7,8 @@ from app.models.user import User
 from app.schemas.profile_update import UserUpdate
 from app.core.security import hash_password
 from app.core.exceptions import AppException
+from app.core.pagination import invalidate_list_counts
+from app.services.principal_service import invalidate_principal
 import cloudinary.uploader
 
 MAX_IMAGE_SIZE = 1 * 1024 * 1024  # 1MB
@@ -72,7 +74,9 @@ def update_user_profile(
 
     try:
         db.commit()
+        invalidate_list_counts("users")
         db.refresh(user)
+        invalidate_principal(user.id)
         return user
     except IntegrityError:
         db.rollback()
@@ -6,6 +6,7 @@ import uuid
 from app.models.entity_category import EntityCategory
 from app.schemas.restaurant_entity_category import EntityCategoryCreate,EntityCategoryUpdate
 from app.core.exceptions import AppException
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -74,8 +75,7 @@ def list_entity_categories(
             EntityCategory.main_category_id == main_category_id
         )
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total_records, data = paginate(base_query, offset, limit)
 
     return total_records, data
 
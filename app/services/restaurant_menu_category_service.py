@@ -10,6 +10,7 @@ from app.schemas.restaurant_menu_category import (
     MenuCategoryUpdate
 )
 from app.core.exceptions import AppException
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -61,8 +62,7 @@ def list_menu_categories(db: Session, offset: int, limit: int, menu_id: int | No
     if menu_id:
         base_query = base_query.filter(MenuCategory.menu_id == menu_id)
 
-    total = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total, data = paginate(base_query, offset, limit)
     return total, data
 
 
@@ -13,6 +13,7 @@ import cloudinary.uploader
 
 from app.models.menu import Menu
 from app.models.menu_category import MenuCategory
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -145,8 +146,7 @@ def list_menu_items(
     if menu_id:
         base_query = base_query.filter(MenuItem.menu_id == menu_id)
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total_records, data = paginate(base_query, offset, limit)
 
     return total_records, data
 
@@ -5,6 +5,7 @@ import uuid
 from app.models.menu import Menu
 from app.schemas.restaurant_menu import MenuCreate, MenuUpdate
 from app.core.exceptions import AppException
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -52,8 +53,7 @@ def list_menus(db: Session, offset: int, limit: int):
         Menu.is_delete == False
     ).order_by(Menu.priority.asc(), Menu.created_at.desc())
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total_records, data = paginate(base_query, offset, limit)
 
     return total_records, data
 
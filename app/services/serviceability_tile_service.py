@@ -0,0 +1,113 @@
+import hashlib
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.serviceability_tile import ServiceabilityTile
+from app.services.zone_service import list_all_zone_polygons
+from app.utils.geo import polygon_bounds
+from app.utils.zone_raster import rasterise_zones, pack_cells
+
+
+# =========================================================
+# SERVICEABILITY TILES
+# Precomputed coverage rasters for the mobile app
+# - One raster per zoom level over all deliverable zones
+# - Cells: 0 none, 1 serviceable, 2 boundary (ask server)
+# - Version = hash of the zone set, used as the ETag
+# =========================================================
+
+# level -> cell size in degrees (≈ 1.1 km, 280 m, 70 m)
+SERVICEABILITY_TILE_LEVELS = {
+    1: 0.01,
+    2: 0.0025,
+    3: 0.000625,
+}
+
+# Levels finer than this many cells are skipped
+MAX_TILE_CELLS = 4_000_000
+
+
+def zone_set_version(zones) -> str:
+    parts = [
+        f"{z.id}:{z.updated_at or z.created_at}:{bool(z.is_deliverable)}"
+        for z in sorted(zones, key=lambda z: z.id)
+    ]
+    parts.append(repr(sorted(SERVICEABILITY_TILE_LEVELS.items())))
+
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+# =========================================================
+# REBUILD
+# No-op when the stored version already matches
+# =========================================================
+def rebuild_serviceability_tiles(db: Session, force: bool = False):
+    zones = list_all_zone_polygons(db)
+    version = zone_set_version(zones)
+
+    existing = db.query(ServiceabilityTile).order_by(ServiceabilityTile.level).all()
+    if not force and existing and all(t.version == version for t in existing):
+        return existing
+
+    deliverable = [z for z in zones if z.is_deliverable and z.polygon]
+
+    db.query(ServiceabilityTile).delete(synchronize_session=False)
+
+    if not deliverable:
+        db.commit()
+        return []
+
+    boxes = [polygon_bounds(z.polygon) for z in deliverable]
+    bounds = (
+        min(b[0] for b in boxes),
+        max(b[1] for b in boxes),
+        min(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+    tiles = []
+    for level, cell_size in sorted(SERVICEABILITY_TILE_LEVELS.items()):
+        rows = (bounds[1] - bounds[0]) / cell_size + 1
+        cols = (bounds[3] - bounds[2]) / cell_size + 1
+        if rows * cols > MAX_TILE_CELLS:
+            continue
+
+        grid, cells = rasterise_zones(deliverable, cell_size, bounds)
+
+        tiles.append(ServiceabilityTile(
+            level=level,
+            cell_size=cell_size,
+            min_lat=grid.min_lat,
+            min_lng=grid.min_lng,
+            rows=grid.rows,
+            cols=grid.cols,
+            data=pack_cells(cells),
+            version=version
+        ))
+
+    db.add_all(tiles)
+    db.commit()
+
+    return tiles
+
+
+def rebuild_serviceability_tiles_job():
+    """Background job entry point (own session)"""
+    db = SessionLocal()
+    try:
+        rebuild_serviceability_tiles(db)
+    except Exception as e:
+        db.rollback()
+        print("Serviceability tile rebuild failed:", e)
+    finally:
+        db.close()
+
+
+# =========================================================
+# READ
+# =========================================================
+def get_serviceability_tile(db: Session, level: int):
+    return db.query(ServiceabilityTile).filter(
+        ServiceabilityTile.level == level
+    ).first()
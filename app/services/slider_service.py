@@ -11,6 +11,7 @@ from sqlalchemy.sql import func
 
 
 from sqlalchemy import or_
+from app.core.pagination import paginate
 
 def search_sliders(
     db: Session,
@@ -23,14 +24,10 @@ def search_sliders(
         Slider.caption.ilike(f"%{search}%")
     )
 
-    total_records = query.count()
-
-    sliders = (
-        query
-        .order_by(Slider.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total_records, sliders = paginate(
+        query.order_by(Slider.created_at.desc()),
+        offset,
+        limit
     )
 
     return total_records, sliders
@@ -105,9 +102,7 @@ def list_sliders(db: Session, offset: int, limit: int):
         # Slider.is_active == True
     ).order_by(Slider.created_at.desc())
 
-    total_records = base_query.count()
-
-    sliders = base_query.offset(offset).limit(limit).all()
+    total_records, sliders = paginate(base_query, offset, limit)
 
     return total_records, sliders
 
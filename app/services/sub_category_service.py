@@ -13,6 +13,9 @@ from app.schemas.sub_category import SubCategoryCreate, SubCategoryUpdate
 from app.core.exceptions import AppException
 
 from app.core.search import apply_trigram_search
+from app.services.product_search_service import refresh_product_search_documents
+from app.core.pagination import paginate, invalidate_list_counts
+from app.core.search_cache import invalidate_search_cache
 
 
 def search_sub_categories(
@@ -53,14 +56,10 @@ def search_sub_categories(
         ]
     )
 
-    total = query.count()
-
-    sub_categories = (
-        query
-        .order_by(SubCategory.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, sub_categories = paginate(
+        query.order_by(SubCategory.created_at.desc()),
+        offset,
+        limit
     )
 
     return total, sub_categories
@@ -176,9 +175,7 @@ def list_sub_categories(db: Session, offset: int, limit: int):
         # SubCategory.is_active == True
     ).order_by(SubCategory.created_at.desc())
 
-    total_records = base_query.count()
-
-    sub_categories = base_query.offset(offset).limit(limit).all()
+    total_records, sub_categories = paginate(base_query, offset, limit)
 
     return total_records, sub_categories
 
@@ -225,6 +222,9 @@ def update_sub_category(
         sub_category.sub_category_name = data.sub_category_name
         sub_category.slug = new_slug
 
+        # Products of this sub-category carry its name in their search documents
+        refresh_product_search_documents(db, sub_category_ids=[sub_category.id])
+
     if data.is_active is not None:
         sub_category.is_active = data.is_active
 
@@ -235,6 +235,8 @@ def update_sub_category(
     sub_category.updated_at = func.now()
 
     db.commit()
+    invalidate_list_counts("products")
+    invalidate_search_cache("products")
     db.refresh(sub_category)
     # return sub_category
 
@@ -0,0 +1,155 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+from jose import jwt, JWTError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    TOKEN_REVOCATION_BLOOM_CAPACITY,
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE
+)
+from app.core.security import SECRET_KEY, ALGORITHM, token_id
+from app.models.token_blacklist import TokenBlacklist
+from app.utils.bloom_filter import BloomFilter
+
+
+# ============================================================
+# TOKEN REVOCATION STORE
+# token_blacklist is the source of truth; every worker keeps:
+# - a Bloom filter of revoked jtis: a token that is not in it
+#   (the common case) is accepted without any lock or query
+# - the exact jti -> expiry map, which settles Bloom hits
+# Entries live until the token's own exp, then are dropped
+# here and purged from the table.
+# Logouts on this worker apply at once, logouts on other
+# workers within TOKEN_REVOCATION_SYNC_SECONDS (scheduler)
+# ============================================================
+
+# Rows committed slightly out of created_at order are still
+# picked up by the next sync
+SYNC_OVERLAP = timedelta(seconds=60)
+
+_lock = threading.Lock()
+_revoked: dict[str, datetime] = {}
+_bloom = BloomFilter(TOKEN_REVOCATION_BLOOM_CAPACITY, TOKEN_REVOCATION_BLOOM_ERROR_RATE)
+_synced_until: datetime | None = None
+
+
+def _remember(jti: str, expires_at: datetime):
+    global _bloom
+
+    with _lock:
+        # Exact map first: a Bloom hit must always find its entry
+        _revoked[jti] = expires_at
+
+        # Past capacity the error rate climbs, rebuild bigger
+        if len(_bloom) >= _bloom.capacity:
+            _bloom = _build_bloom(_revoked)
+        else:
+            _bloom.add(jti)
+
+
+def _build_bloom(revoked: dict[str, datetime]) -> BloomFilter:
+    bloom = BloomFilter(
+        max(TOKEN_REVOCATION_BLOOM_CAPACITY, 2 * len(revoked)),
+        TOKEN_REVOCATION_BLOOM_ERROR_RATE
+    )
+    for jti in revoked:
+        bloom.add(jti)
+    return bloom
+
+
+# ============================================================
+# LOOKUP
+# ============================================================
+def is_token_revoked(db: Session, jti: str) -> bool:
+    # Store not loaded yet (startup failed / not run): load it
+    # once rather than trusting an empty filter
+    if _synced_until is None:
+        sync_revocations(db)
+
+    if jti not in _bloom:
+        return False
+
+    with _lock:
+        return jti in _revoked
+
+
+# ============================================================
+# REVOKE (LOGOUT)
+# Tokens that are invalid or already expired need no entry
+# ============================================================
+def revoke_tokens(db: Session, tokens: list[str]):
+    entries = {}
+
+    for token in tokens:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            continue
+
+        entries[token_id(token, payload)] = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+    if not entries:
+        return
+
+    stmt = insert(TokenBlacklist).values([
+        {"jti": jti, "expires_at": expires_at}
+        for jti, expires_at in entries.items()
+    ]).on_conflict_do_nothing(index_elements=[TokenBlacklist.jti])
+
+    db.execute(stmt)
+    db.commit()
+
+    for jti, expires_at in entries.items():
+        _remember(jti, expires_at)
+
+
+# ============================================================
+# SYNC (scheduled, every TOKEN_REVOCATION_SYNC_SECONDS)
+# First run loads every unexpired revocation, later runs only
+# rows created since the previous run
+# The watermark is the database clock (created_at is set by
+# now() there), so app / DB clock skew can not skip rows
+# ============================================================
+def sync_revocations(db: Session):
+    global _synced_until
+
+    started = db.execute(select(func.now())).scalar()
+
+    query = db.query(TokenBlacklist.jti, TokenBlacklist.expires_at).filter(
+        TokenBlacklist.expires_at > datetime.now(timezone.utc)
+    )
+
+    if _synced_until is not None:
+        query = query.filter(TokenBlacklist.created_at > _synced_until - SYNC_OVERLAP)
+
+    for jti, expires_at in query:
+        if jti not in _revoked:
+            _remember(jti, expires_at)
+
+    _synced_until = started
+
+
+# ============================================================
+# PURGE (scheduled, every TOKEN_REVOCATION_PURGE_SECONDS)
+# Expired tokens are rejected by their exp claim anyway
+# ============================================================
+def purge_expired_revocations(db: Session):
+    global _bloom
+
+    now = datetime.now(timezone.utc)
+
+    db.query(TokenBlacklist).filter(
+        TokenBlacklist.expires_at <= now
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    with _lock:
+        for jti in [jti for jti, expires_at in _revoked.items() if expires_at <= now]:
+            del _revoked[jti]
+
+        # Bloom filters can not forget: rebuild from what is left
+        _bloom = _build_bloom(_revoked)
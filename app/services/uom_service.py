@@ -10,6 +10,8 @@ from app.core.exceptions import AppException
 
 
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate, invalidate_list_counts
+from app.core.search_cache import invalidate_search_cache
 
 
 # ============================================================
@@ -45,14 +47,10 @@ def search_uoms(
         ]
     )
 
-    total = query.count()
-
-    uoms = (
-        query
-        .order_by(UOM.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, uoms = paginate(
+        query.order_by(UOM.created_at.desc()),
+        offset,
+        limit
     )
 
     return total, uoms
@@ -125,9 +123,7 @@ def list_uoms(db: Session, offset: int, limit: int):
         UOM.is_delete == False,
     ).order_by(UOM.created_at.desc())
 
-    total_records = base_query.count()
-
-    uoms = base_query.offset(offset).limit(limit).all()
+    total_records, uoms = paginate(base_query, offset, limit)
 
     return total_records, uoms
 
@@ -184,6 +180,9 @@ def update_uom(db: Session, uu_id: str, data: UOMUpdate):
 
     try:
         db.commit()
+        # UOM names are searched by product variant search
+        invalidate_list_counts("product_variants")
+        invalidate_search_cache("product_variants")
         db.refresh(uom)
         return uom
     except IntegrityError:
@@ -209,6 +208,9 @@ def soft_delete_uom(db: Session, uu_id: str):
 
     try:
         db.commit()
+        # UOM names are searched by product variant search
+        invalidate_list_counts("product_variants")
+        invalidate_search_cache("product_variants")
         db.refresh(uom)
         return uom
     except IntegrityError:
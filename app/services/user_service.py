@@ -21,6 +21,8 @@ from fastapi import UploadFile
 from sqlalchemy.sql import func
 import uuid
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate, list_count_key, invalidate_list_counts
+from app.services.principal_service import invalidate_principal
 
 
 MAX_IMAGE_SIZE = 1 * 1024 * 1024  # 1MB
@@ -56,13 +58,11 @@ def search_users(
         ]
     )
 
-    total = query.count()
-    products = (
-        query
-        .order_by(User.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    total, products = paginate(
+        query.order_by(User.created_at.desc()),
+        offset,
+        limit,
+        count_key=list_count_key("users", search)
     )
 
     return total, products
@@ -144,6 +144,7 @@ def create_user(db: Session, user: UserCreate, profile_image: UploadFile = None)
     try:
         db.add(db_user)
         db.commit()
+        invalidate_list_counts("users")
         db.refresh(db_user)
         return db_user
 
@@ -175,9 +176,12 @@ def get_users(db: Session, offset: int, limit: int):
         ).order_by(User.created_at.desc())
 
     
-    total_records = base_query.count()
-
-    users = base_query.offset(offset).limit(limit).all()
+    total_records, users = paginate(
+        base_query,
+        offset,
+        limit,
+        count_key=list_count_key("users")
+    )
 
     return total_records, users
 
@@ -252,7 +256,9 @@ def update_user(
 
     try:
         db.commit()
+        invalidate_list_counts("users")
         db.refresh(db_user)
+        invalidate_principal(db_user.id)
         return db_user
 
     except IntegrityError:
@@ -278,7 +284,9 @@ def soft_delete_user(db: Session,  uu_id: str):
 
     try:
         db.commit()
+        invalidate_list_counts("users")
         db.refresh(user)
+        invalidate_principal(user.id)
         return user
     except IntegrityError:
         db.rollback()
@@ -1,3 +1,4 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 import uuid
 import requests
@@ -62,22 +63,12 @@ def register_customer_send_otp(db: Session, data):
 # VERIFY OTP AND LOGIN (REGISTER FLOW)
 # ============================================================
 def verify_otp_and_login(db: Session, mobile: str, otp: str):
-    now = datetime.now(timezone.utc)
-
-    otp_entry = db.query(MobileOTP).filter(
-        MobileOTP.mobile == mobile,
-        MobileOTP.expires_at > now
-    ).order_by(MobileOTP.created_at.desc()).first()
-
-    if not otp_entry:
-        raise AppException(status=404, message="OTP not requested")
-
-    if otp_entry.otp != otp:
+    # OTP deleted here, committed with the activation below
+    if not consume_otp(db, mobile, otp):
+        if not has_pending_otp(db, mobile):
+            raise AppException(status=404, message="OTP not requested")
         raise AppException(status=401, message="Invalid OTP")
 
-    # delete OTP
-    db.delete(otp_entry)
-
     customer = db.query(Customer).filter(
         Customer.contact == mobile,
         Customer.is_delete == False
@@ -173,13 +164,10 @@ def send_otp(db: Session, mobile: str):
         # send_sms_via_textbee(mobile, existing_otp.otp)
         return existing_otp
 
-    # STEP 2: Delete expired OTPs
-    db.query(MobileOTP).filter(
-        MobileOTP.mobile == mobile,
-        MobileOTP.expires_at <= now
-    ).delete(synchronize_session=False)
+    # Expired OTPs are removed by the scheduled sweep
+    # (purge_expired_otps), not per request
 
-    # # STEP 3: Generate OTP
+    # # STEP 2: Generate OTP
     # otp_code = DEFAULT_OTP  # later replace with random generator
 
     otp_entry = MobileOTP(
@@ -201,30 +189,57 @@ def send_otp(db: Session, mobile: str):
 
 
 # ============================================================
-# VERIFY OTP (SIGN-IN FLOW)
+# CONSUME OTP (both verify flows)
+# - One DELETE ... RETURNING checks and uses the OTP at once:
+#   of two concurrent verifies only one can succeed
+# - Only a failed attempt runs a second query, to tell
+#   "not requested / expired" from "wrong OTP"
+# - Not committed here, the caller commits
 # ============================================================
-def verify_otp(db: Session, mobile: str, otp: str):
-    now = datetime.now(timezone.utc)
-    otp_entry = (
-        db.query(MobileOTP)
-        .filter(
+def consume_otp(db: Session, mobile: str, otp: str) -> bool:
+    consumed = db.execute(
+        delete(MobileOTP)
+        .where(
             MobileOTP.mobile == mobile,
-            MobileOTP.expires_at > now
+            MobileOTP.otp == otp,
+            MobileOTP.expires_at > datetime.now(timezone.utc)
         )
-        .order_by(MobileOTP.created_at.desc())
-        .first()
-    )
+        .returning(MobileOTP.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    return consumed is not None
 
-    if not otp_entry:
-        raise AppException(status=404, message="OTP not requested. Please request OTP first.")
 
-    if otp_entry.expires_at < datetime.now(timezone.utc):
-        raise AppException(status=401, message="OTP expired. Please request a new one.")
+def has_pending_otp(db: Session, mobile: str) -> bool:
+    return db.query(
+        db.query(MobileOTP.id).filter(
+            MobileOTP.mobile == mobile,
+            MobileOTP.expires_at > datetime.now(timezone.utc)
+        ).exists()
+    ).scalar()
+
 
-    if otp_entry.otp != otp:
+# ============================================================
+# PURGE EXPIRED OTPs (scheduled, every OTP_PURGE_SECONDS)
+# One bulk DELETE instead of per-mobile cleanup on every send
+# ============================================================
+def purge_expired_otps(db: Session):
+    db.query(MobileOTP).filter(
+        MobileOTP.expires_at <= datetime.now(timezone.utc)
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+# ============================================================
+# VERIFY OTP (SIGN-IN FLOW)
+# ============================================================
+def verify_otp(db: Session, mobile: str, otp: str):
+    if not consume_otp(db, mobile, otp):
+        if not has_pending_otp(db, mobile):
+            raise AppException(status=404, message="OTP not requested. Please request OTP first.")
         raise AppException(status=401, message="Incorrect OTP.")
 
-    db.delete(otp_entry)
     db.commit()
 
     customer = db.query(Customer).filter(
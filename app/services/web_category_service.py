@@ -2,6 +2,21 @@ from sqlalchemy.orm import Session
 from app.models.category import Category
 
 from app.models.main_category import MainCategory
+from app.core.pagination import paginate
+
+
+# Web CategoryResponse fields, in select order
+WEB_CATEGORY_FIELDS = (
+    "id",
+    "main_category_id",
+    "main_category_name",
+    "uu_id",
+    "category_name",
+    "slug",
+    "category_image",
+    "is_active",
+    "created_at",
+)
 
 
 # =====================================================
@@ -36,6 +51,7 @@ def web_category_with_main_name_query(db: Session):
 # =====================================================
 # LIST WEB CATEGORIES (PAGINATED)
 # Optionally filter by main_category_id
+# Rows come back as plain dicts, ready for json_bytes_response
 # =====================================================
 def list_web_categories(
     db: Session,
@@ -53,7 +69,9 @@ def list_web_categories(
 
     base_query = base_query.order_by(Category.created_at.desc())
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total_records, rows = paginate(base_query, offset, limit)
+
+    # zip stops before the trailing _total_count column
+    data = [dict(zip(WEB_CATEGORY_FIELDS, row)) for row in rows]
 
     return total_records, data
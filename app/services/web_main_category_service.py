@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.main_category import MainCategory
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -11,7 +12,6 @@ def list_web_main_categories(db: Session, offset: int, limit: int):
         MainCategory.is_active == True
     ).order_by(MainCategory.created_at.desc())
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+    total_records, data = paginate(base_query, offset, limit)
 
     return total_records, data
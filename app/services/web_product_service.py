@@ -1,41 +1,126 @@
-from sqlalchemy.orm import joinedload
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.core.pagination import paginate
+from app.services.product_search_service import apply_product_search
+from app.core.search import SEARCH_MODE_TRIGRAM
+from app.utils.suggest_index import get_suggest_index
+
+
+# Web ProductResponse fields (images added separately), in select order
+WEB_PRODUCT_FIELDS = (
+    "uu_id",
+    "category_id",
+    "sub_category_id",
+    "product_name",
+    "product_short_name",
+    "slug",
+    "short_description",
+    "long_description",
+    "hsn_code",
+    "sku_code",
+    "is_active",
+    "created_at",
+)
 
 
 # =====================================================
-# LIST WEB PRODUCTS (PAGINATED)
-# Used for website product listing
-# Supports category, sub-category & slug filters
+# FILTERS
+# Live products, optional category, sub-category & slug
+# search ranks matches first (trigram or full-text engine)
 # =====================================================
-def list_web_products(
-    db: Session,
-    offset: int,
-    limit: int,
+def filter_web_products(
+    query,
     category_id: int = None,
     sub_category_id: int = None,
-    slug: str | None = None, 
+    slug: str | None = None,
+    search: str | None = None,
+    search_mode: str = SEARCH_MODE_TRIGRAM,
 ):
-    base_query = db.query(Product).options(
-        joinedload(Product.images)
-    ).filter(
+    query = query.filter(
         Product.is_delete == False,
         Product.is_active == True
-    ).order_by(Product.created_at.desc())
+    )
 
     # Optional filters
     if category_id:
-        base_query = base_query.filter(Product.category_id == category_id)
+        query = query.filter(Product.category_id == category_id)
 
     if sub_category_id:
-        base_query = base_query.filter(Product.sub_category_id == sub_category_id)
+        query = query.filter(Product.sub_category_id == sub_category_id)
+
+    if slug:
+        query = query.filter(Product.slug == slug)
 
-    if slug:                          
-        base_query = base_query.filter(Product.slug == slug)
+    return apply_product_search(query, search, search_mode, live_only=True)
 
-    total_records = base_query.count()
-    data = base_query.offset(offset).limit(limit).all()
+
+# =====================================================
+# LIST WEB PRODUCT ROWS (PAGINATED)
+# Website product listing, category / sub-category / slug
+# filters and search, as plain dicts:
+# - one column-projected page query
+# - one images query for the page's product ids
+# (LIMIT / OFFSET apply to products, not product x image rows)
+# No ORM entities, ready for json_bytes_response
+# =====================================================
+def list_web_product_rows(
+    db: Session,
+    offset: int,
+    limit: int,
+    category_id: int = None,
+    sub_category_id: int = None,
+    slug: str | None = None,
+    search: str | None = None,
+    search_mode: str = SEARCH_MODE_TRIGRAM,
+):
+    base_query = db.query(
+        Product.id,
+        *(getattr(Product, field) for field in WEB_PRODUCT_FIELDS)
+    )
+
+    base_query = filter_web_products(
+        base_query, category_id, sub_category_id, slug, search, search_mode
+    ).order_by(Product.created_at.desc())
+
+    total_records, rows = paginate(base_query, offset, limit)
+
+    if not rows:
+        return total_records, []
+
+    images = {row[0]: [] for row in rows}
+
+    image_rows = db.query(
+        ProductImage.product_id,
+        ProductImage.product_image,
+        ProductImage.is_primary
+    ).filter(
+        ProductImage.product_id.in_(list(images))
+    ).order_by(ProductImage.id)
+
+    for product_id, product_image, is_primary in image_rows:
+        images[product_id].append({
+            "product_image": product_image,
+            "is_primary": is_primary,
+        })
+
+    data = []
+    for row in rows:
+        # row = (id, *WEB_PRODUCT_FIELDS, _total_count)
+        product = dict(zip(WEB_PRODUCT_FIELDS, row[1:]))
+        product["images"] = images[row[0]]
+        data.append(product)
 
     return total_records, data
 
 
+# =====================================================
+# SUGGEST (TYPEAHEAD)
+# Live product & category names starting with the query
+# Served from the process-local prefix index, no search
+# query hits the database (only an index build does)
+# =====================================================
+def suggest_products(db: Session, q: str, limit: int = 10):
+    index = get_suggest_index(db)
+
+    return [suggestion.to_dict() for suggestion in index.search(q, limit)]
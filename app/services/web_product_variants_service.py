@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Session,joinedload
-from app.utils.geo import point_in_polygon
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, contains_eager
+from app.core.pagination import paginate, encode_cursor, decode_cursor
+from app.services.zone_service import resolve_zones_at, find_nearest_deliverable_zone
 
 
 from app.models.product_variants import ProductVariants
 from app.models.zone import Zone
 from app.models.product import Product
+from app.models.product_image import ProductImage
 from app.models.uom import UOM
 from app.models.category import Category
 from app.models.sub_category import SubCategory
@@ -15,8 +18,16 @@ from app.models.main_category import MainCategory
 # BASE QUERY
 # Fetch product variants with related product, category,
 # main category, UOM, images & sub-category
+# - Tables already joined for filtering fill their
+#   relationships from the same row (contains_eager)
+# - Images (a collection) come from one extra IN query, so
+#   LIMIT / OFFSET apply to variants, not variant x image rows
+# - Only the columns the storefront response uses are loaded
+#   (no long_description etc.)
 # =====================================================
 def product_variant_with_product_uom_query(db: Session):
+    product = contains_eager(ProductVariants.product)
+
     return (
         db.query(ProductVariants)
         .join(Product, Product.id == ProductVariants.product_id)
@@ -24,23 +35,195 @@ def product_variant_with_product_uom_query(db: Session):
         .join(MainCategory, MainCategory.id == Category.main_category_id)
         .join(UOM, UOM.id == ProductVariants.uom_id)
         .options(
-            joinedload(ProductVariants.product)
-                .joinedload(Product.category)
-                .joinedload(Category.main_category),
-            joinedload(ProductVariants.product)
-                .joinedload(Product.sub_category),
-            joinedload(ProductVariants.product)
-                .joinedload(Product.images),
-            joinedload(ProductVariants.uom),
+            product.load_only(
+                Product.id,
+                Product.category_id,
+                Product.sub_category_id,
+                Product.product_name,
+                Product.slug
+            ),
+            product.contains_eager(Product.category)
+                .load_only(Category.id, Category.category_name, Category.main_category_id),
+            product.contains_eager(Product.category)
+                .contains_eager(Category.main_category)
+                .load_only(MainCategory.id, MainCategory.slug),
+            product.joinedload(Product.sub_category)
+                .load_only(SubCategory.id, SubCategory.sub_category_name),
+            product.selectinload(Product.images)
+                .load_only(ProductImage.product_image, ProductImage.is_primary, ProductImage.is_active),
+            contains_eager(ProductVariants.uom)
+                .load_only(UOM.id, UOM.uom_name, UOM.uom_short_name),
+        )
+    )
+
+
+# =====================================================
+# ROW QUERY (FAST PATH)
+# Same joins as the base query, selecting only the
+# storefront ProductVariantResponse columns as a flat row;
+# variant_row_to_dict() nests it like the response
+# =====================================================
+def product_variant_row_query(db: Session):
+    return (
+        db.query(
+            ProductVariants.id,
+            ProductVariants.uu_id,
+            ProductVariants.actual_price,
+            ProductVariants.selling_price,
+            ProductVariants.is_deliverable,
+            ProductVariants.is_active,
+            ProductVariants.created_at,
+            Product.id,
+            Product.product_name,
+            Product.slug,
+            Category.id,
+            Category.category_name,
+            SubCategory.id,
+            SubCategory.sub_category_name,
+            UOM.id,
+            UOM.uom_name,
+            UOM.uom_short_name,
+        )
+        .select_from(ProductVariants)
+        .join(Product, Product.id == ProductVariants.product_id)
+        .join(Category, Category.id == Product.category_id)
+        .join(MainCategory, MainCategory.id == Category.main_category_id)
+        .join(UOM, UOM.id == ProductVariants.uom_id)
+        .outerjoin(SubCategory, SubCategory.id == Product.sub_category_id)
+    )
+
+
+def variant_row_to_dict(row) -> dict:
+    (
+        variant_id, uu_id, actual_price, selling_price, is_deliverable, is_active, created_at,
+        product_id, product_name, slug,
+        category_id, category_name,
+        sub_category_id, sub_category_name,
+        uom_id, uom_name, uom_short_name,
+    ) = row[:17]  # paginate() appends _total_count
+
+    return {
+        "id": variant_id,
+        "uu_id": uu_id,
+        "actual_price": actual_price,
+        "selling_price": selling_price,
+        "is_deliverable": is_deliverable,
+        "is_active": is_active,
+        "created_at": created_at,
+        "product": {
+            "id": product_id,
+            "product_name": product_name,
+            "slug": slug,
+            # Product.product_image reads ProductImage.is_delete, which
+            # the model does not have, so the ORM response always falls
+            # back to None; kept identical here without an image query
+            "product_image": None,
+            "category": {
+                "id": category_id,
+                "category_name": category_name,
+            },
+            "sub_category": {
+                "id": sub_category_id,
+                "sub_category_name": sub_category_name,
+            } if sub_category_id is not None else None,
+        },
+        "uom": {
+            "id": uom_id,
+            "uom_name": uom_name,
+            "uom_short_name": uom_short_name,
+        },
+    }
+
+
+
+# =====================================================
+# NOT SERVICEABLE MESSAGE
+# Optionally points the customer to the nearest
+# deliverable zone ("we deliver 1.2 km away")
+# =====================================================
+def not_serviceable_message(
+    db: Session,
+    lat: float,
+    lng: float,
+    message: str,
+    include_nearest: bool
+) -> str:
+    if not include_nearest:
+        return message
+
+    nearest = find_nearest_deliverable_zone(db, lat, lng)
+    if not nearest:
+        return message
+
+    return f"{message}, we deliver {nearest['distance_km']:.1f} km away"
+
+
+
+# =====================================================
+# DELIVERABLE ZONES AT A LOCATION
+# returns (zone_ids, None) or (None, error message)
+# =====================================================
+def resolve_deliverable_zone_ids(
+    db: Session,
+    lat: float,
+    lng: float,
+    include_nearest: bool = False
+):
+    # Spatial index / PostGIS, see zone_service.resolve_zones_at
+    matching_zones = resolve_zones_at(db, lat, lng, use_cell_cache=True)
+
+    # Check if point is in any zone
+    if not matching_zones:
+        return None, not_serviceable_message(
+            db, lat, lng, "Location is outside our service area", include_nearest
+        )
+
+    # Check if any matching zone is deliverable
+    deliverable_zone_ids = [z.id for z in matching_zones if z.is_deliverable]
+    
+    if not deliverable_zone_ids:
+        return None, not_serviceable_message(
+            db, lat, lng, "Delivery is not available in this area", include_nearest
         )
+
+    return deliverable_zone_ids, None
+
+
+
+# =====================================================
+# STOREFRONT VARIANTS QUERY (no ordering)
+# Live variants in the given zones, optional main category
+# rows=True selects flat response rows (fast path) instead
+# of ProductVariants entities
+# =====================================================
+def storefront_variants_query(
+    db: Session,
+    zone_ids: list[int],
+    main_category_slug: str | None = None,
+    rows: bool = False
+):
+    query = product_variant_row_query(db) if rows else product_variant_with_product_uom_query(db)
+
+    query = query.filter(
+        ProductVariants.zone_id.in_(zone_ids),
+        ProductVariants.is_delete == False,
+        ProductVariants.is_active == True
     )
 
+    if main_category_slug:   # MAIN CATEGORY FILTER
+        query = query.filter(
+            MainCategory.slug == main_category_slug
+        )
+
+    return query
+
 
 
 # =====================================================
 # LIST ALL PRODUCT VARIANTS (ZONE-BASED)
 # Used for website  product listing
 # Includes geo-location & category filtering
+# Variants come back as response dicts (fast path)
 # =====================================================
 def list_all_product_variants(
     db: Session,
@@ -49,57 +232,76 @@ def list_all_product_variants(
     offset: int,
     limit: int,
     main_category_slug: str | None = None,
+    include_nearest: bool = False,
 ):
     # ----------------------------------
     # 1. Find zones that contain the point
     # ----------------------------------
-    zones = db.query(Zone).filter(
-        Zone.is_delete == False,
-        Zone.is_active == True
-    ).all()
+    deliverable_zone_ids, error_message = resolve_deliverable_zone_ids(
+        db, lat, lng, include_nearest
+    )
 
-    matching_zones = [
-        z for z in zones
-        if point_in_polygon(lat, lng, z.polygon)
-    ]
-
-    # Check if point is in any zone
-    if not matching_zones:
-        return None, None, "Location is outside our service area"
-
-    # Check if any matching zone is deliverable
-    deliverable_zone_ids = [z.id for z in matching_zones if z.is_deliverable]
-    
-    if not deliverable_zone_ids:
-        return None, None, "Delivery is not available in this area"
+    if error_message:
+        return None, None, error_message
 
     # ----------------------------------
     # 2. Product Variants + Product + UOM
     # ----------------------------------
     base_query = (
-        product_variant_with_product_uom_query(db)
-        .filter(
-            ProductVariants.zone_id.in_(deliverable_zone_ids),
-            ProductVariants.is_delete == False,
-            ProductVariants.is_active == True
-        )
+        storefront_variants_query(db, deliverable_zone_ids, main_category_slug, rows=True)
         .order_by(ProductVariants.created_at.desc())
     )
 
-    if main_category_slug:   # MAIN CATEGORY FILTER
-        base_query = base_query.filter(
-            MainCategory.slug == main_category_slug
-        )
+    total_records, rows = paginate(base_query, offset, limit)
+
+    return total_records, [variant_row_to_dict(row) for row in rows], None
+
+
+
+# =====================================================
+# LIST PRODUCT VARIANTS BY CURSOR (infinite scroll)
+# Seeks on (created_at, id) instead of OFFSET:
+# - constant cost however deep the client scrolls
+# - rows inserted between requests never shift pages
+# returns (variants, next_cursor, error message)
+# =====================================================
+def list_product_variants_by_cursor(
+    db: Session,
+    lat: float,
+    lng: float,
+    limit: int,
+    cursor: str | None = None,
+    main_category_slug: str | None = None,
+    include_nearest: bool = False,
+):
+    deliverable_zone_ids, error_message = resolve_deliverable_zone_ids(
+        db, lat, lng, include_nearest
+    )
+
+    if error_message:
+        return None, None, error_message
 
-    base_query = base_query.order_by(ProductVariants.created_at.desc())
+    query = storefront_variants_query(db, deliverable_zone_ids, main_category_slug, rows=True)
 
-    total_records = base_query.count()
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(ProductVariants.created_at, ProductVariants.id) < tuple_(created_at, last_id)
+        )
 
-    variants = (
-        base_query
-        .offset(offset)
-        .limit(limit)
+    # One extra row tells whether another page exists
+    rows = (
+        query
+        .order_by(ProductVariants.created_at.desc(), ProductVariants.id.desc())
+        .limit(limit + 1)
         .all()
     )
 
-    return total_records, variants, None
\ No newline at end of file
+    variants = [variant_row_to_dict(row) for row in rows[:limit]]
+    next_cursor = None
+
+    if len(rows) > limit:
+        last = variants[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    return variants, next_cursor, None
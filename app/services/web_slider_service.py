@@ -6,6 +6,7 @@ from app.models.slider import Slider
 from app.core.exceptions import AppException
 
 from sqlalchemy.sql import func
+from app.core.pagination import paginate
 
 
 # =====================================================
@@ -22,9 +23,7 @@ def list_sliders(db: Session, offset: int, limit: int):
         Slider.is_active == True
     ).order_by(Slider.created_at.desc())
 
-    total_records = base_query.count()
-
-    sliders = base_query.offset(offset).limit(limit).all()
+    total_records, sliders = paginate(base_query, offset, limit)
 
     return total_records, sliders
 
@@ -1,13 +1,34 @@
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
-from app.models.zone import Zone
+from app.models.zone import Zone, lat_lng_box
 from app.schemas.zone import ZoneCreate, ZoneUpdate
 from app.core.exceptions import AppException
+from app.core.config import NEAREST_ZONE_MAX_KM
 from sqlalchemy.exc import IntegrityError
-from app.utils.geo import point_in_polygon
-from app.models.zone import Zone
+from app.utils.geo import polygon_bounds
+from app.utils.zone_index import (
+    get_zone_index,
+    invalidate_zone_index,
+    lookup_with_cell_cache,
+    batch_lookup
+)
+from app.utils.polygon_overlap import (
+    overlap_area_km2,
+    find_overlapping_pairs,
+    MIN_OVERLAP_AREA_KM2
+)
+from app.utils.zone_postgis import (
+    postgis_enabled,
+    sync_zone_geometry,
+    find_zones_containing,
+    find_overlapping_zones,
+    find_nearest_deliverable_zone as postgis_nearest_deliverable_zone
+)
 
 from app.core.search import apply_trigram_search
+from app.core.pagination import paginate, invalidate_list_counts
+from app.core.search_cache import cached_search, search_cache_key, invalidate_search_cache
 
 def search_zones(
     db: Session,
@@ -15,53 +36,90 @@ def search_zones(
     offset: int,
     limit: int
 ):
-    query = (
+    base_query = (
         db.query(Zone)
         .filter(
             Zone.is_delete == False
         )
     )
 
-    # Apply trigram similarity search
-    query = apply_trigram_search(
-        query=query,
-        search=search,
-        fields=[
-            Zone.zone_name,
-            Zone.city,
-            Zone.state
-        ],
-        order_fields=[
-            Zone.zone_name,
-            Zone.city,
-            Zone.state
-        ]
-    )
+    def run_search():
+        # Apply trigram similarity search
+        query = apply_trigram_search(
+            query=base_query,
+            search=search,
+            fields=[
+                Zone.zone_name,
+                Zone.city,
+                Zone.state
+            ],
+            order_fields=[
+                Zone.zone_name,
+                Zone.city,
+                Zone.state
+            ]
+        )
 
-    total = query.count()
+        return paginate(
+            query.order_by(Zone.created_at.desc()),
+            offset,
+            limit
+        )
 
-    zones = (
-        query
-        .order_by(Zone.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    return cached_search(
+        search_cache_key("zones", search, offset, limit),
+        base_query,
+        Zone.id,
+        run_search
     )
 
-    return total, zones
+
+# ============================================================
+# BOUNDING BOX HELPERS
+# ============================================================
+def set_polygon_bounds(zone: Zone, polygon: list[dict]):
+    zone.min_lat, zone.max_lat, zone.min_lng, zone.max_lng = polygon_bounds(polygon)
+
+
+def zone_bbox_overlaps(polygon: list[dict]):
+    """
+    SQL filter: zone bbox overlaps the polygon's bbox
+    Written as box && box so the GiST index ix_zones_bbox serves it
+    """
+    min_lat, max_lat, min_lng, max_lng = polygon_bounds(polygon)
+
+    return lat_lng_box(Zone.min_lat, Zone.max_lat, Zone.min_lng, Zone.max_lng).op("&&")(
+        lat_lng_box(min_lat, max_lat, min_lng, max_lng)
+    )
 
 
 # ============================================================
 # POLYGON UNIQUENESS VALIDATION
+# - Rejects a polygon whose area overlaps any active zone
+# - Catches edge crossings even when no vertex is contained
 # ============================================================
 def validate_polygon_uniqueness(
     db: Session,
     polygon: list[dict],
     exclude_zone_id: int | None = None
 ):
+    if postgis_enabled(db):
+        overlapping = find_overlapping_zones(db, polygon, exclude_zone_id)
+        if overlapping:
+            raise AppException(
+                status=400,
+                message=(
+                    f"Polygon overlaps existing zone '{overlapping[0].zone_name}' "
+                    f"({overlapping[0].overlap_area_km2:.4f} sq km)"
+                )
+            )
+        return
+
+    # Only zones whose bbox overlaps the new polygon can clash
     zones = db.query(Zone).filter(
         Zone.is_delete == False,
-        Zone.is_active == True
+        Zone.is_active == True,
+        zone_bbox_overlaps(polygon)
     ).all()
 
     for zone in zones:
@@ -71,15 +129,23 @@ def validate_polygon_uniqueness(
         if not zone.polygon:
             continue
 
-        for point in polygon:
-            if point_in_polygon(point["lat"], point["lng"], zone.polygon):
-                raise AppException(
-                    status=400,
-                    message=(
-                        f"Lat/Lng ({point['lat']}, {point['lng']}) "
-                        f"already exists inside zone '{zone.zone_name}'"
-                    )
+        area = overlap_area_km2(polygon, zone.polygon)
+        if area > MIN_OVERLAP_AREA_KM2:
+            raise AppException(
+                status=400,
+                message=(
+                    f"Polygon overlaps existing zone '{zone.zone_name}' "
+                    f"({area:.4f} sq km)"
                 )
+            )
+
+
+# ============================================================
+# OVERLAP REPORT
+# All overlapping pairs among active zones with overlap area
+# ============================================================
+def list_zone_overlaps(db: Session):
+    return find_overlapping_pairs(get_zone_index(db).zones)
 
 
 # ============================================================
@@ -96,10 +162,16 @@ def create_zone(db: Session, data: ZoneCreate):
         is_deliverable=data.is_deliverable,
         is_active=data.is_active
     )
+    set_polygon_bounds(zone, data.polygon)
 
     db.add(zone)
+    db.flush()
+    sync_zone_geometry(db, zone.id, data.polygon)
     db.commit()
     db.refresh(zone)
+    invalidate_zone_index()
+    invalidate_list_counts("zones", "product_variants")
+    invalidate_search_cache("zones", "product_variants")
     return zone
 
 
@@ -114,9 +186,7 @@ def list_zones(db: Session, offset: int, limit: int):
         Zone.is_delete == False
     ).order_by(Zone.created_at.desc())
 
-    total_records = base_query.count()
-
-    zones = base_query.offset(offset).limit(limit).all()
+    total_records, zones = paginate(base_query, offset, limit)
 
     return total_records, zones
 
@@ -152,6 +222,8 @@ def update_zone(db: Session, zone_id: int, data: ZoneUpdate):
 
     if data.polygon is not None:
         zone.polygon = data.polygon
+        set_polygon_bounds(zone, data.polygon)
+        sync_zone_geometry(db, zone.id, data.polygon)
 
     if data.is_deliverable is not None:
         zone.is_deliverable = data.is_deliverable
@@ -164,6 +236,9 @@ def update_zone(db: Session, zone_id: int, data: ZoneUpdate):
 
     db.commit()
     db.refresh(zone)
+    invalidate_zone_index()
+    invalidate_list_counts("zones", "product_variants")
+    invalidate_search_cache("zones", "product_variants")
     return zone
 
 
@@ -187,27 +262,98 @@ def delete_zone(db: Session, zone_id: int):
     try:
         db.commit()
         db.refresh(zone)
+        invalidate_zone_index()
+        invalidate_list_counts("zones", "product_variants")
+        invalidate_search_cache("zones", "product_variants")
         return zone
     except IntegrityError:
         db.rollback()
         raise AppException(status=500, message="Database error while deleting zone")
 
+# ============================================================
+# RESOLVE ZONES AT A POINT
+# Returns lightweight rows (id, zone_name, is_deliverable)
+# - PostGIS ST_Contains when that backend is enabled
+# - In-memory spatial index otherwise, optionally behind the
+#   grid cell cache (storefront traffic)
+# ============================================================
+def resolve_zones_at(db: Session, lat: float, lng: float, use_cell_cache: bool = False):
+    if postgis_enabled(db):
+        return find_zones_containing(db, lat, lng)
+
+    index = get_zone_index(db)
+    if use_cell_cache:
+        return lookup_with_cell_cache(index, lat, lng)
+
+    return index.lookup(lat, lng)
+
+
+# ============================================================
+# NEAREST DELIVERABLE ZONE
+# Fallback for points outside every deliverable zone
+# (a point inside one gets it back at 0 km on both backends)
+# returns {zone_id, zone_name, distance_km} or None
+# ============================================================
+def find_nearest_deliverable_zone(
+    db: Session,
+    lat: float,
+    lng: float,
+    max_km: float = NEAREST_ZONE_MAX_KM
+):
+    if postgis_enabled(db):
+        row = postgis_nearest_deliverable_zone(db, lat, lng, max_km)
+        if not row:
+            return None
+        return {"zone_id": row.id, "zone_name": row.zone_name, "distance_km": row.distance_km}
+
+    found = get_zone_index(db).nearest_deliverable(lat, lng, max_km)
+    if not found:
+        return None
+
+    zone, distance_km = found
+    return {"zone_id": zone.id, "zone_name": zone.zone_name, "distance_km": distance_km}
+
+
 # ============================================================
 # GET ZONES BY LAT / LNG
+# resolve_zones_at already did the exact containment test,
+# this only loads the full rows by primary key
 # ============================================================
 def get_zones_by_lat_lng(db, lat: float, lng: float):
-    zones = db.query(Zone).filter(
+    matched_ids = [z.id for z in resolve_zones_at(db, lat, lng)]
+
+    if not matched_ids:
+        return []
+
+    matched_zones = db.query(Zone).filter(
+        Zone.id.in_(matched_ids),
         Zone.is_delete == False,
         Zone.is_active == True
     ).all()
 
-    matched_zones = []
+    return matched_zones
+
 
-    for zone in zones:
-        if zone.polygon and point_in_polygon(lat, lng, zone.polygon):
-            matched_zones.append(zone)
 
-    return matched_zones
+# ============================================================
+# BATCH SERVICEABILITY CHECK
+# Vectorised per zone, see zone_index.batch_lookup
+# ============================================================
+def check_serviceability(db: Session, points: list[dict]):
+    lats = np.array([p["lat"] for p in points], dtype=np.float64)
+    lngs = np.array([p["lng"] for p in points], dtype=np.float64)
+
+    zone_ids, deliverable = batch_lookup(get_zone_index(db).zones, lats, lngs)
+
+    return [
+        {
+            "lat": point["lat"],
+            "lng": point["lng"],
+            "zone_ids": zone_ids[i],
+            "is_deliverable": bool(deliverable[i]),
+        }
+        for i, point in enumerate(points)
+    ]
 
 
 
@@ -0,0 +1,151 @@
+from array import array
+
+import numpy as np
+
+from app.core.cache import LRUCache
+
+
+# ============================================================
+# COMPILED POLYGON
+# Array-backed form of a zone polygon for repeated lookups
+# - Vertex coordinates in array('d') buffers (no dict access)
+# - Per edge: y range, x range, start vertex and slope
+# - Edges bucketed into horizontal bands, so a lookup only
+#   visits the edges that can cross the point's latitude
+# Same crossing rule as app.utils.geo.point_in_polygon
+# ============================================================
+
+# Roughly this many edges per band
+EDGES_PER_BAND = 4
+MAX_BANDS = 1024
+
+# Compiled polygons kept across index rebuilds
+COMPILED_POLYGON_CACHE_SIZE = 4096
+
+
+class CompiledPolygon:
+    __slots__ = (
+        "xs",
+        "ys",
+        "min_lat",
+        "max_lat",
+        "min_lng",
+        "max_lng",
+        "edge_ylo",
+        "edge_yhi",
+        "edge_xlo",
+        "edge_xhi",
+        "edge_x0",
+        "edge_y0",
+        "edge_slope",
+        "_bands",
+        "_band_count",
+        "_band_scale",
+    )
+
+    def __init__(self, polygon: list[dict]):
+        self.xs = array("d", [p["lng"] for p in polygon])
+        self.ys = array("d", [p["lat"] for p in polygon])
+
+        self.min_lat, self.max_lat = min(self.ys), max(self.ys)
+        self.min_lng, self.max_lng = min(self.xs), max(self.xs)
+
+        self.edge_ylo = array("d")
+        self.edge_yhi = array("d")
+        self.edge_xlo = array("d")
+        self.edge_xhi = array("d")
+        self.edge_x0 = array("d")
+        self.edge_y0 = array("d")
+        self.edge_slope = array("d")
+
+        n = len(self.xs)
+        for i in range(n):
+            xi, yi = self.xs[i], self.ys[i]
+            xj, yj = self.xs[i - 1], self.ys[i - 1]
+
+            denom = yj - yi + 1e-9
+            self.edge_ylo.append(min(yi, yj))
+            self.edge_yhi.append(max(yi, yj))
+            self.edge_xlo.append(min(xi, xj))
+            self.edge_xhi.append(max(xi, xj))
+            self.edge_x0.append(xi)
+            self.edge_y0.append(yi)
+            self.edge_slope.append((xj - xi) / denom if denom else 0.0)
+
+        self._build_bands(n)
+
+    def _build_bands(self, n: int):
+        self._band_count = max(1, min(MAX_BANDS, n // EDGES_PER_BAND))
+        height = self.max_lat - self.min_lat
+        self._band_scale = self._band_count / height if height > 0 else 0.0
+
+        bands = [[] for _ in range(self._band_count)]
+        for k in range(n):
+            # Horizontal edges never cross a ray
+            if self.edge_ylo[k] == self.edge_yhi[k]:
+                continue
+            for b in range(self._band(self.edge_ylo[k]), self._band(self.edge_yhi[k]) + 1):
+                bands[b].append(k)
+
+        self._bands = [tuple(band) for band in bands]
+
+    def _band(self, lat: float) -> int:
+        b = int((lat - self.min_lat) * self._band_scale)
+        return min(max(b, 0), self._band_count - 1)
+
+    @property
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """(lngs, lats) float64 views for vectorised batch tests"""
+        return np.frombuffer(self.xs, dtype=np.float64), np.frombuffer(self.ys, dtype=np.float64)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        if not (self.min_lat <= lat <= self.max_lat and self.min_lng <= lng <= self.max_lng):
+            return False
+
+        ylo, yhi = self.edge_ylo, self.edge_yhi
+        xlo, xhi = self.edge_xlo, self.edge_xhi
+        x0, y0, slope = self.edge_x0, self.edge_y0, self.edge_slope
+
+        inside = False
+        for k in self._bands[self._band(lat)]:
+            # Exactly one endpoint above the ray
+            if not (ylo[k] <= lat < yhi[k]):
+                continue
+            # Left of the whole edge always crosses, right never does
+            if lng < xlo[k] or (lng < xhi[k] and lng < slope[k] * (lat - y0[k]) + x0[k]):
+                inside = not inside
+
+        return inside
+
+    def edges_in_box(self, box: tuple[float, float, float, float]):
+        """
+        Edges whose bbox meets box = (min_lat, max_lat, min_lng, max_lng)
+        yields (lat1, lng1, lat2, lng2)
+        """
+        min_lat, max_lat, min_lng, max_lng = box
+        xs, ys = self.xs, self.ys
+
+        for k in range(len(xs)):
+            if self.edge_yhi[k] < min_lat or self.edge_ylo[k] > max_lat or \
+                    self.edge_xhi[k] < min_lng or self.edge_xlo[k] > max_lng:
+                continue
+            yield ys[k - 1], xs[k - 1], ys[k], xs[k]
+
+
+# ============================================================
+# PER ZONE VERSION CACHE
+# Keyed on (zone id, updated_at): a rebuilt zone index reuses
+# the compiled form of every zone that did not change
+# ============================================================
+_compiled_cache = LRUCache("compiled_polygons", maxsize=COMPILED_POLYGON_CACHE_SIZE)
+
+
+def get_compiled_polygon(zone_id: int, version, polygon: list[dict]) -> CompiledPolygon:
+    key = (zone_id, version)
+
+    compiled = _compiled_cache.get(key)
+    if compiled is None:
+        compiled = CompiledPolygon(polygon)
+        _compiled_cache.set(key, compiled)
+
+    return compiled
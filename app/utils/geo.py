@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def point_in_polygon(lat: float, lng: float, polygon: list[dict]) -> bool:
     """
     Ray Casting Algorithm
@@ -22,3 +25,88 @@ def point_in_polygon(lat: float, lng: float, polygon: list[dict]) -> bool:
             inside = not inside
 
     return inside
+
+
+def polygon_bounds(polygon: list[dict]) -> tuple[float, float, float, float]:
+    """
+    Bounding box of a polygon
+    returns (min_lat, max_lat, min_lng, max_lng)
+    """
+    lats = [p["lat"] for p in polygon]
+    lngs = [p["lng"] for p in polygon]
+
+    return min(lats), max(lats), min(lngs), max(lngs)
+
+
+def compile_polygon(polygon: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array form of a polygon for vectorised tests
+    returns (lngs, lats) as float64 arrays
+    """
+    lngs = np.array([p["lng"] for p in polygon], dtype=np.float64)
+    lats = np.array([p["lat"] for p in polygon], dtype=np.float64)
+
+    return lngs, lats
+
+
+def points_in_polygon(
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    compiled: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """
+    Vectorised Ray Casting over many points at once
+    Same edge rule as point_in_polygon, loops over edges
+    and tests every point against each edge in one pass
+    """
+    xs, ys = compiled
+    inside = np.zeros(lats.shape, dtype=bool)
+
+    for i in range(len(xs)):
+        j = i - 1
+        xi, yi = xs[i], ys[i]
+        xj, yj = xs[j], ys[j]
+
+        intersect = ((yi > lats) != (yj > lats)) & \
+                    (lngs < (xj - xi) * (lats - yi) / (yj - yi + 1e-9) + xi)
+        inside ^= intersect
+
+    return inside
+
+
+def segment_intersects_box(
+    lat1: float, lng1: float,
+    lat2: float, lng2: float,
+    box: tuple[float, float, float, float]
+) -> bool:
+    """
+    Liang-Barsky test: does the segment touch the closed box
+    box = (min_lat, max_lat, min_lng, max_lng)
+    """
+    min_lat, max_lat, min_lng, max_lng = box
+    dx = lng2 - lng1
+    dy = lat2 - lat1
+
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, lng1 - min_lng),
+        (dx, max_lng - lng1),
+        (-dy, lat1 - min_lat),
+        (dy, max_lat - lat1),
+    ):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+
+        t = q / p
+        if p < 0:
+            if t > t1:
+                return False
+            t0 = max(t0, t)
+        else:
+            if t < t0:
+                return False
+            t1 = min(t1, t)
+
+    return True
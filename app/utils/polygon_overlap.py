@@ -0,0 +1,281 @@
+import math
+
+from app.utils.geo import polygon_bounds
+
+
+# ============================================================
+# POLYGON OVERLAP ENGINE
+# - Bounding box check first
+# - Sweep-line over edges to find crossing edge pairs
+# - Exact overlap area from the boundary of A ∩ B:
+#   edges of A inside B + edges of B inside A (Green's theorem)
+# Coordinates are projected to a local km plane, so the area
+# is reported in square kilometres
+# ============================================================
+
+# Overlaps smaller than this (~1 m²) are drawing noise
+# between neighbouring zones, not real overlaps
+MIN_OVERLAP_AREA_KM2 = 1e-6
+
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LNG = 111.320
+
+EPS = 1e-12
+
+
+def bboxes_overlap(a: tuple, b: tuple) -> bool:
+    """a, b = (min_lat, max_lat, min_lng, max_lng)"""
+    return a[0] <= b[1] and b[0] <= a[1] and a[2] <= b[3] and b[2] <= a[3]
+
+
+# ------------------------------------------------------------
+# GEOMETRY PRIMITIVES (projected points = (x, y) tuples)
+# ------------------------------------------------------------
+def _project(polygon: list[dict], lat0: float, lng0: float, cos_lat0: float) -> list[tuple]:
+    return [
+        (
+            (p["lng"] - lng0) * KM_PER_DEGREE_LNG * cos_lat0,
+            (p["lat"] - lat0) * KM_PER_DEGREE_LAT
+        )
+        for p in polygon
+    ]
+
+
+def _signed_area2(pts: list[tuple]) -> float:
+    total = 0.0
+    n = len(pts)
+    for i in range(n):
+        x1, y1 = pts[i - 1]
+        x2, y2 = pts[i]
+        total += x1 * y2 - x2 * y1
+    return total
+
+
+def _ccw(pts: list[tuple]) -> list[tuple]:
+    return pts if _signed_area2(pts) >= 0 else pts[::-1]
+
+
+def _inside(x: float, y: float, pts: list[tuple]) -> bool:
+    # Same ray casting rule as app.utils.geo.point_in_polygon
+    inside = False
+    n = len(pts)
+    for i in range(n):
+        xi, yi = pts[i]
+        xj, yj = pts[i - 1]
+        if ((yi > y) != (yj > y)) and \
+                (x < (xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi):
+            inside = not inside
+    return inside
+
+
+def _split_params(p1, p2, q1, q2) -> list[float]:
+    """
+    Parameters t on p1->p2 where it meets q1->q2
+    (both endpoints of the shared part for collinear overlap)
+    """
+    rx, ry = p2[0] - p1[0], p2[1] - p1[1]
+    sx, sy = q2[0] - q1[0], q2[1] - q1[1]
+    qpx, qpy = q1[0] - p1[0], q1[1] - p1[1]
+
+    denom = rx * sy - ry * sx
+    rr = rx * rx + ry * ry
+
+    if abs(denom) <= EPS * max(rr, 1.0):
+        # Parallel: only collinear overlap matters
+        if abs(qpx * ry - qpy * rx) > EPS * max(rr, 1.0) or rr == 0:
+            return []
+        t0 = (qpx * rx + qpy * ry) / rr
+        t1 = ((q2[0] - p1[0]) * rx + (q2[1] - p1[1]) * ry) / rr
+        lo, hi = max(min(t0, t1), 0.0), min(max(t0, t1), 1.0)
+        return [lo, hi] if lo <= hi else []
+
+    t = (qpx * sy - qpy * sx) / denom
+    u = (qpx * ry - qpy * rx) / denom
+    if -EPS <= t <= 1 + EPS and -EPS <= u <= 1 + EPS:
+        return [min(max(t, 0.0), 1.0)]
+    return []
+
+
+def _on_segment(m, q1, q2) -> bool:
+    sx, sy = q2[0] - q1[0], q2[1] - q1[1]
+    ss = sx * sx + sy * sy
+    if ss == 0:
+        return False
+    mx, my = m[0] - q1[0], m[1] - q1[1]
+    if abs(mx * sy - my * sx) > 1e-9 * math.sqrt(ss):
+        return False
+    dot = mx * sx + my * sy
+    return -EPS <= dot <= ss + EPS
+
+
+# ------------------------------------------------------------
+# SWEEP-LINE EDGE INTERSECTION
+# Edges of both polygons sorted by min x; each edge is tested
+# only against still-active edges of the OTHER polygon whose
+# x and y ranges overlap it
+# ------------------------------------------------------------
+def _crossing_edges(a: list[tuple], b: list[tuple]) -> tuple[dict, dict]:
+    events = []
+    for tag, pts in ((0, a), (1, b)):
+        for i in range(len(pts)):
+            p1, p2 = pts[i - 1], pts[i]
+            events.append((
+                min(p1[0], p2[0]), max(p1[0], p2[0]),
+                min(p1[1], p2[1]), max(p1[1], p2[1]),
+                tag, i
+            ))
+    events.sort()
+
+    active = ([], [])
+    hits_a: dict[int, list[int]] = {}
+    hits_b: dict[int, list[int]] = {}
+
+    for xmin, xmax, ymin, ymax, tag, i in events:
+        other = active[1 - tag]
+        other[:] = [e for e in other if e[1] >= xmin]
+
+        own = a if tag == 0 else b
+        p1, p2 = own[i - 1], own[i]
+
+        for _, _, oymin, oymax, _, j in other:
+            if oymax < ymin or oymin > ymax:
+                continue
+
+            oth = b if tag == 0 else a
+            if not _split_params(p1, p2, oth[j - 1], oth[j]):
+                continue
+
+            ia, ib = (i, j) if tag == 0 else (j, i)
+            hits_a.setdefault(ia, []).append(ib)
+            hits_b.setdefault(ib, []).append(ia)
+
+        active[tag].append((xmin, xmax, ymin, ymax, tag, i))
+
+    return hits_a, hits_b
+
+
+# ------------------------------------------------------------
+# BOUNDARY INTEGRAL
+# Sum of cross(s0, s1) over the parts of P's edges lying
+# inside Q. Inside/outside only changes at crossings, so a
+# run of uncrossed edges needs a single ray cast
+# ------------------------------------------------------------
+def _boundary_integral(p: list[tuple], q: list[tuple], hits: dict, keep_shared: bool) -> float:
+    total = 0.0
+    status = None
+
+    for i in range(len(p)):
+        p1, p2 = p[i - 1], p[i]
+        q_edges = hits.get(i)
+
+        if not q_edges:
+            if status is None:
+                status = _inside((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2, q)
+            if status:
+                total += p1[0] * p2[1] - p2[0] * p1[1]
+            continue
+
+        ts = {0.0, 1.0}
+        for j in q_edges:
+            ts.update(_split_params(p1, p2, q[j - 1], q[j]))
+        ts = sorted(ts)
+
+        rx, ry = p2[0] - p1[0], p2[1] - p1[1]
+        status = None
+
+        for t0, t1 in zip(ts, ts[1:]):
+            if t1 - t0 <= EPS:
+                continue
+
+            s0 = (p1[0] + rx * t0, p1[1] + ry * t0)
+            s1 = (p1[0] + rx * t1, p1[1] + ry * t1)
+            m = ((s0[0] + s1[0]) / 2, (s0[1] + s1[1]) / 2)
+
+            shared = [j for j in q_edges if _on_segment(m, q[j - 1], q[j])]
+            if shared:
+                # Shared boundary: count once (from A) and only when
+                # both interiors lie on the same side
+                qj = shared[0]
+                same_dir = rx * (q[qj][0] - q[qj - 1][0]) + ry * (q[qj][1] - q[qj - 1][1]) > 0
+                inside = keep_shared and same_dir
+                status = None
+            else:
+                inside = _inside(m[0], m[1], q)
+                status = inside
+
+            if inside:
+                total += s0[0] * s1[1] - s1[0] * s0[1]
+
+    return total
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+def overlap_area_km2(
+    polygon_a: list[dict],
+    polygon_b: list[dict],
+    bbox_a: tuple | None = None,
+    bbox_b: tuple | None = None
+) -> float:
+    """
+    Area (km²) shared by two polygons, 0.0 when disjoint
+    bbox = (min_lat, max_lat, min_lng, max_lng)
+    """
+    bbox_a = bbox_a or polygon_bounds(polygon_a)
+    bbox_b = bbox_b or polygon_bounds(polygon_b)
+
+    if not bboxes_overlap(bbox_a, bbox_b):
+        return 0.0
+
+    # Shared local projection for the pair
+    lat0 = min(bbox_a[0], bbox_b[0])
+    lng0 = min(bbox_a[2], bbox_b[2])
+    cos_lat0 = math.cos(math.radians((max(bbox_a[1], bbox_b[1]) + lat0) / 2))
+
+    a = _ccw(_project(polygon_a, lat0, lng0, cos_lat0))
+    b = _ccw(_project(polygon_b, lat0, lng0, cos_lat0))
+
+    hits_a, hits_b = _crossing_edges(a, b)
+
+    area2 = (
+        _boundary_integral(a, b, hits_a, keep_shared=True) +
+        _boundary_integral(b, a, hits_b, keep_shared=False)
+    )
+
+    return max(area2 / 2, 0.0)
+
+
+def find_overlapping_pairs(zones: list, min_area_km2: float = MIN_OVERLAP_AREA_KM2) -> list[dict]:
+    """
+    All overlapping pairs among zones
+    zones: objects with id, zone_name, polygon, min/max lat/lng
+    Sweep over bbox min_lng so only bbox-overlapping pairs
+    reach the polygon test
+    """
+    ordered = sorted(zones, key=lambda z: z.min_lng)
+    active = []
+    pairs = []
+
+    for zone in ordered:
+        active = [z for z in active if z.max_lng >= zone.min_lng]
+        bbox = (zone.min_lat, zone.max_lat, zone.min_lng, zone.max_lng)
+
+        for other in active:
+            other_bbox = (other.min_lat, other.max_lat, other.min_lng, other.max_lng)
+            if not bboxes_overlap(bbox, other_bbox):
+                continue
+
+            area = overlap_area_km2(other.polygon, zone.polygon, other_bbox, bbox)
+            if area > min_area_km2:
+                pairs.append({
+                    "zone_id": other.id,
+                    "zone_name": other.zone_name,
+                    "other_zone_id": zone.id,
+                    "other_zone_name": zone.zone_name,
+                    "overlap_area_km2": area,
+                })
+
+        active.append(zone)
+
+    return pairs
@@ -0,0 +1,271 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left, insort
+
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.category import Category
+
+
+# ============================================================
+# SUGGEST INDEX CONFIGURATION
+# ============================================================
+# Background rebuild interval (scheduled job, see app/main.py):
+# a worker that did not handle the catalog write itself still
+# picks up changes after this
+SUGGEST_INDEX_REFRESH_SECONDS = 300
+
+# Upper bound on keys scanned per lookup, keeps one-letter
+# prefixes on a large catalog inside the latency budget
+SUGGEST_MAX_SCAN = 2000
+
+# Entry kinds, also the tie-break order (categories first:
+# they lead to a listing rather than a single product)
+KIND_CATEGORY = 0
+KIND_PRODUCT = 1
+KIND_NAMES = {KIND_CATEGORY: "category", KIND_PRODUCT: "product"}
+
+# Match quality, lower ranks first
+MATCH_EXACT = 0     # whole name equals the query
+MATCH_NAME = 1      # name starts with the query
+MATCH_WORD = 2      # a later word starts with the query
+
+_separators = re.compile(r"[\W_]+")
+
+
+def normalize(text: str | None) -> str:
+    """Case folded, punctuation collapsed to single spaces"""
+    return _separators.sub(" ", (text or "").casefold()).strip()
+
+
+# ============================================================
+# SUGGESTION
+# Lightweight snapshot of the columns a suggestion returns
+# ============================================================
+class Suggestion:
+    __slots__ = ("kind", "id", "uu_id", "name", "slug", "normalized", "keys")
+
+    def __init__(self, kind: int, id: int, uu_id: str, name: str, slug: str):
+        self.kind = kind
+        self.id = id
+        self.uu_id = uu_id
+        self.name = name
+        self.slug = slug
+        self.normalized = normalize(name)
+
+        # One key per word start: "red onion" -> "red onion", "onion"
+        # so "oni" and "red on" both land on the same entry
+        starts = [0] + [m.end() for m in re.finditer(" ", self.normalized)]
+        self.keys = [(self.normalized[start:], kind, id) for start in starts]
+
+    def to_dict(self) -> dict:
+        return {
+            "type": KIND_NAMES[self.kind],
+            "uu_id": self.uu_id,
+            "name": self.name,
+            "slug": self.slug,
+        }
+
+
+# ============================================================
+# SUGGEST INDEX
+# Sorted array of (key, kind, id) tuples
+# - A prefix lookup is one bisect plus a scan of the keys that
+#   share the prefix (adjacent in sort order)
+# - Writes insert / remove single keys (insort), no rebuild
+# ============================================================
+class SuggestIndex:
+    def __init__(self, suggestions: list[Suggestion]):
+        self.entries: dict[tuple[int, int], Suggestion] = {}
+        self.keys: list[tuple[str, int, int]] = []
+        self._lock = threading.Lock()
+
+        for suggestion in suggestions:
+            self.entries[(suggestion.kind, suggestion.id)] = suggestion
+            self.keys.extend(suggestion.keys)
+
+        self.keys.sort()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _remove(self, kind: int, id: int):
+        suggestion = self.entries.pop((kind, id), None)
+        if suggestion is None:
+            return
+
+        for key in suggestion.keys:
+            i = bisect_left(self.keys, key)
+            if i < len(self.keys) and self.keys[i] == key:
+                del self.keys[i]
+
+    def upsert(self, suggestion: Suggestion):
+        with self._lock:
+            self._remove(suggestion.kind, suggestion.id)
+            self.entries[(suggestion.kind, suggestion.id)] = suggestion
+            for key in suggestion.keys:
+                insort(self.keys, key)
+
+    def remove(self, kind: int, id: int):
+        with self._lock:
+            self._remove(kind, id)
+
+    def search(self, query: str, limit: int = 10) -> list[Suggestion]:
+        """
+        Best `limit` entries having a word that starts with query
+        Ranked by match quality, kind, shorter name, then name
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        best: dict[tuple[int, int], tuple] = {}
+
+        with self._lock:
+            i = bisect_left(self.keys, (prefix,))
+            end = min(len(self.keys), i + SUGGEST_MAX_SCAN)
+
+            for key, kind, id in self.keys[i:end]:
+                if not key.startswith(prefix):
+                    break
+
+                suggestion = self.entries[(kind, id)]
+
+                if key == suggestion.normalized:
+                    match = MATCH_EXACT if key == prefix else MATCH_NAME
+                else:
+                    match = MATCH_WORD
+
+                rank = (match, kind, len(suggestion.normalized), suggestion.normalized, id)
+                if rank < best.get((kind, id), (MATCH_WORD + 1,)):
+                    best[(kind, id)] = rank
+
+            ranked = heapq.nsmallest(limit, best.items(), key=lambda item: item[1])
+            return [self.entries[entry] for entry, _ in ranked]
+
+
+# ============================================================
+# ENTRY BUILDERS
+# Only live rows are suggested, others are removed
+# ============================================================
+def _is_live(row) -> bool:
+    return bool(row.is_active) and not row.is_delete
+
+
+def product_suggestion(product) -> Suggestion:
+    return Suggestion(KIND_PRODUCT, product.id, product.uu_id, product.product_name, product.slug)
+
+
+def category_suggestion(category) -> Suggestion:
+    return Suggestion(KIND_CATEGORY, category.id, category.uu_id, category.category_name, category.slug)
+
+
+# ============================================================
+# PROCESS-LOCAL INDEX CACHE
+# ============================================================
+_index: SuggestIndex | None = None
+_generation = 0
+_lock = threading.Lock()
+
+# One build at a time per worker (refresh job / first use)
+_build_lock = threading.Lock()
+
+
+def build_suggest_index(db: Session) -> SuggestIndex:
+    products = db.query(
+        Product.id,
+        Product.uu_id,
+        Product.product_name,
+        Product.slug
+    ).filter(
+        Product.is_delete == False,
+        Product.is_active == True
+    ).all()
+
+    categories = db.query(
+        Category.id,
+        Category.uu_id,
+        Category.category_name,
+        Category.slug
+    ).filter(
+        Category.is_delete == False,
+        Category.is_active == True
+    ).all()
+
+    return SuggestIndex(
+        [product_suggestion(row) for row in products] +
+        [category_suggestion(row) for row in categories]
+    )
+
+
+def _build_and_install(db: Session) -> SuggestIndex:
+    global _index
+
+    generation = _generation
+    built = build_suggest_index(db)
+
+    with _lock:
+        # Skip install if a catalog write landed mid-build: the
+        # build may have missed it, the next refresh retries
+        if generation == _generation:
+            _index = built
+
+    return built
+
+
+def get_suggest_index(db: Session) -> SuggestIndex:
+    """
+    Current index, never rebuilt on the request path once built
+    (refresh_suggest_index runs in the background)
+    """
+    index = _index
+    if index is not None:
+        return index
+
+    # First use only (startup warm-up failed / not run):
+    # concurrent requests wait for one build instead of each
+    # running their own
+    with _build_lock:
+        if _index is not None:
+            return _index
+        return _build_and_install(db)
+
+
+def refresh_suggest_index(db: Session):
+    """
+    Scheduled rebuild (every SUGGEST_INDEX_REFRESH_SECONDS)
+    Lookups keep using the previous index until the swap
+    """
+    with _build_lock:
+        _build_and_install(db)
+
+
+def _apply(kind: int, row, suggestion_factory):
+    """
+    Upsert or remove one entry in the cached index
+    Call AFTER the catalog write is committed
+    """
+    global _generation
+
+    with _lock:
+        _generation += 1
+        index = _index
+
+    # Not built yet: the first lookup loads the committed row
+    if index is None:
+        return
+
+    if _is_live(row):
+        index.upsert(suggestion_factory(row))
+    else:
+        index.remove(kind, row.id)
+
+
+def index_product(product):
+    _apply(KIND_PRODUCT, product, product_suggestion)
+
+
+def index_category(category):
+    _apply(KIND_CATEGORY, category, category_suggestion)
@@ -0,0 +1,309 @@
+import math
+import threading
+import time
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import ZONE_CELL_CACHE_DEGREES, ZONE_CELL_CACHE_SIZE
+from app.models.zone import Zone
+from app.utils.compiled_polygon import CompiledPolygon, get_compiled_polygon
+from app.utils.geo import polygon_bounds, segment_intersects_box, points_in_polygon
+from app.utils.zone_nearest import NearestZoneIndex
+
+
+# ============================================================
+# ZONE INDEX CONFIGURATION
+# ============================================================
+# Grid cell size in degrees (~5.5 km at the equator)
+ZONE_GRID_CELL_DEGREES = 0.05
+
+# Zones covering more cells than this are kept in a separate
+# list and tested for every lookup instead of bloating the grid
+ZONE_GRID_MAX_CELLS_PER_ZONE = 4096
+
+# Safety net for multi-worker deployments: a worker that did not
+# handle the zone write itself still picks up changes after this
+ZONE_INDEX_TTL_SECONDS = 300
+
+# Cell classification against a zone
+CELL_OUTSIDE = 0
+CELL_INSIDE = 1
+CELL_BOUNDARY = 2
+
+
+# ============================================================
+# INDEXED ZONE
+# Lightweight snapshot of the columns needed for lookups
+# ============================================================
+class IndexedZone:
+    __slots__ = (
+        "id",
+        "zone_name",
+        "is_deliverable",
+        "polygon",
+        "min_lat",
+        "max_lat",
+        "min_lng",
+        "max_lng",
+        "compiled",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        zone_name: str,
+        is_deliverable: bool,
+        polygon: list[dict],
+        bounds: tuple[float, float, float, float] | None = None,
+        compiled: CompiledPolygon | None = None
+    ):
+        self.id = id
+        self.zone_name = zone_name
+        self.is_deliverable = bool(is_deliverable)
+        self.polygon = polygon
+        # Stored bbox columns when present, computed otherwise
+        self.min_lat, self.max_lat, self.min_lng, self.max_lng = bounds or polygon_bounds(polygon)
+        self.compiled = compiled or CompiledPolygon(polygon)
+
+    @property
+    def arrays(self):
+        return self.compiled.arrays
+
+    def contains(self, lat: float, lng: float) -> bool:
+        return self.compiled.contains(lat, lng)
+
+    def classify_box(self, box: tuple[float, float, float, float]) -> int:
+        """
+        Box entirely inside, entirely outside, or crossed by an edge
+        box = (min_lat, max_lat, min_lng, max_lng)
+        """
+        min_lat, max_lat, min_lng, max_lng = box
+
+        if max_lat < self.min_lat or min_lat > self.max_lat or \
+                max_lng < self.min_lng or min_lng > self.max_lng:
+            return CELL_OUTSIDE
+
+        for lat1, lng1, lat2, lng2 in self.compiled.edges_in_box(box):
+            if segment_intersects_box(lat1, lng1, lat2, lng2, box):
+                return CELL_BOUNDARY
+
+        # No edge enters the box: one test decides for the whole box
+        if self.compiled.contains((min_lat + max_lat) / 2, (min_lng + max_lng) / 2):
+            return CELL_INSIDE
+        return CELL_OUTSIDE
+
+
+# ============================================================
+# ZONE INDEX
+# Uniform grid over zone bounding boxes
+# - Each cell keeps the zones whose bbox overlaps it
+# - A lookup only runs ray casting for the zones in one cell
+# ============================================================
+class ZoneIndex:
+    def __init__(self, zones: list[IndexedZone], cell_size: float = ZONE_GRID_CELL_DEGREES):
+        self.cell_size = cell_size
+        self.zones = zones
+        self.cells: dict[tuple[int, int], list[IndexedZone]] = {}
+        self.oversized: list[IndexedZone] = []
+        self._nearest: NearestZoneIndex | None = None
+
+        for zone in zones:
+            lat_start, lat_end = self._cell(zone.min_lat), self._cell(zone.max_lat)
+            lng_start, lng_end = self._cell(zone.min_lng), self._cell(zone.max_lng)
+
+            if (lat_end - lat_start + 1) * (lng_end - lng_start + 1) > ZONE_GRID_MAX_CELLS_PER_ZONE:
+                self.oversized.append(zone)
+                continue
+
+            for i in range(lat_start, lat_end + 1):
+                for j in range(lng_start, lng_end + 1):
+                    self.cells.setdefault((i, j), []).append(zone)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_size)
+
+    def candidates(self, lat: float, lng: float) -> list[IndexedZone]:
+        cell = self.cells.get((self._cell(lat), self._cell(lng)), [])
+        if not self.oversized:
+            return cell
+        return cell + self.oversized
+
+    def candidates_in_box(self, box: tuple[float, float, float, float]) -> list[IndexedZone]:
+        min_lat, max_lat, min_lng, max_lng = box
+        seen = {}
+
+        for i in range(self._cell(min_lat), self._cell(max_lat) + 1):
+            for j in range(self._cell(min_lng), self._cell(max_lng) + 1):
+                for zone in self.cells.get((i, j), ()):
+                    seen[zone.id] = zone
+
+        for zone in self.oversized:
+            seen[zone.id] = zone
+
+        return list(seen.values())
+
+    def lookup(self, lat: float, lng: float) -> list[IndexedZone]:
+        return [z for z in self.candidates(lat, lng) if z.contains(lat, lng)]
+
+    def nearest_deliverable(self, lat: float, lng: float, max_km: float):
+        """
+        Closest deliverable zone as (zone, distance_km) or None
+        - A point inside a deliverable zone gets that zone at 0 km
+          (as ST_Distance does), the edge search only runs outside
+        - Edge grid is built on first use for this index version
+        """
+        for zone in self.lookup(lat, lng):
+            if zone.is_deliverable:
+                return zone, 0.0
+
+        if self._nearest is None:
+            self._nearest = NearestZoneIndex([z for z in self.zones if z.is_deliverable])
+        return self._nearest.nearest(lat, lng, max_km)
+
+    def classify_cell(self, box: tuple[float, float, float, float]):
+        inside, boundary = [], []
+
+        for zone in self.candidates_in_box(box):
+            status = zone.classify_box(box)
+            if status == CELL_INSIDE:
+                inside.append(zone)
+            elif status == CELL_BOUNDARY:
+                boundary.append(zone)
+
+        return inside, boundary
+
+
+# ============================================================
+# PROCESS-LOCAL INDEX CACHE
+# ============================================================
+_index: ZoneIndex | None = None
+_built_at = 0.0
+_generation = 0
+_lock = threading.Lock()
+
+# (lat cell, lng cell) -> (index, inside zones, boundary zones)
+_cell_cache = LRUCache("zone_cells", maxsize=ZONE_CELL_CACHE_SIZE)
+
+
+def build_zone_index(db: Session) -> ZoneIndex:
+    rows = db.query(
+        Zone.id,
+        Zone.zone_name,
+        Zone.is_deliverable,
+        Zone.polygon,
+        Zone.min_lat,
+        Zone.max_lat,
+        Zone.min_lng,
+        Zone.max_lng,
+        Zone.updated_at
+    ).filter(
+        Zone.is_delete == False,
+        Zone.is_active == True,
+        Zone.polygon.isnot(None)
+    ).all()
+
+    return ZoneIndex([
+        IndexedZone(
+            row.id,
+            row.zone_name,
+            row.is_deliverable,
+            row.polygon,
+            bounds=(row.min_lat, row.max_lat, row.min_lng, row.max_lng)
+            if row.min_lat is not None else None,
+            compiled=get_compiled_polygon(row.id, row.updated_at, row.polygon)
+        )
+        for row in rows
+        if row.polygon
+    ])
+
+
+def get_zone_index(db: Session) -> ZoneIndex:
+    global _index, _built_at
+
+    index = _index
+    if index is not None and time.monotonic() - _built_at < ZONE_INDEX_TTL_SECONDS:
+        return index
+
+    generation = _generation
+    index = build_zone_index(db)
+
+    with _lock:
+        # Skip install if a zone write invalidated us mid-build
+        if generation == _generation:
+            _index = index
+            _built_at = time.monotonic()
+            _cell_cache.clear()
+
+    return index
+
+
+def invalidate_zone_index():
+    """
+    Drop the cached index
+    Call AFTER the zone write is committed
+    """
+    global _index, _generation
+
+    with _lock:
+        _index = None
+        _generation += 1
+        _cell_cache.clear()
+
+
+# ============================================================
+# GRID CELL MEMO
+# Repeat storefront lookups from the same neighbourhood:
+# - cells inside / outside a zone need no polygon test
+# - only zones whose edge crosses the cell are ray-cast
+# Keyed on floor division of the coordinates (no string
+# encoding), cheap enough to pay off on the request path
+# ============================================================
+def lookup_with_cell_cache(index: ZoneIndex, lat: float, lng: float) -> list[IndexedZone]:
+    size = ZONE_CELL_CACHE_DEGREES
+    cell = (lat // size, lng // size)
+
+    entry = _cell_cache.get(cell)
+    if entry is None or entry[0] is not index:
+        min_lat, min_lng = cell[0] * size, cell[1] * size
+        inside, boundary = index.classify_cell((min_lat, min_lat + size, min_lng, min_lng + size))
+        entry = (index, inside, boundary)
+        _cell_cache.set(cell, entry)
+
+    _, inside, boundary = entry
+    if not boundary:
+        return inside
+
+    return inside + [z for z in boundary if z.contains(lat, lng)]
+
+
+
+# ============================================================
+# BATCH LOOKUP
+# - One vectorised ray casting pass per zone over all points
+# - Points outside a zone's bbox are masked out up front
+# returns (zone ids per point, deliverable mask)
+# ============================================================
+def batch_lookup(zones: list[IndexedZone], lats: np.ndarray, lngs: np.ndarray):
+    zone_ids = [[] for _ in range(len(lats))]
+    deliverable = np.zeros(len(lats), dtype=bool)
+
+    for zone in zones:
+        in_bbox = np.nonzero(
+            (lats >= zone.min_lat) & (lats <= zone.max_lat) &
+            (lngs >= zone.min_lng) & (lngs <= zone.max_lng)
+        )[0]
+
+        if not in_bbox.size:
+            continue
+
+        hits = in_bbox[points_in_polygon(lats[in_bbox], lngs[in_bbox], zone.arrays)]
+
+        for i in hits.tolist():
+            zone_ids[i].append(zone.id)
+
+        if zone.is_deliverable:
+            deliverable[hits] = True
+
+    return zone_ids, deliverable
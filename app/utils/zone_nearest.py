@@ -0,0 +1,120 @@
+import math
+
+from app.utils.geo import segment_intersects_box
+from app.utils.polygon_overlap import KM_PER_DEGREE_LAT, KM_PER_DEGREE_LNG
+
+
+# ============================================================
+# NEAREST ZONE SEARCH
+# Uniform grid over polygon EDGES (not bounding boxes)
+# - Search visits rings of cells around the point, nearest
+#   ring first
+# - Stops once no unvisited cell can beat the best distance
+#   or the ring is beyond max_km
+# For a point outside a zone, the closest point of that zone
+# lies on its boundary, so edge distance is the zone distance
+# ============================================================
+NEAREST_GRID_CELL_DEGREES = 0.02
+
+# Edges whose bbox covers more cells than this are traced
+# cell by cell instead of filling their whole bbox
+NEAREST_EDGE_TRACE_CELLS = 4
+
+
+def _segment_distance_km(lat: float, lng: float, lat1, lng1, lat2, lng2, cos_lat: float) -> float:
+    """Point to segment distance on a local equirectangular plane"""
+    kx = KM_PER_DEGREE_LNG * cos_lat
+    ky = KM_PER_DEGREE_LAT
+
+    ax, ay = (lng1 - lng) * kx, (lat1 - lat) * ky
+    bx, by = (lng2 - lng) * kx, (lat2 - lat) * ky
+
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length2))
+    px, py = ax + dx * t, ay + dy * t
+
+    return math.hypot(px, py)
+
+
+class NearestZoneIndex:
+    def __init__(self, zones: list, cell_size: float = NEAREST_GRID_CELL_DEGREES):
+        self.cell_size = cell_size
+        self.zones = zones
+        # cell -> [(zone, lat1, lng1, lat2, lng2), ...]
+        self.cells: dict[tuple[int, int], list[tuple]] = {}
+
+        for zone in zones:
+            polygon = zone.polygon
+            for k in range(len(polygon)):
+                a, b = polygon[k - 1], polygon[k]
+                self._add_edge((zone, a["lat"], a["lng"], b["lat"], b["lng"]))
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_size)
+
+    def _add_edge(self, edge: tuple):
+        _, lat1, lng1, lat2, lng2 = edge
+
+        i0, i1 = sorted((self._cell(lat1), self._cell(lat2)))
+        j0, j1 = sorted((self._cell(lng1), self._cell(lng2)))
+        trace = (i1 - i0 + 1) * (j1 - j0 + 1) > NEAREST_EDGE_TRACE_CELLS
+
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                if trace:
+                    box = (
+                        i * self.cell_size, (i + 1) * self.cell_size,
+                        j * self.cell_size, (j + 1) * self.cell_size
+                    )
+                    if not segment_intersects_box(lat1, lng1, lat2, lng2, box):
+                        continue
+                self.cells.setdefault((i, j), []).append(edge)
+
+    def _ring(self, ci: int, cj: int, r: int):
+        if r == 0:
+            yield ci, cj
+            return
+
+        for j in range(cj - r, cj + r + 1):
+            yield ci - r, j
+            yield ci + r, j
+        for i in range(ci - r + 1, ci + r):
+            yield i, cj - r
+            yield i, cj + r
+
+    def nearest(self, lat: float, lng: float, max_km: float):
+        """
+        Closest zone within max_km
+        returns (zone, distance_km) or None
+        """
+        if not self.cells:
+            return None
+
+        cos_lat = math.cos(math.radians(lat))
+        # Smallest km span of one cell, bounds what a ring can hold
+        cell_km = self.cell_size * min(KM_PER_DEGREE_LAT, KM_PER_DEGREE_LNG * cos_lat)
+        if cell_km <= 0:
+            return None
+
+        ci, cj = self._cell(lat), self._cell(lng)
+        max_ring = int(max_km / cell_km) + 1
+
+        best_zone, best_km = None, math.inf
+
+        for r in range(max_ring + 1):
+            # Every cell in ring r is at least (r - 1) cells away
+            if best_km <= (r - 1) * cell_km:
+                break
+
+            for cell in self._ring(ci, cj, r):
+                for zone, lat1, lng1, lat2, lng2 in self.cells.get(cell, ()):
+                    d = _segment_distance_km(lat, lng, lat1, lng1, lat2, lng2, cos_lat)
+                    if d < best_km:
+                        best_zone, best_km = zone, d
+
+        if best_zone is None or best_km > max_km:
+            return None
+
+        return best_zone, best_km
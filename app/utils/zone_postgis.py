@@ -0,0 +1,141 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import ZONE_GEO_BACKEND
+from app.utils.polygon_overlap import MIN_OVERLAP_AREA_KM2
+
+
+# ============================================================
+# OPTIONAL POSTGIS BACKEND FOR ZONES
+# - zones.geom geometry(Polygon, 4326) + GiST index
+# - Column is created by migration only when PostGIS exists,
+#   so it is NOT mapped on the Zone model and is written here
+#   with raw SQL
+# ============================================================
+_geom_column_exists: bool | None = None
+
+
+def geometry_column_exists(db: Session) -> bool:
+    global _geom_column_exists
+
+    if _geom_column_exists is None:
+        _geom_column_exists = bool(db.execute(text("""
+            SELECT EXISTS (
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_name = 'zones'
+                  AND column_name = 'geom'
+            )
+        """)).scalar())
+
+    return _geom_column_exists
+
+
+def postgis_enabled(db: Session) -> bool:
+    """PostGIS queries are used only when configured AND available"""
+    return ZONE_GEO_BACKEND == "postgis" and geometry_column_exists(db)
+
+
+def polygon_wkt(polygon: list[dict]) -> str:
+    """[{"lat", "lng"}, ...] -> closed WKT ring (lng lat order)"""
+    ring = [f"{p['lng']} {p['lat']}" for p in polygon]
+    ring.append(ring[0])
+    return f"POLYGON(({', '.join(ring)}))"
+
+
+# ============================================================
+# WRITE PATH
+# Kept in sync whenever the column exists, so switching the
+# backend on later never sees stale geometry
+# ============================================================
+def sync_zone_geometry(db: Session, zone_id: int, polygon: list[dict]):
+    if not geometry_column_exists(db):
+        return
+
+    db.execute(
+        text("""
+            UPDATE zones
+            SET geom = ST_GeomFromText(:wkt, 4326)
+            WHERE id = :zone_id
+        """),
+        {"wkt": polygon_wkt(polygon), "zone_id": zone_id}
+    )
+
+
+# ============================================================
+# READ PATH
+# ============================================================
+def find_zones_containing(db: Session, lat: float, lng: float):
+    return db.execute(
+        text("""
+            SELECT id, zone_name, is_deliverable
+            FROM zones
+            WHERE is_delete = false
+              AND is_active = true
+              AND ST_Contains(geom, ST_SetSRID(ST_MakePoint(:lng, :lat), 4326))
+        """),
+        {"lat": lat, "lng": lng}
+    ).all()
+
+
+def find_overlapping_zones(
+    db: Session,
+    polygon: list[dict],
+    exclude_zone_id: int | None = None
+):
+    # GiST narrows by ST_Intersects, then the shared area decides
+    # (neighbours sharing only an edge have zero overlap area)
+    return db.execute(
+        text("""
+            WITH candidate AS (
+                SELECT ST_GeomFromText(:wkt, 4326) AS geom
+            )
+            SELECT id, zone_name, overlap_area_km2
+            FROM (
+                SELECT z.id,
+                       z.zone_name,
+                       ST_Area(ST_Intersection(z.geom, c.geom)::geography) / 1000000.0
+                           AS overlap_area_km2
+                FROM zones z, candidate c
+                WHERE z.is_delete = false
+                  AND z.is_active = true
+                  AND (CAST(:exclude_zone_id AS integer) IS NULL OR z.id <> :exclude_zone_id)
+                  AND ST_Intersects(z.geom, c.geom)
+                  AND NOT ST_Touches(z.geom, c.geom)
+            ) o
+            WHERE overlap_area_km2 > :min_area
+            ORDER BY overlap_area_km2 DESC
+        """),
+        {
+            "wkt": polygon_wkt(polygon),
+            "exclude_zone_id": exclude_zone_id,
+            "min_area": MIN_OVERLAP_AREA_KM2,
+        }
+    ).all()
+
+
+def find_nearest_deliverable_zone(db: Session, lat: float, lng: float, max_km: float):
+    # KNN on the GiST index, exact geography distance for the winner
+    return db.execute(
+        text("""
+            WITH point AS (
+                SELECT ST_SetSRID(ST_MakePoint(:lng, :lat), 4326) AS geom
+            )
+            SELECT id, zone_name, distance_km
+            FROM (
+                SELECT z.id,
+                       z.zone_name,
+                       ST_Distance(z.geom::geography, p.geom::geography) / 1000.0 AS distance_km
+                FROM zones z, point p
+                WHERE z.is_delete = false
+                  AND z.is_active = true
+                  AND z.is_deliverable = true
+                ORDER BY z.geom <-> p.geom
+                LIMIT 5
+            ) n
+            WHERE distance_km <= :max_km
+            ORDER BY distance_km
+            LIMIT 1
+        """),
+        {"lat": lat, "lng": lng, "max_km": max_km}
+    ).first()
@@ -0,0 +1,147 @@
+import base64
+import math
+
+import numpy as np
+
+
+# ============================================================
+# ZONE RASTERISER
+# Lat/lng grid of cells, one 2-bit value per cell:
+#   0 = not serviceable
+#   1 = serviceable (cell fully inside a deliverable zone)
+#   2 = boundary (a zone edge crosses the cell, ask the server)
+# Row 0 is the southern-most row, column 0 the western-most
+# ============================================================
+CELL_NONE = 0
+CELL_SERVICEABLE = 1
+CELL_BOUNDARY = 2
+
+
+class RasterGrid:
+    __slots__ = ("cell_size", "min_lat", "min_lng", "rows", "cols")
+
+    def __init__(self, cell_size: float, bounds: tuple[float, float, float, float]):
+        """bounds = (min_lat, max_lat, min_lng, max_lng), snapped to the cell size"""
+        min_lat, max_lat, min_lng, max_lng = bounds
+
+        self.cell_size = cell_size
+        self.min_lat = math.floor(min_lat / cell_size) * cell_size
+        self.min_lng = math.floor(min_lng / cell_size) * cell_size
+        self.rows = math.floor((max_lat - self.min_lat) / cell_size) + 1
+        self.cols = math.floor((max_lng - self.min_lng) / cell_size) + 1
+
+    def row(self, lat: float) -> int:
+        return min(max(math.floor((lat - self.min_lat) / self.cell_size), 0), self.rows - 1)
+
+    def col(self, lng: float) -> int:
+        return min(max(math.floor((lng - self.min_lng) / self.cell_size), 0), self.cols - 1)
+
+
+def _fill_inside(inside: np.ndarray, grid: RasterGrid, polygon: list[dict]):
+    """
+    Scanline fill of cell CENTRES inside the polygon
+    Same crossing rule as app.utils.geo.point_in_polygon:
+    a centre is inside when an odd number of crossings lie
+    strictly to its east
+    """
+    xs = np.array([p["lng"] for p in polygon], dtype=np.float64)
+    ys = np.array([p["lat"] for p in polygon], dtype=np.float64)
+    xj, yj = np.roll(xs, 1), np.roll(ys, 1)
+
+    size = grid.cell_size
+    for r in range(grid.row(ys.min()), grid.row(ys.max()) + 1):
+        y = grid.min_lat + (r + 0.5) * size
+
+        crossing = (ys > y) != (yj > y)
+        if not crossing.any():
+            continue
+
+        cx = np.sort(
+            (xj[crossing] - xs[crossing]) * (y - ys[crossing])
+            / (yj[crossing] - ys[crossing] + 1e-9) + xs[crossing]
+        )
+
+        # centre of column c sits at min_lng + (c + 0.5) * size
+        cols = np.ceil((cx - grid.min_lng) / size - 0.5).astype(np.int64)
+        cols = np.clip(cols, 0, grid.cols)
+
+        for start, end in zip(cols[0::2], cols[1::2]):
+            if end > start:
+                inside[r, start:end] = True
+
+
+def _mark_edges(boundary: np.ndarray, grid: RasterGrid, polygon: list[dict]):
+    """Mark every cell an edge passes through (column by column)"""
+    size = grid.cell_size
+
+    for k in range(len(polygon)):
+        a, b = polygon[k - 1], polygon[k]
+        x1, y1, x2, y2 = a["lng"], a["lat"], b["lng"], b["lat"]
+        if x1 > x2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+
+        c0, c1 = grid.col(x1), grid.col(x2)
+
+        for c in range(c0, c1 + 1):
+            # Part of the edge inside this column
+            lo = max(x1, grid.min_lng + c * size)
+            hi = min(x2, grid.min_lng + (c + 1) * size)
+
+            if x2 == x1:
+                ya, yb = y1, y2
+            else:
+                ya = y1 + (y2 - y1) * (lo - x1) / (x2 - x1)
+                yb = y1 + (y2 - y1) * (hi - x1) / (x2 - x1)
+
+            r0, r1 = grid.row(min(ya, yb)), grid.row(max(ya, yb))
+            boundary[r0:r1 + 1, c] = True
+
+
+def rasterise_zones(
+    zones: list,
+    cell_size: float,
+    bounds: tuple[float, float, float, float]
+) -> tuple[RasterGrid, np.ndarray]:
+    """
+    zones: deliverable zones (objects with .polygon)
+    returns (grid, uint8 cells of shape (rows, cols))
+    """
+    grid = RasterGrid(cell_size, bounds)
+
+    serviceable = np.zeros((grid.rows, grid.cols), dtype=bool)
+    boundary = np.zeros((grid.rows, grid.cols), dtype=bool)
+
+    for zone in zones:
+        inside = np.zeros_like(serviceable)
+        edges = np.zeros_like(boundary)
+
+        _fill_inside(inside, grid, zone.polygon)
+        _mark_edges(edges, grid, zone.polygon)
+
+        # Fully inside ANY deliverable zone wins over another's edge
+        serviceable |= inside & ~edges
+        boundary |= edges
+
+    cells = np.where(serviceable, CELL_SERVICEABLE, np.where(boundary, CELL_BOUNDARY, CELL_NONE))
+    return grid, cells.astype(np.uint8)
+
+
+def pack_cells(cells: np.ndarray) -> str:
+    """
+    Row-major, 4 cells per byte, first cell in the high bits
+    returned base64 encoded
+    """
+    flat = cells.ravel()
+    padded = np.zeros(-(-flat.size // 4) * 4, dtype=np.uint8)
+    padded[:flat.size] = flat
+
+    quads = padded.reshape(-1, 4)
+    packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+    return base64.b64encode(packed.astype(np.uint8).tobytes()).decode("ascii")
+
+
+def unpack_cells(data: str, rows: int, cols: int) -> np.ndarray:
+    packed = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    quads = np.stack([(packed >> s) & 0b11 for s in (6, 4, 2, 0)], axis=1).ravel()
+    return quads[:rows * cols].reshape(rows, cols)
@@ -0,0 +1,184 @@
+"""
+SQL statement / row budget check for the paginated listing queries
+
+Runs one page of each hot listing query against the configured
+database (.env / DB_* variables) and counts, per page:
+  statements    SQL statements sent
+  rows          rows returned by all statements
+  page_rows     rows returned by the page statement itself
+
+Each page is also validated through its response schema inside
+the counted block, so lazy loads of deferred columns or
+relationships show up as extra statements. The *_rows scenarios
+are the column-projected fast paths the web routes serve.
+
+Budgets (see BUDGETS) hold the eager loading strategy in place:
+collections are loaded by selectinload (one extra IN statement),
+so the page statement returns exactly one row per entity and the
+statement count does not grow with the page size.
+
+Run from the project root against a seeded database:
+    python -m benchmarks.bench_list_queries
+    python -m benchmarks.bench_list_queries --limit 50
+
+Exits with status 1 when a query goes over its budget
+"""
+import argparse
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+
+import app.main  # noqa: F401  (registers every model / relationship)
+from app.db.session import SessionLocal, engine
+from app.core.pagination import paginate, table_row_estimate
+from app.core.search import SEARCH_MODE_FULLTEXT
+from app.models.product import Product
+from app.models.product_variants import ProductVariants
+from app.models.zone import Zone
+from app.schemas.product import ProductResponse
+from app.schemas.web_product import ProductResponse as WebProductResponse
+from app.schemas.web_product_variants import ProductVariantResponse
+from app.services.product_service import search_products
+from app.services.web_product_service import list_web_product_rows
+from app.services.web_product_variants_service import storefront_variants_query, variant_row_to_dict
+
+
+# Max statements per page (page statement + one per selectin collection)
+BUDGETS = {
+    "admin_product_search": 2,
+    "admin_product_fulltext": 2,
+    "storefront_variants": 2,
+    "web_product_rows": 2,
+    "storefront_variant_rows": 1,
+}
+
+
+# ------------------------------------------------------------
+# STATEMENT COUNTER
+# ------------------------------------------------------------
+class StatementCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "after_cursor_execute", self._after)
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        rows = cursor.rowcount if cursor.description is not None else 0
+        self.statements.append((statement, max(rows, 0)))
+
+
+# ------------------------------------------------------------
+# SCENARIOS
+# Each returns (page call, response schema); lookups the page
+# needs (zone ids, ...) run before the counted block
+# ------------------------------------------------------------
+def admin_product_search(db, limit: int):
+    table_row_estimate(db.query(Product))
+    return lambda: search_products(db, "a", 0, limit), ProductResponse
+
+
+def admin_product_fulltext(db, limit: int):
+    table_row_estimate(db.query(Product))
+    return lambda: search_products(db, "onion", 0, limit, search_mode=SEARCH_MODE_FULLTEXT), ProductResponse
+
+
+def storefront_variants(db, limit: int):
+    zone_ids = [z for (z,) in db.query(Zone.id).filter(Zone.is_deliverable == True).all()]
+    query = storefront_variants_query(db, zone_ids).order_by(ProductVariants.created_at.desc())
+    return lambda: paginate(query, 0, limit), ProductVariantResponse
+
+
+# Fast path (column rows as dicts), what the web routes serve
+def web_product_rows(db, limit: int):
+    return lambda: list_web_product_rows(db, 0, limit), WebProductResponse
+
+
+def storefront_variant_rows(db, limit: int):
+    zone_ids = [z for (z,) in db.query(Zone.id).filter(Zone.is_deliverable == True).all()]
+    query = storefront_variants_query(db, zone_ids, rows=True).order_by(ProductVariants.created_at.desc())
+
+    def page():
+        total, rows = paginate(query, 0, limit)
+        return total, [variant_row_to_dict(row) for row in rows]
+
+    return page, ProductVariantResponse
+
+
+SCENARIOS = {
+    "admin_product_search": admin_product_search,
+    "admin_product_fulltext": admin_product_fulltext,
+    "storefront_variants": storefront_variants,
+    "web_product_rows": web_product_rows,
+    "storefront_variant_rows": storefront_variant_rows,
+}
+
+
+def run(name: str, limit: int) -> dict:
+    db = SessionLocal()
+    try:
+        page, schema = SCENARIOS[name](db, limit)
+
+        with StatementCounter() as counter:
+            t0 = time.perf_counter()
+            total, rows = page()
+            for row in rows:
+                schema.model_validate(row, from_attributes=True)
+            elapsed = time.perf_counter() - t0
+
+        return {
+            "name": name,
+            "total": total,
+            "entities": len(rows),
+            "statements": len(counter.statements),
+            "rows": sum(n for _, n in counter.statements),
+            "page_rows": counter.statements[0][1] if counter.statements else 0,
+            "ms": round(elapsed * 1000, 2),
+        }
+    except DBAPIError as e:
+        return {"name": name, "error": str(e.orig).splitlines()[0]}
+    finally:
+        db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Listing query statement / row budgets")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Scenarios to run")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for name in args.only or SCENARIOS:
+        result = run(name, args.limit)
+
+        if "error" in result:
+            print(f"{name:<24} skipped: {result['error']}")
+            continue
+
+        print(
+            f"{name:<24} entities={result['entities']:<4} statements={result['statements']:<3} "
+            f"rows={result['rows']:<5} page_rows={result['page_rows']:<4} {result['ms']:>8.2f} ms"
+        )
+
+        if result["statements"] > BUDGETS[name]:
+            failures.append(f"{name}: {result['statements']} statements (budget {BUDGETS[name]})")
+        if result["page_rows"] > result["entities"]:
+            failures.append(
+                f"{name}: page statement returned {result['page_rows']} rows "
+                f"for {result['entities']} entities"
+            )
+
+    for line in failures:
+        print(f"OVER BUDGET {line}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
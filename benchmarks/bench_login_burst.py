@@ -0,0 +1,140 @@
+"""
+Login burst benchmark: throughput of /admin/auth/login and the
+latency of another endpoint while the burst runs
+
+bcrypt verification runs on the password hashing pool
+(app/core/security.py password_pool), so a burst of logins
+should leave the event loop and the request threadpool free
+for everything else.
+
+Phases (in process, httpx ASGI transport, no network):
+  baseline   probe endpoint alone
+  burst      --logins logins, --concurrency at a time, while the
+             probe endpoint keeps being called
+
+Run from the project root against a seeded database with an
+active admin user:
+    python -m benchmarks.bench_login_burst --email admin@example.com --password secret
+    python -m benchmarks.bench_login_burst ... --logins 100 --concurrency 50
+
+--max-probe-p95-ms exits with status 1 when the probe p95
+during the burst is above it
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+from app.main import app
+from app.core.security import password_pool
+
+
+LOGIN_PATH = "/api/v1/admin/auth/login"
+DEFAULT_PROBE_PATH = "/api/v1/web/products/suggest?q=o"
+
+
+def summarize(samples: list[float]) -> dict:
+    if not samples:
+        return {"n": 0}
+
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+async def timed_get(client: httpx.AsyncClient, path: str) -> float:
+    started = time.perf_counter()
+    response = await client.get(path)
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def probe_until(client: httpx.AsyncClient, path: str, done: asyncio.Event, interval: float) -> list[float]:
+    samples = []
+    while not done.is_set():
+        samples.append(await timed_get(client, path))
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def login_burst(client: httpx.AsyncClient, email: str, password: str, logins: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, failures = [], 0
+
+    async def login():
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(LOGIN_PATH, json={"email": email, "password": password})
+            latencies.append(time.perf_counter() - started)
+            if response.json().get("status") != 200:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return latencies, failures, time.perf_counter() - started
+
+
+async def run(args) -> int:
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # Warm up (index builds, connection pool, first bcrypt)
+        await timed_get(client, args.probe_path)
+        await login_burst(client, args.email, args.password, 1, 1)
+
+        baseline = [await timed_get(client, args.probe_path) for _ in range(args.baseline_probes)]
+
+        done = asyncio.Event()
+        probe_task = asyncio.create_task(probe_until(client, args.probe_path, done, args.probe_interval))
+
+        latencies, failures, elapsed = await login_burst(
+            client, args.email, args.password, args.logins, args.concurrency
+        )
+        done.set()
+        during = await probe_task
+
+    print(f"password pool        workers={password_pool.workers} max_queue={password_pool.max_queue}")
+    print(f"probe baseline       {summarize(baseline)}")
+    print(f"probe during burst   {summarize(during)}")
+    print(f"logins               {summarize(latencies)} failed={failures}")
+    print(f"login throughput     {args.logins / elapsed:.1f}/s over {elapsed:.2f} s")
+    print(f"pool stats           {password_pool.stats()}")
+
+    if failures:
+        print("FAILED logins: check --email / --password")
+        return 1
+
+    p95 = summarize(during).get("p95_ms")
+    if args.max_probe_p95_ms is not None and p95 is not None and p95 > args.max_probe_p95_ms:
+        print(f"SLOW probe p95 {p95} ms > {args.max_probe_p95_ms} ms during the login burst")
+        return 1
+
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Login burst throughput / responsiveness")
+    parser.add_argument("--email", default=os.getenv("BENCH_LOGIN_EMAIL"), required=not os.getenv("BENCH_LOGIN_EMAIL"))
+    parser.add_argument("--password", default=os.getenv("BENCH_LOGIN_PASSWORD"), required=not os.getenv("BENCH_LOGIN_PASSWORD"))
+    parser.add_argument("--logins", type=int, default=40, help="Logins in the burst")
+    parser.add_argument("--concurrency", type=int, default=20, help="Logins in flight at once")
+    parser.add_argument("--probe-path", default=DEFAULT_PROBE_PATH, help="Endpoint timed during the burst")
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="Seconds between probes")
+    parser.add_argument("--baseline-probes", type=int, default=50)
+    parser.add_argument("--max-probe-p95-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
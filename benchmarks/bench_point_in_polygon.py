@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: dict based point_in_polygon vs CompiledPolygon
+
+Run from the project root:
+    python -m benchmarks.bench_point_in_polygon
+"""
+import math
+import random
+import time
+
+from app.utils.compiled_polygon import CompiledPolygon
+from app.utils.geo import point_in_polygon
+
+
+VERTEX_COUNTS = [8, 64, 512, 2048]
+POINTS = 2000
+SEED = 42
+
+
+def make_polygon(vertices: int, lat: float = 18.52, lng: float = 73.85, radius: float = 0.05) -> list[dict]:
+    """Star-ish zone outline around (lat, lng)"""
+    polygon = []
+    for k in range(vertices):
+        angle = 2 * math.pi * k / vertices
+        r = radius * (1 + 0.3 * math.sin(7 * angle))
+        polygon.append({"lat": lat + r * math.sin(angle), "lng": lng + r * math.cos(angle)})
+    return polygon
+
+
+def time_it(fn, points) -> tuple[float, list[bool]]:
+    start = time.perf_counter()
+    results = [fn(lat, lng) for lat, lng in points]
+    return time.perf_counter() - start, results
+
+
+def main():
+    rng = random.Random(SEED)
+
+    print(f"{'vertices':>8} {'dict us/pt':>11} {'compiled us/pt':>15} {'speed-up':>9} {'compile ms':>11}")
+
+    for vertices in VERTEX_COUNTS:
+        polygon = make_polygon(vertices)
+        points = [
+            (18.52 + rng.uniform(-0.07, 0.07), 73.85 + rng.uniform(-0.07, 0.07))
+            for _ in range(POINTS)
+        ]
+
+        start = time.perf_counter()
+        compiled = CompiledPolygon(polygon)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        dict_time, expected = time_it(lambda lat, lng: point_in_polygon(lat, lng, polygon), points)
+        compiled_time, actual = time_it(compiled.contains, points)
+
+        mismatches = sum(a != b for a, b in zip(expected, actual))
+        if mismatches:
+            raise SystemExit(f"{mismatches} mismatching results for {vertices} vertices")
+
+        print(
+            f"{vertices:>8} "
+            f"{dict_time / POINTS * 1e6:>11.2f} "
+            f"{compiled_time / POINTS * 1e6:>15.2f} "
+            f"{dict_time / compiled_time:>8.1f}x "
+            f"{compile_ms:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
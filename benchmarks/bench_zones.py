@@ -0,0 +1,269 @@
+"""
+Benchmark suite for the geo / zone hot paths
+
+Scenarios: synthetic city zone sets (10 .. 10k zones,
+4 .. 2k vertices per zone), see benchmarks/synthetic_zones.py
+
+Measured per scenario:
+  index_build        ZoneIndex grid construction
+  single_scan        dict point_in_polygon over every zone
+                     (zone scan used before the spatial index)
+  single_index       ZoneIndex.lookup
+  single_cell_cache  lookup_with_cell_cache on repeat locations
+  batch              batch_lookup (batch serviceability)
+  overlap_validate   new polygon vs bbox candidates
+                     (validate_polygon_uniqueness without SQL)
+  overlap_report     find_overlapping_pairs over the whole set
+
+Run from the project root:
+    python -m benchmarks.bench_zones
+    python -m benchmarks.bench_zones --quick
+    python -m benchmarks.bench_zones --compare benchmarks/results/<old>.json
+
+Results are written as JSON (default benchmarks/results/),
+--compare exits with status 1 when a metric is slower than
+the baseline by more than --tolerance
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from app.utils.geo import point_in_polygon
+from app.utils.polygon_overlap import (
+    bboxes_overlap,
+    overlap_area_km2,
+    find_overlapping_pairs,
+    MIN_OVERLAP_AREA_KM2
+)
+from app.utils.zone_index import ZoneIndex, batch_lookup, lookup_with_cell_cache, _cell_cache
+from benchmarks.synthetic_zones import (
+    make_city_zones,
+    make_polygon,
+    city_bounds,
+    random_points,
+    ZONE_PITCH_DEGREES
+)
+
+
+ZONE_COUNTS = [10, 100, 1000, 10000]
+VERTEX_COUNTS = [4, 32, 256, 2000]
+QUICK_ZONE_COUNTS = [10, 100, 1000]
+QUICK_VERTEX_COUNTS = [4, 64]
+
+# Scenarios above this many vertices in total are skipped
+# (10k zones x 2k vertices does not fit a laptop)
+MAX_TOTAL_VERTICES = 2_000_000
+
+# The brute-force scan is only timed while it stays affordable,
+# and on fewer points than the indexed lookups
+MAX_SCAN_VERTICES = 64_000
+SCAN_POINTS = 200
+
+SINGLE_POINTS = 2000
+BATCH_POINTS = 10000
+CELL_CACHE_LOCATIONS = 500
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# ------------------------------------------------------------
+# TIMING
+# ------------------------------------------------------------
+def measure(fn, ops_per_call: int, min_time: float, max_calls: int = 10000) -> dict:
+    """
+    Calls fn() until min_time has passed (at least once)
+    returns throughput and per-call latency
+    """
+    durations = []
+    started = time.perf_counter()
+
+    while len(durations) < max_calls:
+        t0 = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - t0)
+
+        if time.perf_counter() - started >= min_time:
+            break
+
+    total = sum(durations)
+    ordered = sorted(durations)
+
+    return {
+        "calls": len(durations),
+        "ops_per_sec": round(ops_per_call * len(durations) / total, 2) if total else None,
+        "mean_ms": round(statistics.fmean(durations) * 1000, 4),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+    }
+
+
+# ------------------------------------------------------------
+# SCENARIO
+# ------------------------------------------------------------
+def run_scenario(zone_count: int, vertices: int, min_time: float, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    zones = make_city_zones(zone_count, vertices, seed)
+    bounds = city_bounds(zones)
+    results = []
+
+    def record(metric: str, stats: dict):
+        results.append({"zones": zone_count, "vertices": vertices, "metric": metric, **stats})
+
+    record("index_build", measure(lambda: ZoneIndex(zones), 1, min_time, max_calls=20))
+    index = ZoneIndex(zones)
+
+    points = random_points(rng, bounds, SINGLE_POINTS)
+
+    if zone_count * vertices <= MAX_SCAN_VERTICES:
+        def scan():
+            for lat, lng in points[:SCAN_POINTS]:
+                [z for z in zones if point_in_polygon(lat, lng, z.polygon)]
+        record("single_scan", measure(scan, SCAN_POINTS, min_time))
+
+    def indexed():
+        for lat, lng in points:
+            index.lookup(lat, lng)
+    record("single_index", measure(indexed, len(points), min_time))
+
+    # Storefront traffic repeats the same neighbourhoods
+    locations = random_points(rng, bounds, CELL_CACHE_LOCATIONS)
+    repeat = [locations[rng.randrange(len(locations))] for _ in range(SINGLE_POINTS)]
+    _cell_cache.clear()
+
+    def cached():
+        for lat, lng in repeat:
+            lookup_with_cell_cache(index, lat, lng)
+    record("single_cell_cache", measure(cached, len(repeat), min_time))
+
+    batch = random_points(rng, bounds, BATCH_POINTS)
+    lats = np.array([p[0] for p in batch], dtype=np.float64)
+    lngs = np.array([p[1] for p in batch], dtype=np.float64)
+    record("batch", measure(lambda: batch_lookup(index.zones, lats, lngs), len(batch), min_time))
+
+    # A new zone drawn across a few existing ones
+    lat, lng = random_points(rng, bounds, 1)[0]
+    candidate = make_polygon(rng, lat, lng, ZONE_PITCH_DEGREES * 1.5, vertices)
+    candidate_bbox = (
+        min(p["lat"] for p in candidate), max(p["lat"] for p in candidate),
+        min(p["lng"] for p in candidate), max(p["lng"] for p in candidate),
+    )
+
+    def validate():
+        for zone in index.candidates_in_box(candidate_bbox):
+            bbox = (zone.min_lat, zone.max_lat, zone.min_lng, zone.max_lng)
+            if not bboxes_overlap(candidate_bbox, bbox):
+                continue
+            if overlap_area_km2(candidate, zone.polygon, candidate_bbox, bbox) > MIN_OVERLAP_AREA_KM2:
+                break
+    record("overlap_validate", measure(validate, 1, min_time))
+
+    record("overlap_report", measure(lambda: find_overlapping_pairs(zones), zone_count, min_time, max_calls=5))
+
+    return results
+
+
+# ------------------------------------------------------------
+# REPORTING
+# ------------------------------------------------------------
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def result_key(row: dict) -> tuple:
+    return row["zones"], row["vertices"], row["metric"]
+
+
+def compare(results: list[dict], baseline_path: Path, tolerance: float) -> list[str]:
+    baseline = {result_key(r): r for r in json.loads(baseline_path.read_text())["results"]}
+    regressions = []
+
+    for row in results:
+        old = baseline.get(result_key(row))
+        if not old or not old.get("ops_per_sec") or not row.get("ops_per_sec"):
+            continue
+
+        ratio = row["ops_per_sec"] / old["ops_per_sec"]
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{row['metric']} zones={row['zones']} vertices={row['vertices']}: "
+                f"{old['ops_per_sec']} -> {row['ops_per_sec']} ops/s ({ratio:.2f}x)"
+            )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Zone / geo benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="Small matrix for a fast check")
+    parser.add_argument("--zones", type=int, nargs="+", help="Zone counts")
+    parser.add_argument("--vertices", type=int, nargs="+", help="Vertices per zone")
+    parser.add_argument("--max-total-vertices", type=int, default=MAX_TOTAL_VERTICES)
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per measurement")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Result JSON path")
+    parser.add_argument("--compare", type=Path, help="Baseline result JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slow-down (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    zone_counts = args.zones or (QUICK_ZONE_COUNTS if args.quick else ZONE_COUNTS)
+    vertex_counts = args.vertices or (QUICK_VERTEX_COUNTS if args.quick else VERTEX_COUNTS)
+
+    results = []
+    for zone_count in zone_counts:
+        for vertices in vertex_counts:
+            if zone_count * vertices > args.max_total_vertices:
+                print(f"skip  zones={zone_count:<6} vertices={vertices:<5} (over --max-total-vertices)")
+                continue
+
+            for row in run_scenario(zone_count, vertices, args.min_time, args.seed):
+                results.append(row)
+                print(
+                    f"{row['metric']:<18} zones={zone_count:<6} vertices={vertices:<5} "
+                    f"{row['ops_per_sec'] or 0:>14,.1f} ops/s  p50 {row['p50_ms']:>10.3f} ms"
+                )
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+
+    output = args.output or RESULTS_DIR / f"zones-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Zone backend parity check: nearest deliverable zone from the
+python spatial index vs PostGIS (ST_Distance)
+
+Probes per zone:
+  inside   a point inside the polygon: a deliverable zone that
+           contains it must come back at 0 km on both backends
+  outside  points just beyond each bbox corner: same zone (or
+           an equally close one) and distances within tolerance
+
+PostGIS is compared only when zones.geom exists; without it the
+python-side checks still run. --synthetic checks a generated
+zone set (python only, no database needed).
+
+Run from the project root:
+    python -m benchmarks.check_zone_backends
+    python -m benchmarks.check_zone_backends --synthetic 500
+
+Exits with status 1 on any mismatch
+"""
+import argparse
+import sys
+
+from app.core.config import NEAREST_ZONE_MAX_KM
+from app.db.session import SessionLocal
+from app.utils.zone_index import ZoneIndex, IndexedZone, build_zone_index
+from app.utils.zone_postgis import (
+    geometry_column_exists,
+    find_nearest_deliverable_zone as postgis_nearest_deliverable_zone
+)
+from benchmarks.synthetic_zones import make_city_zones
+
+
+# Planar edge distance vs geography distance
+TOLERANCE_KM = 0.02
+TOLERANCE_RATIO = 0.02
+
+# How far beyond the bbox corners outside probes sit (degrees)
+OUTSIDE_OFFSET_DEGREES = 0.01
+
+
+def inside_point(zone: IndexedZone) -> tuple[float, float] | None:
+    """Vertex average, or the bbox centre, when it is inside the polygon"""
+    lat = sum(p["lat"] for p in zone.polygon) / len(zone.polygon)
+    lng = sum(p["lng"] for p in zone.polygon) / len(zone.polygon)
+    if zone.contains(lat, lng):
+        return lat, lng
+
+    lat, lng = (zone.min_lat + zone.max_lat) / 2, (zone.min_lng + zone.max_lng) / 2
+    if zone.contains(lat, lng):
+        return lat, lng
+
+    return None
+
+
+def outside_points(zone: IndexedZone) -> list[tuple[float, float]]:
+    d = OUTSIDE_OFFSET_DEGREES
+    return [
+        (zone.min_lat - d, zone.min_lng - d),
+        (zone.min_lat - d, zone.max_lng + d),
+        (zone.max_lat + d, zone.min_lng - d),
+        (zone.max_lat + d, zone.max_lng + d),
+    ]
+
+
+def close_enough(a: float, b: float) -> bool:
+    return abs(a - b) <= max(TOLERANCE_KM, TOLERANCE_RATIO * max(a, b))
+
+
+def check(index: ZoneIndex, postgis=None, max_km: float = NEAREST_ZONE_MAX_KM) -> list[str]:
+    failures = []
+
+    def probe(kind: str, zone: IndexedZone, lat: float, lng: float):
+        found = index.nearest_deliverable(lat, lng, max_km)
+        py_id, py_km = (found[0].id, found[1]) if found else (None, None)
+
+        containing = [z.id for z in index.lookup(lat, lng) if z.is_deliverable]
+        if containing and (py_km != 0.0 or py_id not in containing):
+            failures.append(
+                f"{kind} zone {zone.id} ({lat:.6f}, {lng:.6f}): python {py_id} at {py_km} km, "
+                f"inside deliverable {containing}"
+            )
+
+        if postgis is None:
+            return
+
+        row = postgis(lat, lng, max_km)
+        pg_id, pg_km = (row.id, row.distance_km) if row else (None, None)
+
+        if (py_id is None) != (pg_id is None):
+            failures.append(f"{kind} zone {zone.id} ({lat:.6f}, {lng:.6f}): python {py_id}, postgis {pg_id}")
+        elif py_id is not None and not close_enough(py_km, pg_km):
+            failures.append(
+                f"{kind} zone {zone.id} ({lat:.6f}, {lng:.6f}): python {py_id} at {py_km:.4f} km, "
+                f"postgis {pg_id} at {pg_km:.4f} km"
+            )
+
+    for zone in index.zones:
+        point = inside_point(zone)
+        if point:
+            probe("inside", zone, *point)
+
+        for lat, lng in outside_points(zone):
+            probe("outside", zone, lat, lng)
+
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Nearest deliverable zone: python vs PostGIS")
+    parser.add_argument("--synthetic", type=int, default=None, help="Check N generated zones instead of the database")
+    parser.add_argument("--vertices", type=int, default=32, help="Vertices per generated zone")
+    parser.add_argument("--max-km", type=float, default=NEAREST_ZONE_MAX_KM)
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        index = ZoneIndex(make_city_zones(args.synthetic, args.vertices))
+        failures = check(index, max_km=args.max_km)
+        backends = "python"
+    else:
+        db = SessionLocal()
+        try:
+            index = build_zone_index(db)
+            postgis = None
+            if geometry_column_exists(db):
+                postgis = lambda lat, lng, max_km: postgis_nearest_deliverable_zone(db, lat, lng, max_km)
+            failures = check(index, postgis, args.max_km)
+            backends = "python vs postgis" if postgis else "python (zones.geom missing, postgis skipped)"
+        finally:
+            db.close()
+
+    print(f"{len(index.zones)} zones, {backends}: {len(failures)} mismatches")
+    for failure in failures[:50]:
+        print("  " + failure)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Synthetic city-scale zone sets for the zone benchmarks
+
+Zones are laid out on a square grid around a city centre, one
+wobbly star-shaped polygon per grid cell. Neighbouring bounding
+boxes overlap (like real hand-drawn delivery zones) so the
+index and overlap code see realistic candidate counts.
+"""
+import math
+import random
+
+from app.utils.zone_index import IndexedZone
+
+
+CITY_LAT = 18.52
+CITY_LNG = 73.85
+
+# Grid pitch between zone centres (~2.2 km)
+ZONE_PITCH_DEGREES = 0.02
+
+
+def make_polygon(
+    rng: random.Random,
+    lat: float,
+    lng: float,
+    radius: float,
+    vertices: int
+) -> list[dict]:
+    lobes = rng.randint(3, 7)
+    phase = rng.uniform(0, 2 * math.pi)
+    wobble = rng.uniform(0.05, 0.25)
+
+    polygon = []
+    for k in range(vertices):
+        angle = 2 * math.pi * k / vertices
+        r = radius * (1 + wobble * math.sin(lobes * angle + phase))
+        polygon.append({
+            "lat": round(lat + r * math.sin(angle), 7),
+            "lng": round(lng + r * math.cos(angle), 7),
+        })
+    return polygon
+
+
+def make_city_zones(zone_count: int, vertices: int, seed: int = 42) -> list[IndexedZone]:
+    rng = random.Random(seed)
+    side = math.ceil(math.sqrt(zone_count))
+    origin = side * ZONE_PITCH_DEGREES / 2
+
+    zones = []
+    for n in range(zone_count):
+        row, col = divmod(n, side)
+        lat = CITY_LAT - origin + (row + 0.5) * ZONE_PITCH_DEGREES
+        lng = CITY_LNG - origin + (col + 0.5) * ZONE_PITCH_DEGREES
+
+        radius = ZONE_PITCH_DEGREES * rng.uniform(0.4, 0.55)
+        zones.append(IndexedZone(
+            n + 1,
+            f"Zone {n + 1}",
+            rng.random() < 0.8,
+            make_polygon(rng, lat, lng, radius, vertices)
+        ))
+    return zones
+
+
+def city_bounds(zones: list[IndexedZone]) -> tuple[float, float, float, float]:
+    return (
+        min(z.min_lat for z in zones),
+        max(z.max_lat for z in zones),
+        min(z.min_lng for z in zones),
+        max(z.max_lng for z in zones),
+    )
+
+
+def random_points(
+    rng: random.Random,
+    bounds: tuple[float, float, float, float],
+    count: int
+) -> list[tuple[float, float]]:
+    min_lat, max_lat, min_lng, max_lng = bounds
+    return [
+        (rng.uniform(min_lat, max_lat), rng.uniform(min_lng, max_lng))
+        for _ in range(count)
+    ]